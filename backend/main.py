@@ -1,10 +1,11 @@
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Request
 from starlette.middleware.sessions import SessionMiddleware
 from fastapi.middleware.cors import CORSMiddleware
 from src.core.settings import settings
+from src.core.compression import CompressionMiddleware
 import logging
 from src.config.database import engine
-from src.dependencies.dependencies import get_api_key
+from src.dependencies.dependencies import ETAG_CACHE_CONTROL, get_api_key
 from src.routes.users import router as users_router
 from src.routes.auth import router as auth_router
 from src.routes.semesters import router as semesters_router
@@ -16,6 +17,15 @@ from src.routes.project_users import router as project_users_router
 from src.routes.user_courses import router as user_courses_router
 from src.routes.user_skills import router as user_skills_router
 from src.routes.populate import router as populate_router
+from src.routes.project_preferences import router as project_preferences_router
+from src.routes.teammate_preferences import router as teammate_preferences_router
+from src.routes.matching import router as matching_router
+from src.routes.assignment_snapshots import router as assignment_snapshots_router
+from src.routes.coverage import router as coverage_router
+from src.routes.do_not_pairs import router as do_not_pairs_router
+from src.routes.admin import router as admin_router
+from src.routes.bootstrap import router as bootstrap_router
+from src.routes.reports import router as reports_router
 
 import src.model.user_skill
 from src.config.base import Base
@@ -46,6 +56,12 @@ import src.model.project_skill
 import src.model.project_user
 import src.model.user_course
 import src.model.user_skill
+import src.model.project_preference
+import src.model.teammate_preference
+import src.model.matching_run
+import src.model.assignment_snapshot
+import src.model.assignment_version
+import src.model.do_not_pair
 from src.config.base import Base
 from src.config.database import engine
 
@@ -53,6 +69,21 @@ logger.info("Creating database tables...")
 Base.metadata.create_all(bind=engine)
 logger.info("Database tables created successfully")
 
+from src.config.migrations import add_missing_columns, replace_unique_constraints
+add_missing_columns(engine)
+replace_unique_constraints(engine)
+
+# Load the active semester's snapshot now rather than on the first request that reads it.
+from src.config.database import SessionLocal
+from src.services.semester_snapshot_service import SemesterSnapshotService
+snapshot_db = SessionLocal()
+try:
+    SemesterSnapshotService(snapshot_db).rebuild()
+except Exception as e:
+    logger.error(f"Failed to build the semester snapshot, it will be built on first use: {e}")
+finally:
+    snapshot_db.close()
+
 # Include router
 app.include_router(auth_router)
 app.include_router(users_router, dependencies=[Depends(get_api_key)])
@@ -64,12 +95,39 @@ app.include_router(project_skills_router, dependencies=[Depends(get_api_key)])
 app.include_router(project_users_router, dependencies=[Depends(get_api_key)])
 app.include_router(user_courses_router, dependencies=[Depends(get_api_key)])
 app.include_router(user_skills_router, dependencies=[Depends(get_api_key)])
+app.include_router(project_preferences_router, dependencies=[Depends(get_api_key)])
+app.include_router(teammate_preferences_router, dependencies=[Depends(get_api_key)])
+app.include_router(matching_router, dependencies=[Depends(get_api_key)])
+app.include_router(assignment_snapshots_router, dependencies=[Depends(get_api_key)])
+app.include_router(coverage_router, dependencies=[Depends(get_api_key)])
+app.include_router(do_not_pairs_router, dependencies=[Depends(get_api_key)])
+app.include_router(admin_router, dependencies=[Depends(get_api_key)])
+app.include_router(bootstrap_router, dependencies=[Depends(get_api_key)])
+app.include_router(reports_router, dependencies=[Depends(get_api_key)])
 
 
 # Include populate router only in development mode
 if settings.ENVIRONMENT == "development":
     app.include_router(populate_router, dependencies=[Depends(get_api_key)])
 
+@app.middleware("http")
+async def add_etag_header(request: Request, call_next):
+    """Send the entity tag computed by a route's not_modified dependency with its response."""
+    response = await call_next(request)
+    etag = getattr(request.state, "etag", None)
+    if etag and response.status_code == 200:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = ETAG_CACHE_CONTROL
+    return response
+
+# Added last so it is outermost and compresses every response, with the ETags set above.
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.GZIP_LEVEL,
+    brotli_quality=settings.BROTLI_QUALITY,
+)
+
 @app.get("/api")
 def welcomeToWebGeekBackend():
     logger.info(f"Running in {settings.ENVIRONMENT} mode")
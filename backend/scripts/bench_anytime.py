@@ -0,0 +1,41 @@
+"""Quality-versus-time curve of the anytime matching engine.
+
+Runs the engine once per cohort with the largest budget and reads the
+best-so-far utility off its curve at each checkpoint, to help choose a
+default budget.
+
+Run from the backend folder: python scripts/bench_anytime.py
+"""
+import bisect
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.matching.anytime import run_anytime
+from src.matching.synthetic import generate_cohort
+from src.model.matching import MatchingWeights
+
+COHORTS = [2000, 10000]
+CHECKPOINTS = [0.25, 0.5, 1.0, 2.0, 4.0]
+
+def main():
+    weights = MatchingWeights()
+    print(f"{'students':>8} {'greedy s':>8} {'greedy':>10} " + " ".join(f"{f'@{t:g}s':>14}" for t in CHECKPOINTS))
+    for n_students in COHORTS:
+        problem = generate_cohort(n_students, seed=1)
+        _, curve = run_anytime(problem, weights, time_budget=CHECKPOINTS[-1])
+        times = [seconds for seconds, _ in curve]
+        greedy_seconds, greedy = curve[0]
+        cells = []
+        for checkpoint in CHECKPOINTS:
+            index = bisect.bisect_right(times, checkpoint) - 1
+            if index < 0:
+                cells.append(f"{'-':>14}")
+                continue
+            utility = curve[index][1]
+            cells.append(f"{utility:>8.1f} {100 * (utility - greedy) / greedy:>+4.1f}%")
+        print(f"{n_students:>8} {greedy_seconds:>8.2f} {greedy:>10.1f} " + " ".join(cells))
+
+if __name__ == "__main__":
+    main()
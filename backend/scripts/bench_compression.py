@@ -0,0 +1,74 @@
+"""Benchmark response compression: CPU time against bytes saved on typical payloads.
+
+Run from the backend folder: python scripts/bench_compression.py
+
+Brotli rows are skipped when the optional ``brotli`` package is missing.
+"""
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.compression import Compressor, brotli
+
+# (encoding, level): gzip levels 1-9, brotli qualities 0-11.
+SETTINGS = [("gzip", 1), ("gzip", 6), ("gzip", 9), ("br", 1), ("br", 4), ("br", 6), ("br", 11)]
+REPEATS = 5
+WORDS = (
+    "team project students build web application database api design frontend backend testing deploy "
+    "course semester skills python react machine learning data analysis security mobile cloud sprint "
+    "client requirements prototype research interface users performance documentation review"
+).split()
+
+def sentence(rng, n_words):
+    return " ".join(rng.choice(WORDS) for _ in range(n_words)).capitalize() + "."
+
+def envelope(data):
+    # Rendered as JSONResponse does.
+    return json.dumps({"success": True, "data": data, "error": None}, ensure_ascii=False, separators=(",", ":")).encode()
+
+def payloads(rng):
+    stamp = "2026-09-01T12:00:00"
+    projects = [
+        {"id": i, "course_id": 1 + i % 4, "title": sentence(rng, 4), "description": " ".join(sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(3, 8))),
+         "maxCapacity": rng.randint(3, 6), "teamName": f"Team {i}", "created_at": stamp, "updated_at": stamp}
+        for i in range(1, 101)
+    ]
+    users = [
+        {"id": i, "username": f"student{i}", "edupersonprimaryaffiliation": "student", "uupid": f"{rng.getrandbits(40):x}",
+         "edupersonprincipalname": f"student{i}@vt.edu", "created_at": stamp, "updated_at": stamp}
+        for i in range(1, 101)
+    ]
+    export = "user_id,username,project_id,project_title,course,skills\n" + "".join(
+        f"{i},student{i},{1 + i % 100},{projects[i % 100]['title']},CS {4704 + i % 4},{';'.join(rng.sample(WORDS, 3))}\n"
+        for i in range(1, 5001)
+    )
+    return [
+        ("count", envelope({"total_users": 4812})),
+        ("100 users", envelope(users)),
+        ("100 projects", envelope(projects)),
+        ("5000-row CSV", export.encode()),
+    ]
+
+def main():
+    rng = random.Random(0)
+    print(f"{'payload':>13} {'bytes':>8} {'coding':>8} {'out':>8} {'ratio':>6} {'ms':>8} {'MB/s':>7}")
+    for name, body in payloads(rng):
+        for encoding, level in SETTINGS:
+            if encoding == "br" and brotli is None:
+                continue
+            times = []
+            for _ in range(REPEATS):
+                compressor = Compressor(encoding, gzip_level=level, brotli_quality=level)
+                started = time.perf_counter()
+                out = compressor.compress(body, final=True)
+                times.append(time.perf_counter() - started)
+            best = min(times)
+            print(f"{name:>13} {len(body):>8} {encoding + ' ' + str(level):>8} {len(out):>8} {len(body) / len(out):>6.1f} "
+                  f"{best * 1000:>8.3f} {len(body) / best / 1e6:>7.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Benchmark the bitset team skill-coverage check.
+
+Run from the backend folder: python scripts/bench_coverage.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from src.matching.bitsets import build_bitsets, missing_team_skills, popcount, to_indices
+
+# (teams, students, skills)
+SIZES = [(50, 200, 40), (200, 900, 64), (200, 900, 256), (1000, 4500, 256)]
+REPEATS = 20
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'teams':>6} {'students':>8} {'skills':>6} {'check ms':>9} {'with decode ms':>14}")
+    for n_teams, n_students, n_skills in SIZES:
+        user_bits = build_bitsets(rng.integers(0, n_students, 5 * n_students), rng.integers(0, n_skills, 5 * n_students), n_students, n_skills)
+        required = build_bitsets(rng.integers(0, n_teams, 4 * n_teams), rng.integers(0, n_skills, 4 * n_teams), n_teams, n_skills)
+        teams = rng.integers(0, n_teams, n_students)
+
+        check, full = [], []
+        for _ in range(REPEATS):
+            started = time.perf_counter()
+            missing = missing_team_skills(required, user_bits, teams)
+            popcount(missing)
+            checked = time.perf_counter()
+            to_indices(missing)
+            done = time.perf_counter()
+            check.append(checked - started)
+            full.append(done - started)
+        print(f"{n_teams:>6} {n_students:>8} {n_skills:>6} {min(check) * 1000:>9.3f} {min(full) * 1000:>14.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Benchmark parallel per-course matching for a semester.
+
+Solves a synthetic semester of independent courses serially and across
+process pools of increasing size, reporting wall time and the slowest
+course. Pool start-up is included, since a request pays for it too, and
+the in-process threshold is disabled so every row really uses a pool.
+
+Run from the backend folder: python scripts/bench_semester.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.matching.parallel import solve_courses
+from src.matching.synthetic import generate_cohort
+from src.model.matching import MatchingWeights
+
+# Course sizes of one synthetic semester.
+COURSES = [10000, 8000, 6000, 4000, 3000, 2000, 1000, 500]
+
+def main():
+    weights = MatchingWeights()
+    problems = [generate_cohort(n, seed=i) for i, n in enumerate(COURSES)]
+    cpus = os.cpu_count() or 1
+    print(f"{len(COURSES)} courses, {sum(COURSES)} students, {cpus} CPUs")
+    print(f"{'workers':>7} {'wall ms':>9} {'sum of course ms':>16} {'slowest course ms':>17} {'speedup':>7}")
+    baseline = None
+    for workers in sorted({1, 2, 4, cpus}):
+        started = time.perf_counter()
+        solves = solve_courses(problems, weights, max_workers=workers, min_cells=0)
+        wall = time.perf_counter() - started
+        baseline = baseline or wall
+        print(f"{workers:>7} {wall * 1000:>9.1f} {sum(s.seconds for s in solves) * 1000:>16.1f} "
+              f"{max(s.seconds for s in solves) * 1000:>17.1f} {baseline / wall:>6.2f}x")
+
+if __name__ == "__main__":
+    main()
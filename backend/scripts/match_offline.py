@@ -0,0 +1,128 @@
+"""Run the matcher offline against a course exported from the database.
+
+    # Export a course's students, skills, projects, capacities and preferences
+    python scripts/match_offline.py export 12 course-12.npz
+
+    # Match, balance and designate project managers on the export, with timings
+    python scripts/match_offline.py run course-12.npz assignment-12.json --balance-ms 2000
+
+    # Load the result through the bulk import endpoint
+    curl -X POST http://localhost:8000/api/matching/courses/12/assignments/import \\
+        -H "X-API-Key: $API_KEY" -H "Content-Type: application/json" -d @assignment-12.json
+
+Run from the backend folder. ``export`` reads the database configured for
+the current ENVIRONMENT; ``run`` needs no database.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.matching.archive import assignment_import, load_problem, save_problem
+from src.matching.balance import balance_assignment
+from src.matching.metrics import assignment_quality, skill_coverage
+from src.matching.roles import designate_managers
+from src.matching.solver import ENGINES, run_matching
+from src.model.matching import BalancePenalties, MatchingWeights
+
+def export(args):
+    from src.config.database import SessionLocal
+    from src.matching.loader import load_course_problem
+    # Relationships resolve by class name, so every mapped model must be imported.
+    import src.model.semester, src.model.course, src.model.user, src.model.skill  # noqa: F401
+    import src.model.project, src.model.project_skill, src.model.project_user  # noqa: F401
+    import src.model.user_course, src.model.user_skill  # noqa: F401
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        problem = load_course_problem(db, args.course_id)
+        loaded = time.perf_counter()
+        save_problem(args.out, problem)
+        saved = time.perf_counter()
+    finally:
+        db.close()
+    print(f"course {args.course_id}: {problem.n_students} students, {problem.n_projects} projects, "
+          f"{problem.n_skills} skills, {problem.teammate_pairs.shape[0]} teammate requests, "
+          f"{problem.conflict_pairs.shape[0]} do-not-pair constraints")
+    print(f"load {1000 * (loaded - started):.1f} ms, write {1000 * (saved - loaded):.1f} ms "
+          f"-> {args.out} ({os.path.getsize(args.out) / 1024:.1f} KiB)")
+
+def run(args):
+    timings = []
+
+    def step(name, started):
+        timings.append((name, 1000 * (time.perf_counter() - started)))
+
+    started = time.perf_counter()
+    problem = load_problem(args.snapshot)
+    step("load snapshot", started)
+    print(f"course {problem.course_id}: {problem.n_students} students, {problem.n_projects} projects, {problem.n_skills} skills")
+
+    weights = MatchingWeights(skill=args.skill, preference=args.preference, teammate=args.teammate)
+    result = run_matching(problem, weights, group_teammates=not args.no_group, engine=args.engine)
+    timings.append(("grouping", 1000 * result.grouping_seconds))
+    timings.append(("scoring", 1000 * result.scoring_seconds))
+    timings.append(("solve", 1000 * result.solve_seconds))
+    assignment = result.assignment
+
+    if args.balance_ms:
+        started = time.perf_counter()
+        balanced = balance_assignment(problem, weights, assignment, BalancePenalties(), time_budget=args.balance_ms / 1000, seed=args.seed)
+        step("balance", started)
+        print(f"balance: {balanced.n_moves} moves, {balanced.n_swaps} swaps, "
+              f"objective {balanced.objective_before:.2f} -> {balanced.objective_after:.2f}")
+        assignment = balanced.assignment
+
+    started = time.perf_counter()
+    managers = designate_managers(problem, assignment)
+    step("project managers", started)
+
+    started = time.perf_counter()
+    quality = assignment_quality(problem, weights, assignment)
+    coverage = skill_coverage(problem, assignment)
+    step("metrics", started)
+
+    started = time.perf_counter()
+    body = assignment_import(problem, assignment, managers, label=args.label)
+    with open(args.out, "w") as f:
+        f.write(body.model_dump_json())
+    step("write assignment", started)
+
+    first, second, third, unranked, unassigned = quality.rank_counts.tolist()
+    print(f"ranks 1/2/3/unranked/unassigned: {first}/{second}/{third}/{unranked}/{unassigned}, "
+          f"top choice {quality.top_choice_rate:.1%}, utility gini {quality.utility_gini:.3f}, "
+          f"skill coverage {coverage:.1%}, unmet teammate requests {quality.unmet_teammate_pairs}")
+    for name, ms in timings:
+        print(f"{name:>18} {ms:9.1f} ms")
+    print(f"{'total':>18} {sum(ms for _, ms in timings):9.1f} ms -> {args.out}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="export a course's matching inputs to an .npz snapshot")
+    export_parser.add_argument("course_id", type=int)
+    export_parser.add_argument("out", help="snapshot path, e.g. course-12.npz")
+    export_parser.set_defaults(func=export)
+
+    run_parser = commands.add_parser("run", help="match a snapshot and write an importable assignment")
+    run_parser.add_argument("snapshot")
+    run_parser.add_argument("out", help="assignment JSON path")
+    run_parser.add_argument("--engine", default="utility", choices=sorted(ENGINES))
+    run_parser.add_argument("--skill", type=float, default=1.0)
+    run_parser.add_argument("--preference", type=float, default=1.0)
+    run_parser.add_argument("--teammate", type=float, default=1.0)
+    run_parser.add_argument("--no-group", action="store_true", help="do not pre-cluster mutual teammate requests")
+    run_parser.add_argument("--balance-ms", type=int, default=0, help="time budget for the local-search balancer")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--label", default=None, help="label of the snapshot created on import")
+    run_parser.set_defaults(func=run)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from src.config.base import Base
+from typing import List
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Columns added to tables that already existed; create_all never alters an existing table.
+# (table, column, column definition), applied in order.
+ADDED_COLUMNS = [
+    ("project_users", "is_project_manager", "BOOLEAN NOT NULL DEFAULT 0"),
+]
+
+# Unique constraints replaced on tables that already existed: (table, old name, new name, new columns).
+REPLACED_UNIQUE_CONSTRAINTS = [
+    ("project_preferences", "uq_project_preference_user_rank", "uq_project_preference_user_project", ("user_id", "project_id")),
+]
+
+def _has_column(engine: Engine, table: str, column: str) -> bool:
+    return column in {c["name"] for c in inspect(engine).get_columns(table)}
+
+def add_missing_columns(engine: Engine) -> List[str]:
+    """Add the ``ADDED_COLUMNS`` an existing database lacks.
+
+    Safe to run on every startup: present columns and missing tables are
+    skipped, and a column added meanwhile by another process is not an error.
+
+    Returns:
+        List[str]: The ``table.column`` names that were added.
+    """
+    tables = set(inspect(engine).get_table_names())
+    added = []
+    for table, column, definition in ADDED_COLUMNS:
+        if table not in tables or _has_column(engine, table, column):
+            continue
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}"))
+        except DBAPIError:
+            if not _has_column(engine, table, column):
+                raise
+            continue
+        logger.info(f"Added column {table}.{column}")
+        added.append(f"{table}.{column}")
+    return added
+
+def replace_unique_constraints(engine: Engine) -> List[str]:
+    """Swap the ``REPLACED_UNIQUE_CONSTRAINTS`` an existing database still has.
+
+    Rows that would break the new constraint are dropped first, keeping the
+    oldest. SQLite cannot drop a constraint, so there the table is rebuilt
+    from its model and the rows copied over. Safe to run on every startup.
+
+    Returns:
+        List[str]: The names of the constraints that were added.
+    """
+    replaced = []
+    for table, old_name, new_name, columns in REPLACED_UNIQUE_CONSTRAINTS:
+        inspector = inspect(engine)
+        if table not in inspector.get_table_names():
+            continue
+        if old_name not in {c["name"] for c in inspector.get_unique_constraints(table)}:
+            continue
+        column_list = ", ".join(columns)
+        copied = ", ".join(c["name"] for c in inspector.get_columns(table))
+        indexes = [index["name"] for index in inspector.get_indexes(table)]
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"DELETE FROM {table} WHERE id NOT IN "
+                f"(SELECT id FROM (SELECT MIN(id) AS id FROM {table} GROUP BY {column_list}) AS keep)"
+            ))
+            if engine.dialect.name == "sqlite":
+                for index in indexes:
+                    conn.execute(text(f"DROP INDEX {index}"))
+                conn.execute(text(f"ALTER TABLE {table} RENAME TO {table}_old"))
+                Base.metadata.tables[table].create(conn)
+                conn.execute(text(f"INSERT INTO {table} ({copied}) SELECT {copied} FROM {table}_old"))
+                conn.execute(text(f"DROP TABLE {table}_old"))
+            else:
+                drop = "DROP INDEX" if engine.dialect.name == "mysql" else "DROP CONSTRAINT"
+                conn.execute(text(f"ALTER TABLE {table} {drop} {old_name}"))
+                conn.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {new_name} UNIQUE ({column_list})"))
+        logger.info(f"Replaced unique constraint {old_name} on {table} with {new_name}")
+        replaced.append(new_name)
+    return replaced
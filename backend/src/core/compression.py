@@ -0,0 +1,154 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Dict, Optional
+import anyio.to_thread
+import zlib
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; without it responses are gzip-encoded only.
+    brotli = None
+
+# Content types that are already compressed, or streamed to clients that expect each event at once.
+SKIPPED_CONTENT_TYPES = (
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "application/octet-stream",
+    "text/event-stream",
+    "image/",
+    "audio/",
+    "video/",
+    "font/woff",
+)
+# Chunks at least this large are compressed in a worker thread instead of on the event loop.
+THREAD_MINIMUM_SIZE = 256 * 1024
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    """Quality value of each coding listed in an Accept-Encoding header."""
+    accepted = {}
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+    return accepted
+
+def choose_encoding(header: str) -> Optional[str]:
+    """Best coding this server can produce for an Accept-Encoding header, brotli first on ties."""
+    accepted = accepted_encodings(header)
+    offered = ["br", "gzip"] if brotli is not None else ["gzip"]
+    quality = {coding: accepted.get(coding, accepted.get("*", 0.0)) for coding in offered}
+    best = max(offered, key=lambda coding: quality[coding])
+    return best if quality[best] > 0 else None
+
+class Compressor:
+    """Incremental gzip or brotli encoder for one response body."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, body: bytes, final: bool) -> bytes:
+        """Encode the next chunk; non-final chunks are flushed so streamed rows reach the client."""
+        if self.encoding == "br":
+            data = self._brotli.process(body)
+            return data + (self._brotli.finish() if final else self._brotli.flush())
+        data = self._gzip.compress(body)
+        return data + self._gzip.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+class CompressionMiddleware:
+    """Compress responses with brotli or gzip, as negotiated through Accept-Encoding.
+
+    Responses below ``minimum_size`` bytes, responses that already carry a
+    Content-Encoding, partial and bodiless responses, and the content types
+    in ``SKIPPED_CONTENT_TYPES`` are passed through unchanged. Streaming
+    responses are compressed chunk by chunk. A strong ETag becomes weak on a
+    compressed response, since the bytes differ from the uncompressed ones.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        compressor = Compressor(encoding, self.gzip_level, self.brotli_quality) if encoding else None
+        responder = _CompressionResponder(send, compressor, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+class _CompressionResponder:
+    """Rewrites one response's messages.
+
+    Body chunks are held back until ``minimum_size`` bytes or the end of the
+    body have arrived, so a small response split into chunks, as by
+    ``BaseHTTPMiddleware``, is still sent as is.
+    """
+
+    def __init__(self, send: Send, compressor: Optional[Compressor], minimum_size: int):
+        self._send = send
+        self.compressor = compressor
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.held = b""
+        self.compressing: Optional[bool] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            if self._skipped(message):
+                self.compressing = False
+                await self._send(message)
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressing is None:
+            self.held += body
+            if more_body and len(self.held) < self.minimum_size:
+                return
+            body, self.held = self.held, b""
+            self.compressing = self.compressor is not None and len(body) >= self.minimum_size
+            headers = MutableHeaders(raw=self.start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if self.compressing:
+                headers["Content-Encoding"] = self.compressor.encoding
+                del headers["Content-Length"]
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+            await self._send(self.start)
+        if self.compressing:
+            body = await self._compress(body, not more_body)
+        await self._send({**message, "body": body})
+
+    async def _compress(self, body: bytes, final: bool) -> bytes:
+        if len(body) >= THREAD_MINIMUM_SIZE:
+            return await anyio.to_thread.run_sync(self.compressor.compress, body, final)
+        return self.compressor.compress(body, final)
+
+    @staticmethod
+    def _skipped(start: Message) -> bool:
+        headers = Headers(raw=start["headers"])
+        if start["status"] in (204, 206, 304) or "content-encoding" in headers:
+            return True
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(SKIPPED_CONTENT_TYPES)
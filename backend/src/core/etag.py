@@ -0,0 +1,55 @@
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from src.core.compression import choose_encoding
+from typing import Any, Dict, Optional
+import hashlib
+
+# Sent with every tagged response and its 304s: the tag's form depends on Accept-Encoding.
+ETAG_VARY = "Accept-Encoding"
+
+def make_etag(body: bytes) -> str:
+    """Strong entity tag of a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+def request_etag(request: Request, etag: str) -> str:
+    """The tag as sent to this client, on the 200 and on a 304 alike.
+
+    It is weak whenever the client accepts an encoding the compression
+    middleware can produce, since a compressed body's bytes differ from the
+    tagged ones; the middleware leaves weak tags as they are.
+    """
+    if choose_encoding(request.headers.get("accept-encoding", "")) and not etag.startswith("W/"):
+        return f"W/{etag}"
+    return etag
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's ``If-None-Match`` header lists ``etag`` or ``*``, compared weakly."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+def not_modified_response(etag: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    """An empty 304 carrying the same validator and Vary header as the 200 it stands for."""
+    headers = dict(headers or {})
+    headers["Vary"] = f"{headers['Vary']}, {ETAG_VARY}" if "Vary" in headers else ETAG_VARY
+    return Response(status_code=304, headers={**headers, "ETag": etag})
+
+def etag_response(request: Request, content: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    """A 200 JSON response tagged with the hash of its body, or 304 if the client already has it.
+
+    Args:
+        request (Request): The current request, for its ``If-None-Match`` header.
+        content (Any): JSON-serializable response content.
+        headers (Optional[Dict[str, str]]): Extra headers, e.g. ``Cache-Control``, sent on both outcomes.
+
+    Returns:
+        Response: The JSON response, or an empty 304 Not Modified.
+    """
+    response = JSONResponse(status_code=200, content=content, headers=headers)
+    etag = request_etag(request, make_etag(response.body))
+    if etag_matches(request, etag):
+        return not_modified_response(etag, headers)
+    response.headers["ETag"] = etag
+    return response
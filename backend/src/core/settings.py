@@ -10,6 +10,10 @@ class Settings(BaseSettings):
     DEBUG: bool = os.getenv("DEBUG", "True").lower() == "true"
     API_KEY: str = os.getenv("API_KEY", "apikey")
     SECRET_KEY: str = os.getenv("SECRET_KEY", "secretkey")
+    # Responses smaller than this many bytes are sent uncompressed.
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+    GZIP_LEVEL: int = int(os.getenv("GZIP_LEVEL", "6"))
+    BROTLI_QUALITY: int = int(os.getenv("BROTLI_QUALITY", "4"))
 
     @property
     def database_url(self):
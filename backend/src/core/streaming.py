@@ -0,0 +1,51 @@
+from pydantic import BaseModel
+from sqlalchemy.orm import Query, Session
+from typing import Iterator, List, Type
+import json
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip from the server-side cursor, and serialized per streamed chunk.
+STREAM_BATCH_SIZE = 500
+
+def _dumps(items: List[dict]) -> str:
+    # Rendered as JSONResponse does, so streamed and paged lists are byte-compatible.
+    return json.dumps(items, ensure_ascii=False, allow_nan=False, separators=(",", ":"))[1:-1]
+
+def stream_envelope(db: Session, query: Query, model: Type[BaseModel], name: str) -> Iterator[bytes]:
+    """Stream a query's rows as the ``{"success", "data", "error"}`` envelope, ``data`` being a JSON array.
+
+    Rows are read through a server-side cursor and validated and serialized
+    ``STREAM_BATCH_SIZE`` at a time, so memory does not grow with the table.
+    The generator runs after the route has returned, so it closes the
+    session itself when the stream ends.
+
+    Args:
+        db (Session): Session the query is bound to.
+        query (Query): Rows to stream, in a stable order.
+        model (Type[BaseModel]): Response model each row is validated into.
+        name (str): What is streamed, for the log line.
+
+    Returns:
+        Iterator[bytes]: Encoded chunks of one JSON document.
+    """
+    started = time.perf_counter()
+    n_rows = 0
+    try:
+        yield b'{"success":true,"data":['
+        batch = []
+        for row in query.yield_per(STREAM_BATCH_SIZE):
+            batch.append(model.model_validate(row).model_dump(mode="json"))
+            if len(batch) == STREAM_BATCH_SIZE:
+                yield (("," if n_rows else "") + _dumps(batch)).encode()
+                n_rows += len(batch)
+                batch = []
+        if batch:
+            yield (("," if n_rows else "") + _dumps(batch)).encode()
+            n_rows += len(batch)
+        yield b'],"error":null}'
+    finally:
+        db.close()
+        logger.info(f"Streamed {n_rows} {name} in {(time.perf_counter() - started) * 1000:.1f} ms")
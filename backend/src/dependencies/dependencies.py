@@ -1,8 +1,9 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import APIKeyHeader
 from sqlalchemy.orm import Session
 from src.core.settings import settings
 from src.config.database import get_db
+from src.core.etag import ETAG_VARY, etag_matches, request_etag
 from src.services.user_service import UserService
 from src.services.semester_service import SemesterService
 from src.services.course_service import CourseService
@@ -12,6 +13,17 @@ from src.services.project_skill_service import ProjectSkillService
 from src.services.project_user_service import ProjectUserService
 from src.services.user_course_service import UserCourseService
 from src.services.user_skill_service import UserSkillService
+from src.services.project_preference_service import ProjectPreferenceService
+from src.services.teammate_preference_service import TeammatePreferenceService
+from src.services.matching_service import MatchingService
+from src.services.assignment_snapshot_service import AssignmentSnapshotService
+from src.services.coverage_service import CoverageService
+from src.services.do_not_pair_service import DoNotPairService
+from src.services.recommendation_service import RecommendationService
+from src.services.admin_service import AdminService
+from src.services.bootstrap_service import BootstrapService
+from src.services.etag_service import EtagService
+from src.services.report_service import ReportService
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
@@ -24,6 +36,27 @@ async def get_api_key(api_key: str = Depends(api_key_header)):
         )
     return api_key
 
+# Sent with tagged responses so browsers store them but revalidate before each reuse.
+ETAG_CACHE_CONTROL = "no-cache"
+
+def not_modified(*tables: str):
+    """Route dependency answering conditional GETs for a response built only from ``tables``.
+
+    The tag is computed before the route runs; when it matches the request's
+    If-None-Match header the route is skipped and the client gets 304 Not
+    Modified. Otherwise the tag is left on ``request.state.etag`` for the
+    middleware to send with the response.
+    """
+    def check(request: Request, db: Session = Depends(get_db)) -> None:
+        etag = request_etag(request, EtagService(db).table_etag(tables, f"{request.url.path}?{request.url.query}"))
+        if etag_matches(request, etag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL, "Vary": ETAG_VARY},
+            )
+        request.state.etag = etag
+    return Depends(check)
+
 def get_user_service(db: Session = Depends(get_db)) -> UserService:
     """Dependency to get UserService instance."""
     return UserService(db)
@@ -53,4 +86,34 @@ def get_user_course_service(db: Session = Depends(get_db)) -> UserCourseService:
     return UserCourseService(db)
 
 def get_user_skill_service(db: Session = Depends(get_db)) -> UserSkillService:
-    return UserSkillService(db)
\ No newline at end of file
+    return UserSkillService(db)
+
+def get_project_preference_service(db: Session = Depends(get_db)) -> ProjectPreferenceService:
+    return ProjectPreferenceService(db)
+
+def get_teammate_preference_service(db: Session = Depends(get_db)) -> TeammatePreferenceService:
+    return TeammatePreferenceService(db)
+
+def get_matching_service(db: Session = Depends(get_db)) -> MatchingService:
+    return MatchingService(db)
+
+def get_assignment_snapshot_service(db: Session = Depends(get_db)) -> AssignmentSnapshotService:
+    return AssignmentSnapshotService(db)
+
+def get_coverage_service(db: Session = Depends(get_db)) -> CoverageService:
+    return CoverageService(db)
+
+def get_do_not_pair_service(db: Session = Depends(get_db)) -> DoNotPairService:
+    return DoNotPairService(db)
+
+def get_recommendation_service(db: Session = Depends(get_db)) -> RecommendationService:
+    return RecommendationService(db)
+
+def get_admin_service(db: Session = Depends(get_db)) -> AdminService:
+    return AdminService(db)
+
+def get_bootstrap_service(db: Session = Depends(get_db)) -> BootstrapService:
+    return BootstrapService(db)
+
+def get_report_service(db: Session = Depends(get_db)) -> ReportService:
+    return ReportService(db)
\ No newline at end of file
@@ -0,0 +1,67 @@
+from typing import List, Tuple
+from src.matching.balance import balance_assignment
+from src.matching.problem import MatchingProblem, MatchingResult
+from src.matching.scoring import skill_scores, utility_matrix
+from src.matching.solver import run_matching
+from src.model.matching import BalancePenalties, MatchingWeights
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+ANYTIME_ENGINE = "anytime"
+
+# Pure utility objective: the local search without any skill-balance terms.
+NO_PENALTIES = BalancePenalties(missing_skill=0.0, single_holder=0.0, spread=0.0)
+
+def run_anytime(
+    problem: MatchingProblem,
+    weights: MatchingWeights,
+    time_budget: float,
+    group_teammates: bool = True,
+    seed: int = 0,
+) -> Tuple[MatchingResult, List[Tuple[float, float]]]:
+    """Best assignment found within ``time_budget`` seconds of wall-clock time.
+
+    Starts from the greedy utility engine and spends the rest of the budget
+    on move/swap local search over the same objective, stopping early only
+    at a local optimum. Students of a teammate group may be separated when
+    that raises total utility.
+
+    Returns:
+        Tuple[MatchingResult, List[Tuple[float, float]]]: The best-so-far
+        result and its quality curve as (seconds since start, utility).
+    """
+    started = time.perf_counter()
+    skill = skill_scores(problem)
+    greedy = run_matching(problem, weights, group_teammates=group_teammates, skill=skill)
+    utility = utility_matrix(problem, weights, skill)
+    offset = time.perf_counter() - started
+    curve = [(offset, greedy.utility)]
+
+    remaining = time_budget - offset
+    assignment, value = greedy.assignment, greedy.utility
+    search_seconds = 0.0
+    if remaining > 0 and problem.n_students:
+        search = balance_assignment(
+            problem, weights, greedy.assignment, NO_PENALTIES,
+            time_budget=remaining, patience=50 * problem.n_students, seed=seed, utility=utility,
+        )
+        curve.extend((offset + seconds, objective) for seconds, objective in search.trace[1:])
+        assignment, value = search.assignment, search.objective_after
+        search_seconds = search.elapsed_seconds
+
+    result = MatchingResult(
+        assignment=assignment,
+        utility=value,
+        engine=ANYTIME_ENGINE,
+        n_units=greedy.n_units,
+        grouping_seconds=greedy.grouping_seconds,
+        scoring_seconds=greedy.scoring_seconds,
+        solve_seconds=greedy.solve_seconds + search_seconds,
+    )
+    logger.info(
+        f"Anytime matching reached utility {value:.3f} from greedy {greedy.utility:.3f} "
+        f"in {(time.perf_counter() - started) * 1000:.1f} ms of a {time_budget * 1000:.0f} ms budget"
+    )
+    return result, curve
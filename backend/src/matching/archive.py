@@ -0,0 +1,68 @@
+from typing import Optional
+from src.matching.problem import MatchingProblem, no_pairs
+from src.model.matching import AssignmentImportRequest, MatchingAssignment
+import numpy as np
+
+# Bumped when the arrays stored in a problem archive change.
+ARCHIVE_VERSION = 2
+# Version 1 archives predate do-not-pair constraints and load without any.
+SUPPORTED_ARCHIVE_VERSIONS = (1, 2)
+
+def save_problem(path: str, problem: MatchingProblem) -> None:
+    """Write a matching problem to a compressed ``.npz`` archive.
+
+    Boolean matrices are stored bit-packed along the skill axis.
+    """
+    np.savez_compressed(
+        path,
+        archive_version=np.int32(ARCHIVE_VERSION),
+        course_id=np.int64(problem.course_id if problem.course_id is not None else -1),
+        user_ids=problem.user_ids,
+        project_ids=problem.project_ids,
+        skill_ids=problem.skill_ids,
+        user_skills=np.packbits(problem.user_skills, axis=1),
+        project_skills=np.packbits(problem.project_skills, axis=1),
+        capacities=problem.capacities,
+        preference_ranks=problem.preference_ranks,
+        teammate_pairs=problem.teammate_pairs,
+        conflict_pairs=problem.conflict_pairs,
+    )
+
+def load_problem(path: str) -> MatchingProblem:
+    """Read a matching problem written by :func:`save_problem`.
+
+    Raises:
+        ValueError: If the archive was written by an incompatible version.
+    """
+    with np.load(path) as archive:
+        version = int(archive["archive_version"])
+        if version not in SUPPORTED_ARCHIVE_VERSIONS:
+            raise ValueError(f"Unsupported problem archive version {version}")
+        n_skills = archive["skill_ids"].shape[0]
+        course_id = int(archive["course_id"])
+        return MatchingProblem(
+            course_id=course_id if course_id >= 0 else None,
+            user_ids=archive["user_ids"],
+            project_ids=archive["project_ids"],
+            skill_ids=archive["skill_ids"],
+            user_skills=np.unpackbits(archive["user_skills"], axis=1, count=n_skills).astype(bool),
+            project_skills=np.unpackbits(archive["project_skills"], axis=1, count=n_skills).astype(bool),
+            capacities=archive["capacities"],
+            preference_ranks=archive["preference_ranks"],
+            teammate_pairs=archive["teammate_pairs"],
+            conflict_pairs=archive["conflict_pairs"] if version >= 2 else no_pairs(),
+        )
+
+def assignment_import(problem: MatchingProblem, assignment: np.ndarray, managers: Optional[np.ndarray] = None, label: Optional[str] = None) -> AssignmentImportRequest:
+    """Body for the assignment import endpoint describing ``assignment`` by user and project ID."""
+    is_manager = np.zeros(problem.n_students, dtype=bool)
+    if managers is not None:
+        is_manager[managers[managers >= 0]] = True
+    project_ids = problem.project_ids.tolist()
+    return AssignmentImportRequest(
+        label=label,
+        assignments=[
+            MatchingAssignment(user_id=user_id, project_id=project_ids[project] if project >= 0 else None, is_project_manager=manager)
+            for user_id, project, manager in zip(problem.user_ids.tolist(), assignment.tolist(), is_manager.tolist())
+        ],
+    )
@@ -0,0 +1,250 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from src.matching.problem import MatchingProblem
+from src.matching.conflicts import conflict_lists
+from src.matching.metrics import team_skill_counts
+from src.matching.scoring import utility_matrix, total_utility
+from src.matching.units import ranked_candidates
+from src.model.matching import MatchingWeights, BalancePenalties
+import numpy as np
+import random
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Projects near the top of a student's utility list tried as move targets.
+BALANCE_CANDIDATES = 8
+# Iterations between clock reads.
+CLOCK_INTERVAL = 256
+
+@dataclass
+class BalanceResult:
+    """Outcome of a balancing pass; ``trace`` holds (seconds, objective) after each improvement."""
+    assignment: np.ndarray
+    objective_before: float
+    objective_after: float
+    n_evaluated: int
+    n_moves: int
+    n_swaps: int
+    elapsed_seconds: float
+    trace: List[Tuple[float, float]] = field(default_factory=list)
+
+def balance_penalty(problem: MatchingProblem, penalties: BalancePenalties, assignment: np.ndarray) -> float:
+    """Skill-balance penalty of an assignment, recomputed from scratch.
+
+    Staffed teams pay for each required skill nobody holds and each one held
+    by a single member; every team pays ``spread`` times the sum of squared
+    skill counts, which is smallest when skills are spread evenly.
+    """
+    counts = team_skill_counts(problem, assignment)
+    staffed = np.bincount(assignment[assignment >= 0], minlength=problem.n_projects) > 0
+    required = problem.project_skills
+    gaps = (
+        penalties.missing_skill * (required & (counts == 0)).sum(axis=1)
+        + penalties.single_holder * (required & (counts == 1)).sum(axis=1)
+    )
+    spread = float((counts.astype(np.int64) ** 2).sum())
+    return float(gaps[staffed].sum()) + penalties.spread * spread
+
+def balance_objective(problem: MatchingProblem, weights: MatchingWeights, penalties: BalancePenalties, assignment: np.ndarray, utility: Optional[np.ndarray] = None) -> float:
+    """Matching utility minus the skill-balance penalty."""
+    return total_utility(problem, weights, assignment, utility) - balance_penalty(problem, penalties, assignment)
+
+def balance_assignment(
+    problem: MatchingProblem,
+    weights: MatchingWeights,
+    assignment: np.ndarray,
+    penalties: Optional[BalancePenalties] = None,
+    time_budget: float = 0.5,
+    patience: Optional[int] = None,
+    seed: int = 0,
+    utility: Optional[np.ndarray] = None,
+) -> BalanceResult:
+    """Improve an assignment by single-student moves and pairwise swaps.
+
+    Each team keeps a skill count vector, so a candidate is scored from the
+    counts of the moved students' own skills only: the cost of a move does
+    not depend on team size. Moves go to a project with spare capacity;
+    otherwise the student swaps with a random member of the target team.
+    Only strictly improving candidates are applied, and never one that
+    would put a do-not-pair constraint on one team.
+
+    Args:
+        problem (MatchingProblem): The course's matching inputs.
+        weights (MatchingWeights): Weights of the utility terms.
+        assignment (np.ndarray): Starting project index per student, -1 if unassigned.
+        penalties (Optional[BalancePenalties]): Weights of the balance terms.
+        time_budget (float): Wall-clock limit in seconds.
+        patience (Optional[int]): Stop after this many candidates in a row fail to improve.
+        seed (int): Seed for candidate sampling.
+        utility (Optional[np.ndarray]): Precomputed :func:`utility_matrix` for ``weights``.
+
+    Returns:
+        BalanceResult: The improved assignment and its improvement trace.
+    """
+    started = time.perf_counter()
+    penalties = penalties or BalancePenalties()
+    n, m = problem.n_students, problem.n_projects
+    assignment = np.asarray(assignment, dtype=np.int64).copy()
+    if utility is None:
+        utility = utility_matrix(problem, weights)
+    objective = balance_objective(problem, weights, penalties, assignment, utility)
+    result = BalanceResult(assignment, objective, objective, 0, 0, 0, 0.0, [(0.0, objective)])
+    if n == 0 or m == 0:
+        return result
+
+    missing, single, spread = penalties.missing_skill, penalties.single_holder, penalties.spread
+    teammate = weights.teammate
+    skills = [np.flatnonzero(row).tolist() for row in problem.user_skills]
+    skill_sets = [frozenset(row) for row in skills]
+    required = problem.project_skills.tolist()
+    counts = team_skill_counts(problem, assignment).tolist()
+    capacities = problem.capacities.tolist()
+    candidates = ranked_candidates(utility, BALANCE_CANDIDATES).tolist()
+    # Directed requests in both directions, so a mutual pair counts twice as in the objective.
+    partners: List[List[int]] = [[] for _ in range(n)]
+    for a, b in problem.teammate_pairs.tolist():
+        partners[a].append(b)
+        partners[b].append(a)
+    rivals = conflict_lists(problem.conflict_pairs, n)
+
+    place = assignment.tolist()
+    members: List[List[int]] = [[] for _ in range(m)]
+    slot = [-1] * n
+    for i, p in enumerate(place):
+        if p >= 0:
+            slot[i] = len(members[p])
+            members[p].append(i)
+
+    def cell(c: int) -> float:
+        return missing if c == 0 else single if c == 1 else 0.0
+
+    gap = [
+        sum(cell(c) for c, r in zip(counts[p], required[p]) if r)
+        for p in range(m)
+    ]
+
+    def team_delta(p: int, changes: List[Tuple[int, int]], size_after: int) -> Tuple[float, float]:
+        """Penalty change of team ``p`` under per-skill count changes, and its new gap term."""
+        row, req = counts[p], required[p]
+        new_gap, squares = gap[p], 0
+        for k, d in changes:
+            c = row[k]
+            if req[k]:
+                new_gap += cell(c + d) - cell(c)
+            squares += 2 * c * d + d * d
+        before = gap[p] if members[p] else 0.0
+        after = new_gap if size_after > 0 else 0.0
+        return after - before + spread * squares, new_gap
+
+    def partners_on(i: int, p: int, skip: int = -1) -> int:
+        return sum(1 for x in partners[i] if x != skip and place[x] == p)
+
+    def clashes(i: int, p: int, skip: int = -1) -> bool:
+        return any(x != skip and place[x] == p for x in rivals[i])
+
+    def detach(i: int, p: int) -> None:
+        group = members[p]
+        last = group.pop()
+        if last != i:
+            group[slot[i]] = last
+            slot[last] = slot[i]
+
+    def attach(i: int, p: int) -> None:
+        slot[i] = len(members[p])
+        members[p].append(i)
+        place[i] = p
+
+    def shift(i: int, p: int, q: int) -> None:
+        for k in skills[i]:
+            if p >= 0:
+                counts[p][k] -= 1
+            counts[q][k] += 1
+
+    rng = random.Random(seed)
+    patience = patience if patience is not None else max(2000, 20 * n)
+    deadline = started + time_budget
+    stale = 0
+    iteration = 0
+    while stale < patience:
+        iteration += 1
+        if iteration % CLOCK_INTERVAL == 0 and time.perf_counter() >= deadline:
+            break
+        i = rng.randrange(n)
+        p = place[i]
+        q = rng.choice(candidates[i]) if rng.random() < 0.5 else rng.randrange(m)
+        if q == p:
+            stale += 1
+            continue
+        result.n_evaluated += 1
+
+        if len(members[q]) < capacities[q]:
+            if clashes(i, q):
+                stale += 1
+                continue
+            gain = utility.item(i, q) + teammate * partners_on(i, q)
+            if p >= 0:
+                gain -= utility.item(i, p) + teammate * partners_on(i, p)
+                cost_p, gap_p = team_delta(p, [(k, -1) for k in skills[i]], len(members[p]) - 1)
+                gain -= cost_p
+            cost_q, gap_q = team_delta(q, [(k, 1) for k in skills[i]], len(members[q]) + 1)
+            gain -= cost_q
+            if gain <= 1e-9:
+                stale += 1
+                continue
+            shift(i, p, q)
+            if p >= 0:
+                detach(i, p)
+                gap[p] = gap_p
+            attach(i, q)
+            gap[q] = gap_q
+            result.n_moves += 1
+        elif p >= 0 and members[q]:
+            j = members[q][rng.randrange(len(members[q]))]
+            if clashes(i, q, j) or clashes(j, p, i):
+                stale += 1
+                continue
+            gain = (
+                utility.item(i, q) + utility.item(j, p) - utility.item(i, p) - utility.item(j, q)
+                + teammate * (
+                    partners_on(i, q, j) - partners_on(i, p, j)
+                    + partners_on(j, p, i) - partners_on(j, q, i)
+                )
+            )
+            only_i = skill_sets[i] - skill_sets[j]
+            only_j = skill_sets[j] - skill_sets[i]
+            cost_p, gap_p = team_delta(p, [(k, -1) for k in only_i] + [(k, 1) for k in only_j], len(members[p]))
+            cost_q, gap_q = team_delta(q, [(k, 1) for k in only_i] + [(k, -1) for k in only_j], len(members[q]))
+            gain -= cost_p + cost_q
+            if gain <= 1e-9:
+                stale += 1
+                continue
+            for k in only_i:
+                counts[p][k] -= 1
+                counts[q][k] += 1
+            for k in only_j:
+                counts[p][k] += 1
+                counts[q][k] -= 1
+            # Both teams keep their size, so the members trade list slots.
+            members[p][slot[i]], members[q][slot[j]] = j, i
+            slot[i], slot[j] = slot[j], slot[i]
+            place[i], place[j] = q, p
+            gap[p], gap[q] = gap_p, gap_q
+            result.n_swaps += 1
+        else:
+            stale += 1
+            continue
+
+        stale = 0
+        objective += gain
+        result.trace.append((time.perf_counter() - started, objective))
+
+    result.assignment = np.array(place, dtype=np.int32)
+    result.objective_after = objective
+    result.elapsed_seconds = time.perf_counter() - started
+    logger.info(
+        f"Balanced assignment in {result.elapsed_seconds * 1000:.1f} ms: {result.n_moves} moves, "
+        f"{result.n_swaps} swaps, objective {result.objective_before:.3f} -> {objective:.3f}"
+    )
+    return result
@@ -0,0 +1,36 @@
+from typing import List
+import numpy as np
+
+WORD_BITS = 64
+
+def n_words(n_bits: int) -> int:
+    return max(1, -(-n_bits // WORD_BITS))
+
+def build_bitsets(owners: np.ndarray, bits: np.ndarray, n_owners: int, n_bits: int) -> np.ndarray:
+    """Set bit ``bits[i]`` in row ``owners[i]``; returns (n_owners, words) uint64."""
+    out = np.zeros((n_owners, n_words(n_bits)), dtype=np.uint64)
+    bits = np.asarray(bits, dtype=np.uint64)
+    masks = np.left_shift(np.uint64(1), bits & np.uint64(WORD_BITS - 1))
+    np.bitwise_or.at(out, (np.asarray(owners, dtype=np.int64), (bits >> np.uint64(6)).astype(np.int64)), masks)
+    return out
+
+def or_by_group(bitsets: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    """OR together the rows that share a group, shape (n_groups, words)."""
+    out = np.zeros((n_groups, bitsets.shape[1]), dtype=np.uint64)
+    if bitsets.shape[0]:
+        np.bitwise_or.at(out, np.asarray(groups, dtype=np.int64), bitsets)
+    return out
+
+def missing_team_skills(required: np.ndarray, member_bits: np.ndarray, member_teams: np.ndarray) -> np.ndarray:
+    """Required skills no member of each team has: ``required & ~OR(members)``."""
+    return required & ~or_by_group(member_bits, member_teams, required.shape[0])
+
+def popcount(bitsets: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row."""
+    return np.unpackbits(np.ascontiguousarray(bitsets).view(np.uint8), axis=1).sum(axis=1)
+
+def to_indices(bitsets: np.ndarray) -> List[np.ndarray]:
+    """Positions of the set bits in each row."""
+    flags = np.unpackbits(np.ascontiguousarray(bitsets).view(np.uint8), axis=1, bitorder="little")
+    rows, cols = np.nonzero(flags)
+    return np.split(cols, np.searchsorted(rows, np.arange(1, bitsets.shape[0])))
@@ -0,0 +1,58 @@
+from typing import Optional
+from src.matching.problem import MatchingProblem, index_of
+from src.model.matching import MatchingWeights
+import numpy as np
+import hashlib
+import zlib
+
+# Bump when solver or scoring changes should invalidate previously cached runs.
+CACHE_VERSION = 2
+
+def input_hash(problem: MatchingProblem, weights: MatchingWeights, engine: str, group_teammates: bool, time_budget_ms: Optional[int] = None) -> str:
+    """SHA-256 over every input that can change a run's result.
+
+    Arrays are hashed in their loaded (sorted, index-based) form, so the
+    digest depends only on the junction-table contents, not on row order.
+    ``time_budget_ms`` is only hashed for budgeted engines, and the
+    do-not-pair constraints only when there are any, so runs cached before
+    constraints existed keep their keys.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_VERSION}|{engine}|{int(group_teammates)}|{weights.model_dump_json()}".encode())
+    if time_budget_ms is not None:
+        digest.update(f"|{time_budget_ms}ms".encode())
+    arrays = [
+        problem.user_ids,
+        problem.project_ids,
+        problem.skill_ids,
+        problem.capacities,
+        np.packbits(problem.user_skills, axis=None),
+        np.packbits(problem.project_skills, axis=None),
+        problem.preference_ranks,
+        np.unique(problem.teammate_pairs, axis=0),
+    ]
+    if problem.conflict_pairs.shape[0]:
+        arrays.append(np.unique(problem.conflict_pairs, axis=0))
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+def pack_ids(ids: np.ndarray) -> bytes:
+    """Compress an integer array to zlib'd little-endian int32 bytes."""
+    return zlib.compress(np.ascontiguousarray(ids, dtype="<i4").tobytes())
+
+def unpack_ids(blob: bytes) -> np.ndarray:
+    return np.frombuffer(zlib.decompress(blob), dtype="<i4").astype(np.int64)
+
+def pack_assignment(problem: MatchingProblem, assignment: np.ndarray) -> bytes:
+    """Store project IDs rather than indices so a run stays readable after projects change."""
+    project_ids = np.zeros(assignment.shape, dtype=np.int64)
+    placed = assignment >= 0
+    project_ids[placed] = problem.project_ids[assignment[placed]]
+    return pack_ids(project_ids)
+
+def unpack_assignment(problem: MatchingProblem, blob: bytes) -> np.ndarray:
+    """Turn stored project IDs back into project indices of ``problem`` (-1 if unmatched)."""
+    return index_of(problem.project_ids, unpack_ids(blob)).astype(np.int32)
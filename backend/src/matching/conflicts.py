@@ -0,0 +1,35 @@
+from typing import List
+from src.matching.grouping import StudentGroups
+from src.matching.problem import MatchingProblem
+import numpy as np
+
+def conflict_lists(pairs: np.ndarray, n: int) -> List[List[int]]:
+    """Adjacency lists of an unordered pair array over ``n`` items."""
+    neighbours: List[List[int]] = [[] for _ in range(n)]
+    for a, b in pairs.tolist():
+        neighbours[a].append(b)
+        neighbours[b].append(a)
+    return neighbours
+
+def unit_conflicts(groups: StudentGroups, conflict_pairs: np.ndarray) -> List[List[int]]:
+    """Units that may not share a project with each unit.
+
+    Grouping never merges a conflicting pair, so every student conflict
+    becomes a conflict between two distinct units.
+    """
+    if conflict_pairs.shape[0] == 0:
+        return [[] for _ in range(groups.n_groups)]
+    pairs = np.unique(np.sort(groups.labels[conflict_pairs], axis=1), axis=0)
+    return conflict_lists(pairs[pairs[:, 0] != pairs[:, 1]], groups.n_groups)
+
+def blocked_projects(conflicts: List[int], assignment: np.ndarray) -> List[int]:
+    """Projects already holding one of ``conflicts``."""
+    return [p for p in (assignment.item(v) for v in conflicts) if p >= 0]
+
+def violated_conflicts(problem: MatchingProblem, assignment: np.ndarray) -> int:
+    """Number of do-not-pair constraints whose students share a project."""
+    if problem.conflict_pairs.shape[0] == 0:
+        return 0
+    a = assignment[problem.conflict_pairs[:, 0]]
+    b = assignment[problem.conflict_pairs[:, 1]]
+    return int(((a == b) & (a >= 0)).sum())
@@ -0,0 +1,145 @@
+from typing import Tuple
+from src.matching.grouping import aggregate_by_group
+from src.matching.scoring import PREFERENCE_SCORES, skill_scores
+from src.matching.units import UnitProblem, ranked_candidates
+from src.matching.conflicts import blocked_projects
+import numpy as np
+import heapq
+
+# Projects on each unit's proposal list: its ranked choices, then its best skill matches.
+PROPOSAL_LIST_LENGTH = 16
+
+def proposal_lists(units: UnitProblem) -> Tuple[np.ndarray, np.ndarray]:
+    """Each unit's proposal order and each project's priority over units.
+
+    Units list the projects their members ranked first, by summed
+    preference score, and fill the rest of the list with their best skill
+    matches. A project prioritises units by their members' mean skill
+    match score for it.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Proposal lists (k, L) and priorities (k, m).
+    """
+    problem, groups = units.problem, units.groups
+    skill = units.skill if units.skill is not None else skill_scores(problem)
+    priority = aggregate_by_group(groups, skill) / groups.sizes[:, None].astype(np.float32)
+    preference = np.zeros((groups.n_groups, problem.n_projects), dtype=np.float32)
+    rows, cols = np.nonzero(problem.preference_ranks)
+    np.add.at(preference, (groups.labels[rows], cols), PREFERENCE_SCORES[problem.preference_ranks[rows, cols]])
+    # Preference scores step by 1/3, so scaling them by 4 outranks any skill gap (at most 1).
+    return ranked_candidates(preference * 4 + priority, PROPOSAL_LIST_LENGTH), priority
+
+def solve_deferred_acceptance(units: UnitProblem) -> np.ndarray:
+    """Student-proposing deferred acceptance with project capacities.
+
+    Free units propose down their lists; a project tentatively holds the
+    highest-priority units that fit and bumps its lowest-priority ones when
+    a better unit needs the room. Every unit proposes to each listed
+    project at most once, so the work is O(units x list length) heap
+    operations. Without grouping the result is stable with respect to the
+    proposal lists. Units whose list runs out are then placed in the
+    project with room that gives them the most utility.
+
+    A project never holds two conflicting units: a proposal is rejected
+    when the project holds a conflicting unit it prioritises higher, and
+    otherwise the conflicting units are bumped along with any needed for
+    room.
+
+    Returns:
+        np.ndarray: Project index per unit, -1 if no project has room.
+    """
+    problem, groups = units.problem, units.groups
+    k, m = groups.n_groups, problem.n_projects
+    assignment = np.full(k, -1, dtype=np.int32)
+    if k == 0 or m == 0:
+        return assignment
+
+    lists, priority = proposal_lists(units)
+    lists = lists.tolist()
+    sizes = groups.sizes.tolist()
+    capacities = problem.capacities.tolist()
+    conflicts = units.conflicts
+    remaining = list(capacities)
+    # Min-heaps of (priority, -unit, unit): the top entry is the unit a project would bump first.
+    held = [[] for _ in range(m)]
+    holder = [-1] * k
+    next_choice = [0] * k
+    exhausted = []
+    free = list(range(k - 1, -1, -1))
+    while free:
+        unit = free.pop()
+        size = sizes[unit]
+        choices = lists[unit]
+        while True:
+            if next_choice[unit] == len(choices):
+                exhausted.append(unit)
+                break
+            project = choices[next_choice[unit]]
+            next_choice[unit] += 1
+            if size > capacities[project]:
+                continue
+            entry = (priority.item(unit, project), -unit, unit)
+            heap = held[project]
+            rivals = []
+            if conflicts:
+                rivals = [(priority.item(v, project), -v, v) for v in conflicts[unit] if holder[v] == project]
+                if any(rival > entry for rival in rivals):
+                    continue
+                if rivals:
+                    for rival in rivals:
+                        heap.remove(rival)
+                        remaining[project] += sizes[rival[2]]
+                    heapq.heapify(heap)
+            bumped = []
+            while remaining[project] < size and heap and heap[0] < entry:
+                worst = heapq.heappop(heap)
+                bumped.append(worst)
+                remaining[project] += sizes[worst[2]]
+            if remaining[project] >= size:
+                heapq.heappush(heap, entry)
+                remaining[project] -= size
+                holder[unit] = project
+                for worst in rivals + bumped:
+                    holder[worst[2]] = -1
+                    free.append(worst[2])
+                break
+            for worst in rivals + bumped:
+                heapq.heappush(heap, worst)
+                remaining[project] -= sizes[worst[2]]
+
+    for project, heap in enumerate(held):
+        for _, _, unit in heap:
+            assignment[unit] = project
+    if exhausted:
+        left = np.array(remaining, dtype=np.int64)
+        for unit in sorted(exhausted, key=lambda u: -sizes[u]):
+            fits = left >= sizes[unit]
+            if conflicts:
+                fits[blocked_projects(conflicts[unit], assignment)] = False
+            if not fits.any():
+                continue
+            project = int(np.argmax(np.where(fits, units.unit_utility[unit], -np.inf)))
+            assignment[unit] = project
+            left[project] -= sizes[unit]
+    return assignment
+
+def blocking_pairs(units: UnitProblem, assignment: np.ndarray) -> int:
+    """Count (unit, project) pairs that would both rather be matched to each other.
+
+    A unit blocks with a project listed above its own placement when that
+    project has room for it or holds a unit it prioritises lower.
+    """
+    lists, priority = proposal_lists(units)
+    sizes = units.groups.sizes
+    capacities = units.problem.capacities.astype(np.int64)
+    placed = np.flatnonzero(assignment >= 0)
+    load = np.bincount(assignment[placed], weights=sizes[placed], minlength=units.problem.n_projects)
+    weakest = np.full(units.problem.n_projects, np.inf)
+    np.minimum.at(weakest, assignment[placed], priority[placed, assignment[placed]])
+
+    matches = lists == assignment[:, None]
+    position = np.where(matches.any(axis=1), matches.argmax(axis=1), lists.shape[1])
+    above = np.arange(lists.shape[1])[None, :] < position[:, None]
+    room = (capacities - load)[lists] >= sizes[:, None]
+    outranks = np.take_along_axis(priority, lists, axis=1) > weakest[lists]
+    return int((above & (room | outranks)).sum())
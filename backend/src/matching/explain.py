@@ -0,0 +1,51 @@
+from src.matching.problem import MatchingProblem
+from src.matching.scoring import PREFERENCE_SCORES
+from src.model.matching import MatchingWeights
+import numpy as np
+import zlib
+
+# Score components of each student's assigned project, one record per student.
+EXPLANATION_DTYPE = np.dtype([
+    ("skill_score", "<f4"),
+    ("matched_skills", "<i2"),
+    ("required_skills", "<i2"),
+    ("preference_rank", "i1"),
+    ("teammates_requested", "<i2"),
+    ("teammates_satisfied", "<i2"),
+    ("utility", "<f4"),
+])
+
+def explain_assignment(problem: MatchingProblem, weights: MatchingWeights, assignment: np.ndarray) -> np.ndarray:
+    """Break every student's placement into its score components in one pass.
+
+    Unmatched students get zeroed skill/preference fields but still report
+    their teammate requests.
+    """
+    out = np.zeros(problem.n_students, dtype=EXPLANATION_DTYPE)
+    placed = np.flatnonzero(assignment >= 0)
+    projects = assignment[placed]
+
+    required = problem.project_skills.sum(axis=1)
+    matched = (problem.user_skills[placed] & problem.project_skills[projects]).sum(axis=1)
+    out["matched_skills"][placed] = matched
+    out["required_skills"][placed] = required[projects]
+    out["skill_score"][placed] = matched / np.maximum(required[projects], 1)
+    out["preference_rank"][placed] = problem.preference_ranks[placed, projects]
+    out["utility"][placed] = (
+        weights.skill * out["skill_score"][placed]
+        + weights.preference * PREFERENCE_SCORES[out["preference_rank"][placed]]
+    )
+
+    if problem.teammate_pairs.shape[0]:
+        requester = problem.teammate_pairs[:, 0]
+        a = assignment[requester]
+        b = assignment[problem.teammate_pairs[:, 1]]
+        out["teammates_requested"] = np.bincount(requester, minlength=problem.n_students)
+        out["teammates_satisfied"] = np.bincount(requester[(a == b) & (a >= 0)], minlength=problem.n_students)
+    return out
+
+def pack_explanation(explanation: np.ndarray) -> bytes:
+    return zlib.compress(np.ascontiguousarray(explanation, dtype=EXPLANATION_DTYPE).tobytes())
+
+def unpack_explanation(blob: bytes) -> np.ndarray:
+    return np.frombuffer(zlib.decompress(blob), dtype=EXPLANATION_DTYPE)
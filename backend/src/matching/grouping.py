@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+from src.matching.problem import MatchingProblem
+import numpy as np
+
+@dataclass
+class StudentGroups:
+    """Partition of students into units that the solver places as a whole."""
+    labels: np.ndarray          # (n,) int32 group index for each student
+    sizes: np.ndarray           # (k,) int32 number of students in each group
+    internal_pairs: np.ndarray  # (k,) int32 directed teammate requests satisfied inside each group
+
+    @property
+    def n_groups(self) -> int:
+        return int(self.sizes.shape[0])
+
+def singleton_groups(n_students: int) -> StudentGroups:
+    """One group per student, i.e. no pre-clustering."""
+    return StudentGroups(
+        labels=np.arange(n_students, dtype=np.int32),
+        sizes=np.ones(n_students, dtype=np.int32),
+        internal_pairs=np.zeros(n_students, dtype=np.int32),
+    )
+
+def mutual_pairs(teammate_pairs: np.ndarray, n_students: int) -> np.ndarray:
+    """Return the (a, b) pairs with a < b where both students requested each other."""
+    if teammate_pairs.shape[0] == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    a = teammate_pairs[:, 0].astype(np.int64)
+    b = teammate_pairs[:, 1].astype(np.int64)
+    forward = a * n_students + b
+    backward = b * n_students + a
+    both = np.intersect1d(forward[a < b], backward[a > b])
+    return np.stack([both // n_students, both % n_students], axis=1)
+
+def default_group_cap(capacities: np.ndarray) -> int:
+    """Largest group that fits every project: the smallest non-zero capacity."""
+    open_capacities = capacities[capacities > 0]
+    if open_capacities.shape[0] == 0:
+        return 1
+    return int(open_capacities.min())
+
+def group_mutual_requests(problem: MatchingProblem, cap: Optional[int] = None) -> StudentGroups:
+    """Collapse mutually-requesting students into groups with union-find.
+
+    Pairs are merged in ascending order and a merge is skipped when the
+    combined group would exceed ``cap`` (by default the smallest project
+    capacity in the course), so every group can be placed in any project.
+    A merge is also skipped when it would put a do-not-pair constraint
+    inside one group, so the engines only ever see conflicts between units.
+    """
+    n = problem.n_students
+    if cap is None:
+        cap = default_group_cap(problem.capacities)
+    parent = list(range(n))
+    size = [1] * n
+    # Students each group's members must not be grouped with, kept on the root.
+    avoid: Dict[int, Set[int]] = {}
+    for a, b in problem.conflict_pairs.tolist():
+        avoid.setdefault(a, set()).add(b)
+        avoid.setdefault(b, set()).add(a)
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in mutual_pairs(problem.teammate_pairs, n).tolist():
+        root_a, root_b = find(a), find(b)
+        if root_a == root_b or size[root_a] + size[root_b] > cap:
+            continue
+        if any(find(x) == root_b for x in avoid.get(root_a, ())):
+            continue
+        if size[root_a] < size[root_b]:
+            root_a, root_b = root_b, root_a
+        parent[root_b] = root_a
+        size[root_a] += size[root_b]
+        if root_b in avoid:
+            avoid.setdefault(root_a, set()).update(avoid.pop(root_b))
+
+    roots = np.fromiter((find(x) for x in range(n)), dtype=np.int64, count=n)
+    _, labels = np.unique(roots, return_inverse=True)
+    labels = labels.astype(np.int32)
+    sizes = np.bincount(labels, minlength=int(labels.max()) + 1 if n else 0).astype(np.int32)
+
+    internal_pairs = np.zeros(sizes.shape[0], dtype=np.int32)
+    if problem.teammate_pairs.shape[0]:
+        src = labels[problem.teammate_pairs[:, 0]]
+        dst = labels[problem.teammate_pairs[:, 1]]
+        internal_pairs = np.bincount(src[src == dst], minlength=sizes.shape[0]).astype(np.int32)
+    return StudentGroups(labels=labels, sizes=sizes, internal_pairs=internal_pairs)
+
+def group_members(groups: StudentGroups, size: int) -> np.ndarray:
+    """Student indices of every group with exactly ``size`` members, shape (g, size)."""
+    order = np.argsort(groups.labels, kind="stable")
+    starts = np.concatenate(([0], np.cumsum(groups.sizes)[:-1]))
+    selected = starts[groups.sizes == size]
+    return order[selected[:, None] + np.arange(size)]
+
+def aggregate_by_group(groups: StudentGroups, matrix: np.ndarray) -> np.ndarray:
+    """Sum the rows of a per-student matrix into per-group rows, shape (k, m).
+
+    Groups are summed one size at a time, so the work is a handful of
+    gathers rather than one reduction per group.
+    """
+    if groups.n_groups == matrix.shape[0]:
+        out = np.empty_like(matrix)
+        out[groups.labels] = matrix
+        return out
+    out = np.zeros((groups.n_groups, matrix.shape[1]), dtype=matrix.dtype)
+    for size in np.unique(groups.sizes).tolist():
+        members = group_members(groups, size)
+        target = groups.labels[members[:, 0]]
+        out[target] = matrix[members].sum(axis=1)
+    return out
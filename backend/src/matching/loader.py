@@ -0,0 +1,121 @@
+from sqlalchemy.orm import Session
+from src.matching.problem import MatchingProblem, index_of
+from src.model.project import Project
+from src.model.project_skill import ProjectSkill
+from src.model.project_user import ProjectUser
+from src.model.user_course import UserCourse
+from src.model.user_skill import UserSkill
+from src.model.project_preference import ProjectPreference
+from src.model.teammate_preference import TeammatePreference
+from src.model.do_not_pair import DoNotPair
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+def _pairs(rows) -> np.ndarray:
+    return np.array(rows, dtype=np.int64).reshape(-1, 2)
+
+def load_course_problem(db: Session, course_id: int) -> MatchingProblem:
+    """Build the matching problem for a course with one query per table.
+
+    Students are the users enrolled through ``user_courses``; projects are
+    those whose ``course_id`` matches.
+    """
+    user_ids = np.unique(np.array(
+        [row[0] for row in db.query(UserCourse.user_id).filter(UserCourse.course_id == course_id).all()],
+        dtype=np.int64,
+    ))
+    project_rows = db.query(Project.id, Project.maxCapacity).filter(
+        Project.course_id == course_id
+    ).order_by(Project.id).all()
+    project_ids = np.array([row[0] for row in project_rows], dtype=np.int64)
+    capacities = np.array([row[1] or 0 for row in project_rows], dtype=np.int32)
+
+    user_skill_pairs = _pairs(
+        db.query(UserSkill.user_id, UserSkill.skill_id)
+        .join(UserCourse, UserCourse.user_id == UserSkill.user_id)
+        .filter(UserCourse.course_id == course_id).all()
+    )
+    project_skill_pairs = _pairs(
+        db.query(ProjectSkill.project_id, ProjectSkill.skill_id)
+        .join(Project, Project.id == ProjectSkill.project_id)
+        .filter(Project.course_id == course_id).all()
+    )
+    preference_rows = np.array(
+        db.query(ProjectPreference.user_id, ProjectPreference.project_id, ProjectPreference.rank)
+        .join(Project, Project.id == ProjectPreference.project_id)
+        .filter(Project.course_id == course_id).all(),
+        dtype=np.int64,
+    ).reshape(-1, 3)
+    teammate_rows = _pairs(
+        db.query(TeammatePreference.user_id, TeammatePreference.teammate_id)
+        .join(UserCourse, UserCourse.user_id == TeammatePreference.user_id)
+        .filter(UserCourse.course_id == course_id).all()
+    )
+    conflict_rows = _pairs(
+        db.query(DoNotPair.user_id, DoNotPair.other_user_id)
+        .filter(DoNotPair.course_id == course_id).all()
+    )
+
+    skill_ids = np.unique(np.concatenate([user_skill_pairs[:, 1], project_skill_pairs[:, 1]]))
+    n, m, s = user_ids.shape[0], project_ids.shape[0], skill_ids.shape[0]
+
+    user_skills = np.zeros((n, s), dtype=bool)
+    rows = index_of(user_ids, user_skill_pairs[:, 0])
+    user_skills[rows, index_of(skill_ids, user_skill_pairs[:, 1])] = True
+    project_skills = np.zeros((m, s), dtype=bool)
+    rows = index_of(project_ids, project_skill_pairs[:, 0])
+    project_skills[rows, index_of(skill_ids, project_skill_pairs[:, 1])] = True
+
+    preference_ranks = np.zeros((n, m), dtype=np.int8)
+    rows = index_of(user_ids, preference_rows[:, 0])
+    cols = index_of(project_ids, preference_rows[:, 1])
+    keep = (rows >= 0) & (cols >= 0)
+    preference_ranks[rows[keep], cols[keep]] = preference_rows[keep, 2]
+
+    requester = index_of(user_ids, teammate_rows[:, 0])
+    requested = index_of(user_ids, teammate_rows[:, 1])
+    keep = (requester >= 0) & (requested >= 0) & (requester != requested)
+    teammate_pairs = np.stack([requester[keep], requested[keep]], axis=1).astype(np.int32)
+
+    # Constraints on students who are no longer enrolled are dropped.
+    conflicts = np.sort(index_of(user_ids, conflict_rows.ravel()).reshape(-1, 2), axis=1)
+    keep = (conflicts[:, 0] >= 0) & (conflicts[:, 0] != conflicts[:, 1])
+    conflict_pairs = np.unique(conflicts[keep], axis=0).astype(np.int32)
+
+    logger.info(f"Loaded matching problem for course {course_id}: {n} students, {m} projects, {s} skills")
+    return MatchingProblem(
+        course_id=course_id,
+        user_ids=user_ids,
+        project_ids=project_ids,
+        skill_ids=skill_ids,
+        user_skills=user_skills,
+        project_skills=project_skills,
+        capacities=capacities,
+        preference_ranks=preference_ranks,
+        teammate_pairs=teammate_pairs,
+        conflict_pairs=conflict_pairs,
+    )
+
+def load_current_assignment(db: Session, problem: MatchingProblem) -> np.ndarray:
+    """Read a course's stored project-user rows as an assignment over ``problem``.
+
+    Returns one project index per student, -1 for students without a
+    project. When a student has several rows in the course the newest wins;
+    rows of students not enrolled in the course are ignored.
+    """
+    rows = np.array(
+        db.query(ProjectUser.user_id, ProjectUser.project_id)
+        .join(Project, Project.id == ProjectUser.project_id)
+        .filter(Project.course_id == problem.course_id)
+        .order_by(ProjectUser.id.desc()).all(),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    # np.unique keeps the first occurrence, i.e. the newest row per user.
+    users, first = np.unique(rows[:, 0], return_index=True)
+    assignment = np.full(problem.n_students, -1, dtype=np.int64)
+    students = index_of(problem.user_ids, users)
+    keep = students >= 0
+    assignment[students[keep]] = index_of(problem.project_ids, rows[first[keep], 1])
+    return assignment
@@ -0,0 +1,72 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from typing import List, Optional, Tuple
+from src.matching.anytime import ANYTIME_ENGINE, run_anytime
+from src.matching.problem import MatchingProblem, MatchingResult
+from src.matching.solver import run_matching
+from src.model.matching import MatchingWeights
+import os
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Below this many student x project cells in total, spawning workers costs more than it saves.
+PARALLEL_MIN_CELLS = 20_000_000
+
+@dataclass
+class CourseSolve:
+    """One course's solver outcome; ``seconds`` is wall time inside the worker."""
+    course_id: Optional[int]
+    result: MatchingResult
+    seconds: float
+    curve: List[Tuple[float, float]] = field(default_factory=list)
+
+def solve_course(
+    problem: MatchingProblem,
+    weights: MatchingWeights,
+    group_teammates: bool = True,
+    engine: str = "utility",
+    time_budget: Optional[float] = None,
+) -> CourseSolve:
+    """Solve one course with any engine, including the budgeted anytime engine."""
+    started = time.perf_counter()
+    curve: List[Tuple[float, float]] = []
+    if engine == ANYTIME_ENGINE:
+        result, curve = run_anytime(problem, weights, time_budget, group_teammates=group_teammates)
+    else:
+        result = run_matching(problem, weights, group_teammates=group_teammates, engine=engine)
+    return CourseSolve(problem.course_id, result, time.perf_counter() - started, curve)
+
+def solve_courses(
+    problems: List[MatchingProblem],
+    weights: MatchingWeights,
+    group_teammates: bool = True,
+    engine: str = "utility",
+    time_budget: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    min_cells: int = PARALLEL_MIN_CELLS,
+) -> List[CourseSolve]:
+    """Solve independent course problems across a process pool.
+
+    Results come back in input order. The largest problems are submitted
+    first so a long course does not start last. A single worker, or a
+    semester smaller than ``min_cells`` student x project cells, is solved
+    in-process, skipping pool start-up.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(problems))
+    cells = sum(problem.n_students * problem.n_projects for problem in problems)
+    if workers <= 1 or cells < min_cells:
+        return [solve_course(problem, weights, group_teammates, engine, time_budget) for problem in problems]
+    order = sorted(range(len(problems)), key=lambda i: -problems[i].n_students * max(problems[i].n_projects, 1))
+    solves: List[Optional[CourseSolve]] = [None] * len(problems)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+        futures = {
+            i: pool.submit(solve_course, problems[i], weights, group_teammates, engine, time_budget)
+            for i in order
+        }
+        for i, future in futures.items():
+            solves[i] = future.result()
+    logger.info(f"Solved {len(problems)} courses on {workers} workers")
+    return solves
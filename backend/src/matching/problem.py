@@ -0,0 +1,64 @@
+from dataclasses import dataclass, field
+from typing import Optional
+import numpy as np
+
+def no_pairs() -> np.ndarray:
+    return np.empty((0, 2), dtype=np.int32)
+
+@dataclass
+class MatchingProblem:
+    """Dense, index-based view of one course's matching inputs.
+
+    Students, projects and skills are addressed by their position in
+    ``user_ids``, ``project_ids`` and ``skill_ids`` (each sorted ascending).
+    """
+    course_id: Optional[int]
+    user_ids: np.ndarray            # (n,) int64
+    project_ids: np.ndarray         # (m,) int64
+    skill_ids: np.ndarray           # (s,) int64
+    user_skills: np.ndarray         # (n, s) bool
+    project_skills: np.ndarray      # (m, s) bool
+    capacities: np.ndarray          # (m,) int32
+    preference_ranks: np.ndarray    # (n, m) int8, 0 = not ranked, 1 = top choice
+    teammate_pairs: np.ndarray      # (k, 2) int32, directed (requester, requested)
+    conflict_pairs: np.ndarray = field(default_factory=no_pairs)  # (c, 2) int32, unordered do-not-pair, a < b
+
+    @property
+    def n_students(self) -> int:
+        return int(self.user_ids.shape[0])
+
+    @property
+    def n_projects(self) -> int:
+        return int(self.project_ids.shape[0])
+
+    @property
+    def n_skills(self) -> int:
+        return int(self.skill_ids.shape[0])
+
+@dataclass
+class MatchingResult:
+    """Outcome of one solver run; ``assignment`` holds a project index per student or -1."""
+    assignment: np.ndarray          # (n,) int32
+    utility: float
+    engine: str
+    n_units: int
+    grouping_seconds: float
+    scoring_seconds: float
+    solve_seconds: float
+
+    @property
+    def n_assigned(self) -> int:
+        return int((self.assignment >= 0).sum())
+
+    @property
+    def n_unmatched(self) -> int:
+        return int((self.assignment < 0).sum())
+
+def index_of(sorted_ids: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """Map ids to positions in ``sorted_ids``; ids that are absent map to -1."""
+    ids = np.asarray(ids, dtype=np.int64)
+    if sorted_ids.shape[0] == 0:
+        return np.full(ids.shape, -1, dtype=np.int64)
+    pos = np.searchsorted(sorted_ids, ids)
+    pos = np.minimum(pos, sorted_ids.shape[0] - 1)
+    return np.where(sorted_ids[pos] == ids, pos, -1)
@@ -0,0 +1,72 @@
+from typing import Dict, List, Tuple
+from src.matching.bitsets import WORD_BITS, build_bitsets, n_words, popcount
+from src.matching.problem import index_of
+from src.matching.similarity import top_k
+import numpy as np
+
+class SkillProfileIndex:
+    """Skill sets of a course's students as uint64 bitsets, compared exactly.
+
+    Skills get bit positions in order of first appearance, so a student
+    gaining a skill nobody had yet only appends a bit (and, every 64
+    skills, a word). A query ANDs and ORs one row against all rows and
+    popcounts the result: a few vector operations over (n, words) words.
+    """
+
+    def __init__(self, user_ids: np.ndarray, pairs: np.ndarray):
+        self.user_ids = np.unique(np.asarray(user_ids, dtype=np.int64))
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        rows = index_of(self.user_ids, pairs[:, 0])
+        pairs, rows = pairs[rows >= 0], rows[rows >= 0]
+        self.skill_ids: List[int] = np.unique(pairs[:, 1]).tolist()
+        self.skill_bits: Dict[int, int] = {skill_id: bit for bit, skill_id in enumerate(self.skill_ids)}
+        bits = np.array([self.skill_bits[s] for s in pairs[:, 1].tolist()], dtype=np.int64)
+        self.bits = build_bitsets(rows, bits, self.user_ids.shape[0], len(self.skill_ids))
+
+    @property
+    def n_users(self) -> int:
+        return int(self.user_ids.shape[0])
+
+    def row_of(self, user_id: int) -> int:
+        """Row of a user, -1 if the user is not in the index."""
+        return int(index_of(self.user_ids, np.array([user_id]))[0])
+
+    def set_skills(self, user_id: int, skill_ids: List[int]) -> bool:
+        """Replace one user's skill set in place; returns False if the user is not indexed."""
+        row = self.row_of(user_id)
+        if row < 0:
+            return False
+        for skill_id in skill_ids:
+            if skill_id not in self.skill_bits:
+                self.skill_bits[skill_id] = len(self.skill_ids)
+                self.skill_ids.append(skill_id)
+        words = n_words(len(self.skill_ids))
+        if words > self.bits.shape[1]:
+            self.bits = np.pad(self.bits, ((0, 0), (0, words - self.bits.shape[1])))
+        positions = np.array([self.skill_bits[s] for s in skill_ids], dtype=np.int64)
+        self.bits[row] = build_bitsets(np.zeros(positions.shape[0], dtype=np.int64), positions, 1, self.bits.shape[1] * WORD_BITS)[0]
+        return True
+
+    def skills_of(self, bits: np.ndarray) -> List[int]:
+        """Skill IDs of the set bits of one bitset row."""
+        flags = np.unpackbits(np.ascontiguousarray(bits).view(np.uint8), bitorder="little")
+        return sorted(self.skill_ids[b] for b in np.flatnonzero(flags).tolist())
+
+    def rank(self, user_id: int, k: int, complementary: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """The ``k`` classmates most similar to a user, or most complementary.
+
+        Similarity is the Jaccard index |A & B| / |A | B|. Complementarity
+        is the share of the combined skill set only the classmate brings,
+        |B & ~A| / |A | B|. The user is never ranked against themselves.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Rows in descending score order and their scores.
+        """
+        row = self.row_of(user_id)
+        mine = self.bits[row]
+        union = popcount(self.bits | mine).astype(np.float32)
+        common = popcount((self.bits & ~mine) if complementary else (self.bits & mine)).astype(np.float32)
+        scores = np.divide(common, union, out=np.zeros_like(common), where=union > 0)
+        scores[row] = -np.inf
+        best = top_k(scores, min(k, self.n_users - 1))
+        return best, scores[best]
@@ -0,0 +1,35 @@
+from src.matching.problem import MatchingProblem
+from src.matching.scoring import PREFERENCE_SCORES
+import numpy as np
+
+def manager_scores(problem: MatchingProblem, assignment: np.ndarray) -> np.ndarray:
+    """Suitability of each student to manage their team, shape (n,).
+
+    Skill breadth (number of skills held, relative to the broadest student
+    in the course) plus the preference score of the project they were
+    placed on. Unassigned students score -inf.
+    """
+    breadth = problem.user_skills.sum(axis=1).astype(np.float32)
+    breadth /= max(float(breadth.max(initial=0.0)), 1.0)
+    scores = np.full(problem.n_students, -np.inf, dtype=np.float32)
+    placed = np.flatnonzero(assignment >= 0)
+    scores[placed] = breadth[placed] + PREFERENCE_SCORES[problem.preference_ranks[placed, assignment[placed]]]
+    return scores
+
+def designate_managers(problem: MatchingProblem, assignment: np.ndarray) -> np.ndarray:
+    """Pick one project manager per staffed team.
+
+    Returns the manager's student index for each project, -1 for projects
+    without members. Ties go to the student with the lowest user ID.
+    """
+    managers = np.full(problem.n_projects, -1, dtype=np.int64)
+    placed = np.flatnonzero(assignment >= 0)
+    if placed.shape[0] == 0:
+        return managers
+    scores = manager_scores(problem, assignment)[placed]
+    teams = assignment[placed]
+    # Sort by team, then best score first; the first row of each team wins.
+    order = np.lexsort((placed, -scores, teams))
+    first_teams, first = np.unique(teams[order], return_index=True)
+    managers[first_teams] = placed[order[first]]
+    return managers
@@ -0,0 +1,51 @@
+from typing import Optional
+from src.matching.problem import MatchingProblem
+from src.model.matching import MatchingWeights
+import numpy as np
+
+# Score for preference rank 0 (unranked), 1, 2 and 3.
+PREFERENCE_SCORES = np.array([0.0, 1.0, 2.0 / 3.0, 1.0 / 3.0], dtype=np.float32)
+
+def skill_scores(problem: MatchingProblem) -> np.ndarray:
+    """Fraction of each project's required skills that each student has, shape (n, m)."""
+    project_skills = problem.project_skills.astype(np.float32)
+    project_skills /= np.maximum(project_skills.sum(axis=1, keepdims=True), 1.0)
+    return problem.user_skills.astype(np.float32) @ project_skills.T
+
+def preference_scores(problem: MatchingProblem) -> np.ndarray:
+    """Score of each project's rank in each student's top-3 list, shape (n, m)."""
+    return PREFERENCE_SCORES[problem.preference_ranks]
+
+def utility_matrix(problem: MatchingProblem, weights: MatchingWeights, skill: Optional[np.ndarray] = None) -> np.ndarray:
+    """Per-student, per-project utility excluding the teammate term, shape (n, m).
+
+    Preferences touch at most three cells per student, so they are added
+    sparsely instead of materializing a second dense matrix. Pass a
+    precomputed ``skill`` matrix to reuse it across several weightings.
+    """
+    if skill is None:
+        utility = skill_scores(problem)
+        if weights.skill != 1.0:
+            utility *= weights.skill
+    else:
+        utility = skill * np.float32(weights.skill)
+    rows, cols = np.nonzero(problem.preference_ranks)
+    ranks = problem.preference_ranks[rows, cols]
+    utility[rows, cols] += np.float32(weights.preference) * PREFERENCE_SCORES[ranks]
+    return utility
+
+def satisfied_teammate_pairs(problem: MatchingProblem, assignment: np.ndarray) -> int:
+    """Count directed teammate requests whose two students share a project."""
+    if problem.teammate_pairs.shape[0] == 0:
+        return 0
+    a = assignment[problem.teammate_pairs[:, 0]]
+    b = assignment[problem.teammate_pairs[:, 1]]
+    return int(((a == b) & (a >= 0)).sum())
+
+def total_utility(problem: MatchingProblem, weights: MatchingWeights, assignment: np.ndarray, utility: Optional[np.ndarray] = None) -> float:
+    """Objective value of an assignment: placed students' utility plus the teammate bonus."""
+    if utility is None:
+        utility = utility_matrix(problem, weights)
+    placed = np.flatnonzero(assignment >= 0)
+    value = float(utility[placed, assignment[placed]].sum())
+    return value + weights.teammate * satisfied_teammate_pairs(problem, assignment)
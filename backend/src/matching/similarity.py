@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from src.matching.problem import index_of
+import numpy as np
+
+@dataclass
+class SkillIndex:
+    """TF-IDF weighted, L2-normalized skill vectors of a set of users or projects.
+
+    Skills held by fewer rows weigh more, so a rare skill match outranks a
+    common one. Rows without any skill are all zeros and score 0.
+    """
+    ids: np.ndarray         # (r,) int64 sorted row ids
+    skill_ids: np.ndarray   # (s,) int64 sorted
+    idf: np.ndarray         # (s,) float32
+    vectors: np.ndarray     # (r, s) float32, unit-length rows
+
+    @property
+    def n_rows(self) -> int:
+        return int(self.ids.shape[0])
+
+    def query(self, skill_ids: np.ndarray) -> np.ndarray:
+        """Unit-length vector of a skill set in this index's weighting; unknown skills are ignored."""
+        vector = np.zeros(self.skill_ids.shape[0], dtype=np.float32)
+        columns = index_of(self.skill_ids, skill_ids)
+        columns = columns[columns >= 0]
+        vector[columns] = self.idf[columns]
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def scores(self, skill_ids: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row to a skill set, shape (r,)."""
+        return self.vectors @ self.query(skill_ids)
+
+    def row_skills(self, row: int) -> np.ndarray:
+        """Skill IDs held by one row."""
+        return self.skill_ids[self.vectors[row] > 0]
+
+def build_skill_index(ids: np.ndarray, pairs: np.ndarray) -> SkillIndex:
+    """Index the skills of ``ids`` from (row id, skill id) pairs; pairs of other ids are ignored."""
+    ids = np.unique(np.asarray(ids, dtype=np.int64))
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    rows = index_of(ids, pairs[:, 0])
+    pairs, rows = pairs[rows >= 0], rows[rows >= 0]
+    skill_ids = np.unique(pairs[:, 1])
+    held = np.zeros((ids.shape[0], skill_ids.shape[0]), dtype=bool)
+    held[rows, index_of(skill_ids, pairs[:, 1])] = True
+
+    # Smoothed inverse document frequency, as in scikit-learn's TfidfTransformer.
+    frequency = held.sum(axis=0)
+    idf = (np.log((1.0 + ids.shape[0]) / (1.0 + frequency)) + 1.0).astype(np.float32)
+    vectors = held * idf
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+    return SkillIndex(ids=ids, skill_ids=skill_ids, idf=idf, vectors=vectors)
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the ``k`` highest scores in descending order.
+
+    Equal scores are ordered by position, but which of several rows tied
+    at the cutoff make the top ``k`` is left to ``argpartition``.
+    """
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < scores.shape[0]:
+        best = np.argpartition(-scores, k - 1)[:k]
+    else:
+        best = np.arange(scores.shape[0])
+    return best[np.lexsort((best, -scores[best]))]
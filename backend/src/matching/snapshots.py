@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Tuple
+from src.matching.problem import index_of
+import numpy as np
+
+@dataclass
+class AssignmentDiff:
+    user_ids: np.ndarray        # (u,) union of both snapshots' students, sorted
+    before: np.ndarray          # (u,) project ID in the first snapshot, 0 if unassigned/absent
+    after: np.ndarray           # (u,) project ID in the second snapshot, 0 if unassigned/absent
+    moved: np.ndarray           # (u,) bool, before != after
+    project_ids: np.ndarray     # (p,) every project that appears in either snapshot
+    count_before: np.ndarray    # (p,) team size in the first snapshot
+    count_after: np.ndarray     # (p,) team size in the second snapshot
+    joined: np.ndarray          # (p,) students who moved onto the project
+    left: np.ndarray            # (p,) students who moved off the project
+
+def align(user_ids: np.ndarray, project_ids: np.ndarray, all_user_ids: np.ndarray) -> np.ndarray:
+    """Project ID of each of ``all_user_ids`` in a snapshot, 0 where the student is absent."""
+    aligned = np.zeros(all_user_ids.shape, dtype=np.int64)
+    pos = index_of(all_user_ids, user_ids)
+    aligned[pos] = project_ids
+    return aligned
+
+def merge_ids(user_ids_a: np.ndarray, user_ids_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Union of two sorted ID arrays, and each input's positions in it, in linear time.
+
+    A stable sort of two concatenated sorted runs is a single timsort merge.
+    """
+    both = np.concatenate([user_ids_a, user_ids_b])
+    order = np.argsort(both, kind="stable")
+    merged = both[order]
+    first = np.ones(merged.shape, dtype=bool)
+    first[1:] = merged[1:] != merged[:-1]
+    slot = np.empty(both.shape, dtype=np.int64)
+    slot[order] = np.cumsum(first) - 1
+    return merged[first], slot[:user_ids_a.shape[0]], slot[user_ids_a.shape[0]:]
+
+def project_slots(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted distinct project IDs of ``values`` and each value's index among them.
+
+    Buckets by ID offset, linear in ``values`` plus the ID span; falls back
+    to sorting when the IDs are too sparse for that.
+    """
+    if values.shape[0] == 0:
+        return values, values
+    lo, hi = int(values.min()), int(values.max())
+    if hi - lo > 4 * values.shape[0] + 1024:
+        return np.unique(values, return_inverse=True)
+    present = np.bincount(values - lo, minlength=hi - lo + 1) > 0
+    rank = np.cumsum(present) - 1
+    return np.flatnonzero(present) + lo, rank[values - lo]
+
+def diff_assignments(user_ids_a: np.ndarray, project_ids_a: np.ndarray, user_ids_b: np.ndarray, project_ids_b: np.ndarray) -> AssignmentDiff:
+    """Compare two snapshots element-wise after aligning them on user ID.
+
+    Snapshots store students sorted by ID, so when both hold the same
+    students the arrays are compared directly; otherwise they are merged.
+    Either way the diff is linear in the number of students.
+    """
+    if np.array_equal(user_ids_a, user_ids_b):
+        user_ids = user_ids_a
+        before = project_ids_a.astype(np.int64)
+        after = project_ids_b.astype(np.int64)
+    else:
+        user_ids, pos_a, pos_b = merge_ids(user_ids_a, user_ids_b)
+        before = np.zeros(user_ids.shape, dtype=np.int64)
+        after = np.zeros(user_ids.shape, dtype=np.int64)
+        before[pos_a] = project_ids_a
+        after[pos_b] = project_ids_b
+    moved = before != after
+
+    project_ids, slots = project_slots(np.concatenate([before, after]))
+    slot_before, slot_after = slots[:user_ids.shape[0]], slots[user_ids.shape[0]:]
+    p = project_ids.shape[0]
+    count_before = np.bincount(slot_before, minlength=p)
+    count_after = np.bincount(slot_after, minlength=p)
+    joined = np.bincount(slot_after[moved], minlength=p)
+    left = np.bincount(slot_before[moved], minlength=p)
+
+    # Drop the "unassigned" bucket from the per-project table.
+    keep = project_ids != 0
+    return AssignmentDiff(
+        user_ids=user_ids,
+        before=before,
+        after=after,
+        moved=moved,
+        project_ids=project_ids[keep],
+        count_before=count_before[keep],
+        count_after=count_after[keep],
+        joined=joined[keep],
+        left=left[keep],
+    )
@@ -0,0 +1,112 @@
+from typing import Callable, Dict, List, Optional
+from src.matching.problem import MatchingProblem, MatchingResult
+from src.matching.grouping import group_mutual_requests, singleton_groups, aggregate_by_group
+from src.matching.units import UnitProblem, ranked_candidates
+from src.matching.conflicts import blocked_projects, unit_conflicts
+from src.matching.deferred_acceptance import solve_deferred_acceptance
+from src.matching.scoring import utility_matrix, total_utility
+from src.model.matching import MatchingWeights
+import numpy as np
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+def solve_utility(unit_utility: np.ndarray, sizes: np.ndarray, capacities: np.ndarray, conflicts: Optional[List[List[int]]] = None) -> np.ndarray:
+    """Capacity-constrained assignment of units to projects, maximizing utility.
+
+    Units are placed largest first and, within a size, by regret (the gap
+    between their best and second-best project), each taking its best
+    project that still has room. With ``conflicts`` a unit also skips the
+    projects already holding a unit it conflicts with, and stays unplaced
+    if no other project has room. Returns a project index per unit or -1.
+    """
+    n_units, n_projects = unit_utility.shape
+    assignment = np.full(n_units, -1, dtype=np.int32)
+    if n_units == 0 or n_projects == 0:
+        return assignment
+
+    candidates = ranked_candidates(unit_utility)
+    if n_projects > 1:
+        best = np.take_along_axis(unit_utility, candidates[:, :2], axis=1)
+        regret = best[:, 0] - best[:, 1]
+    else:
+        regret = np.zeros(n_units, dtype=unit_utility.dtype)
+    order = np.lexsort((-regret, -sizes))
+
+    remaining = capacities.astype(np.int64)
+    unit_sizes = sizes.tolist()
+    candidate_lists = candidates.tolist()
+    for unit in order.tolist():
+        size = unit_sizes[unit]
+        blocked = blocked_projects(conflicts[unit], assignment) if conflicts and conflicts[unit] else []
+        project = next((p for p in candidate_lists[unit] if remaining[p] >= size and p not in blocked), -1)
+        if project < 0:
+            fits = remaining >= size
+            fits[blocked] = False
+            if not fits.any():
+                continue
+            project = int(np.argmax(np.where(fits, unit_utility[unit], -np.inf)))
+        assignment[unit] = project
+        remaining[project] -= size
+    return assignment
+
+def _utility_engine(units: UnitProblem) -> np.ndarray:
+    return solve_utility(units.unit_utility, units.groups.sizes, units.problem.capacities, units.conflicts)
+
+Engine = Callable[[UnitProblem], np.ndarray]
+
+ENGINES: Dict[str, Engine] = {
+    "utility": _utility_engine,
+    "deferred_acceptance": solve_deferred_acceptance,
+}
+
+def run_matching(
+    problem: MatchingProblem,
+    weights: MatchingWeights,
+    group_teammates: bool = True,
+    engine: str = "utility",
+    skill: Optional[np.ndarray] = None,
+) -> MatchingResult:
+    """Group students, solve the unit assignment and expand it back to students.
+
+    ``skill`` may carry a precomputed :func:`skill_scores` matrix for callers
+    that solve the same problem under several weightings.
+
+    Raises:
+        ValueError: If ``engine`` is not a registered engine name.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown matching engine: {engine}")
+
+    started = time.perf_counter()
+    if group_teammates:
+        groups = group_mutual_requests(problem)
+    else:
+        groups = singleton_groups(problem.n_students)
+    grouped = time.perf_counter()
+
+    utility = utility_matrix(problem, weights, skill)
+    # A group's teammate bonus is the same for every project, so it only
+    # enters the objective below and not the unit utility matrix.
+    unit_utility = aggregate_by_group(groups, utility)
+    scored = time.perf_counter()
+    conflicts = unit_conflicts(groups, problem.conflict_pairs) if problem.conflict_pairs.shape[0] else None
+    unit_assignment = ENGINES[engine](UnitProblem(problem, groups, weights, unit_utility, skill, conflicts))
+    assignment = unit_assignment[groups.labels]
+    solved = time.perf_counter()
+
+    result = MatchingResult(
+        assignment=assignment.astype(np.int32),
+        utility=total_utility(problem, weights, assignment, utility),
+        engine=engine,
+        n_units=groups.n_groups,
+        grouping_seconds=grouped - started,
+        scoring_seconds=scored - grouped,
+        solve_seconds=solved - scored,
+    )
+    logger.info(
+        f"Matched {result.n_assigned}/{problem.n_students} students as {result.n_units} units "
+        f"with engine '{engine}' in {result.solve_seconds * 1000:.1f} ms"
+    )
+    return result
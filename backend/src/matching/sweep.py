@@ -0,0 +1,115 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple
+from src.matching.problem import MatchingProblem
+from src.matching.scoring import skill_scores
+from src.matching.solver import run_matching
+from src.matching.metrics import first_choice_rate, skill_coverage
+from src.model.matching import MatchingWeights
+import numpy as np
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (shared memory block name, shape, dtype) for one array
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+@dataclass
+class SweepRow:
+    weights: MatchingWeights
+    utility: float
+    first_choice_rate: float
+    skill_coverage: float
+    n_unmatched: int
+
+class SharedProblem:
+    """Copies a problem's arrays (and its skill score matrix) into shared memory once.
+
+    Workers attach to the blocks by name, so each task only pickles a
+    weight vector. Use as a context manager; the blocks are unlinked on exit.
+    """
+
+    def __init__(self, problem: MatchingProblem):
+        self.course_id = problem.course_id
+        self.blocks: List[SharedMemory] = []
+        self.specs: Dict[str, ArraySpec] = {}
+        arrays = {f.name: getattr(problem, f.name) for f in fields(problem) if f.name != "course_id"}
+        arrays["skill"] = skill_scores(problem)
+        try:
+            for name, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                block = SharedMemory(create=True, size=max(array.nbytes, 1))
+                self.blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                self.specs[name] = (block.name, array.shape, array.dtype.str)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    def __enter__(self) -> "SharedProblem":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+# Per-worker state populated by _attach_worker.
+_worker_blocks: List[SharedMemory] = []
+_worker_problem: Optional[MatchingProblem] = None
+_worker_skill: Optional[np.ndarray] = None
+
+def _attach_worker(course_id: Optional[int], specs: Dict[str, ArraySpec]) -> None:
+    global _worker_problem, _worker_skill
+    arrays = {}
+    for field_name, (block_name, shape, dtype) in specs.items():
+        # Spawned workers share the parent's resource tracker, which unlinks
+        # the block only when the parent does.
+        block = SharedMemory(name=block_name)
+        _worker_blocks.append(block)
+        arrays[field_name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    _worker_skill = arrays.pop("skill")
+    _worker_problem = MatchingProblem(course_id=course_id, **arrays)
+
+def evaluate_weights(problem: MatchingProblem, weights: MatchingWeights, group_teammates: bool = True, skill: Optional[np.ndarray] = None) -> SweepRow:
+    """Solve one weighting and summarize the resulting assignment."""
+    result = run_matching(problem, weights, group_teammates=group_teammates, skill=skill)
+    return SweepRow(
+        weights=weights,
+        utility=result.utility,
+        first_choice_rate=first_choice_rate(problem, result.assignment),
+        skill_coverage=skill_coverage(problem, result.assignment),
+        n_unmatched=result.n_unmatched,
+    )
+
+def _evaluate_in_worker(weights: MatchingWeights, group_teammates: bool) -> SweepRow:
+    return evaluate_weights(_worker_problem, weights, group_teammates, _worker_skill)
+
+def sweep_weights(problem: MatchingProblem, grid: List[MatchingWeights], group_teammates: bool = True, max_workers: Optional[int] = None) -> List[SweepRow]:
+    """Evaluate every weight vector in ``grid`` across a process pool.
+
+    Rows come back in grid order. A single vector or a single worker is
+    evaluated in-process, skipping pool start-up.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(grid))
+    if workers <= 1:
+        skill = skill_scores(problem)
+        return [evaluate_weights(problem, weights, group_teammates, skill) for weights in grid]
+
+    with SharedProblem(problem) as shared:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn"),
+            initializer=_attach_worker,
+            initargs=(shared.course_id, shared.specs),
+        ) as pool:
+            rows = list(pool.map(_evaluate_in_worker, grid, [group_teammates] * len(grid)))
+    logger.info(f"Swept {len(grid)} weightings for course {problem.course_id} on {workers} workers")
+    return rows
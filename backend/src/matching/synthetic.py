@@ -0,0 +1,74 @@
+from typing import Optional
+from src.matching.problem import MatchingProblem
+import numpy as np
+
+def generate_cohort(
+    n_students: int,
+    n_projects: Optional[int] = None,
+    n_skills: int = 40,
+    group_fraction: float = 0.5,
+    one_way_fraction: float = 0.1,
+    conflict_density: float = 0.0,
+    seed: int = 0,
+) -> MatchingProblem:
+    """Generate a reproducible synthetic course for tests and benchmarks.
+
+    About ``group_fraction`` of the students belong to friend groups of two
+    to four who all request each other; another ``one_way_fraction`` make a
+    single unreciprocated request. Project popularity is skewed so that top
+    choices collide, and total capacity is roughly 110% of the cohort.
+    ``conflict_density`` adds that many random do-not-pair constraints per
+    student, e.g. 0.05 gives 50 constraints in a cohort of 1000.
+    """
+    rng = np.random.default_rng(seed)
+    if n_projects is None:
+        n_projects = max(1, n_students // 4)
+
+    capacities = rng.integers(3, 7, size=n_projects).astype(np.int32)
+    shortfall = int(np.ceil(n_students * 1.1)) - int(capacities.sum())
+    if shortfall > 0:
+        capacities += np.int32(-(-shortfall // n_projects))
+
+    user_skills = rng.random((n_students, n_skills)) < (5.0 / n_skills)
+    project_skills = rng.random((n_projects, n_skills)) < (3.5 / n_skills)
+
+    popularity = 1.0 / np.arange(1, n_projects + 1) ** 0.8
+    popularity /= popularity.sum()
+    preference_ranks = np.zeros((n_students, n_projects), dtype=np.int8)
+    n_choices = min(3, n_projects)
+    for student in range(n_students):
+        choices = rng.choice(n_projects, size=n_choices, replace=False, p=popularity)
+        preference_ranks[student, choices] = np.arange(1, n_choices + 1)
+
+    order = rng.permutation(n_students)
+    pairs = []
+    cursor, grouped = 0, int(n_students * group_fraction)
+    while cursor < grouped:
+        size = int(rng.integers(2, 5))
+        members = order[cursor:min(cursor + size, grouped)]
+        pairs.extend((a, b) for a in members for b in members if a != b)
+        cursor += size
+    loners = order[grouped:grouped + int(n_students * one_way_fraction)]
+    if loners.shape[0] and n_students > 1:
+        targets = rng.integers(0, n_students, size=loners.shape[0])
+        pairs.extend((a, b) for a, b in zip(loners, targets) if a != b)
+    teammate_pairs = np.array(pairs, dtype=np.int32).reshape(-1, 2)
+
+    conflict_pairs = np.empty((0, 2), dtype=np.int32)
+    n_conflicts = int(round(n_students * conflict_density))
+    if n_conflicts and n_students > 1:
+        drawn = np.sort(rng.integers(0, n_students, size=(n_conflicts, 2)), axis=1)
+        conflict_pairs = np.unique(drawn[drawn[:, 0] != drawn[:, 1]], axis=0).astype(np.int32)
+
+    return MatchingProblem(
+        course_id=None,
+        user_ids=np.arange(1, n_students + 1, dtype=np.int64),
+        project_ids=np.arange(1, n_projects + 1, dtype=np.int64),
+        skill_ids=np.arange(1, n_skills + 1, dtype=np.int64),
+        user_skills=user_skills,
+        project_skills=project_skills,
+        capacities=capacities,
+        preference_ranks=preference_ranks,
+        teammate_pairs=teammate_pairs,
+        conflict_pairs=conflict_pairs,
+    )
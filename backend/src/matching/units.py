@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from src.matching.grouping import StudentGroups
+from src.matching.problem import MatchingProblem
+from src.model.matching import MatchingWeights
+import numpy as np
+
+# Number of best projects pre-ranked per unit before falling back to a full scan.
+CANDIDATES_PER_UNIT = 16
+
+@dataclass
+class UnitProblem:
+    """Input of a matching engine: students collapsed into units placed as a whole.
+
+    ``unit_utility`` is the summed utility of each unit's members for each
+    project, excluding the teammate term; ``skill`` is the precomputed
+    per-student skill score matrix when the caller has one. ``conflicts``
+    lists, per unit, the units it must not share a project with; it is
+    None when the course has no do-not-pair constraints.
+    """
+    problem: MatchingProblem
+    groups: StudentGroups
+    weights: MatchingWeights
+    unit_utility: np.ndarray        # (k, m) float32
+    skill: Optional[np.ndarray] = None
+    conflicts: Optional[List[List[int]]] = None
+
+def ranked_candidates(unit_utility: np.ndarray, width: int = CANDIDATES_PER_UNIT) -> np.ndarray:
+    """Each unit's ``width`` best projects in descending utility, shape (k, width)."""
+    width = min(width, unit_utility.shape[1])
+    top = np.argpartition(-unit_utility, width - 1, axis=1)[:, :width]
+    order = np.argsort(-np.take_along_axis(unit_utility, top, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1)
@@ -0,0 +1,93 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import insert, update
+from src.matching.problem import MatchingProblem
+from src.model.project_user import ProjectUser
+from typing import List, Optional
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+def write_assignment(db: Session, problem: MatchingProblem, assignment: np.ndarray) -> int:
+    """Replace the course's ``project_users`` rows with ``assignment`` in one transaction.
+
+    Returns:
+        int: Number of project-user rows written.
+
+    Raises:
+        ValueError: If the write fails.
+    """
+    return write_assignments(db, [problem], [assignment])
+
+def write_assignments(db: Session, problems: List[MatchingProblem], assignments: List[np.ndarray], managers: Optional[List[np.ndarray]] = None) -> int:
+    """Replace the ``project_users`` rows of several courses with one DELETE and one INSERT.
+
+    When ``managers`` is given, each course's project managers are flagged
+    in the inserted rows directly.
+
+    Returns:
+        int: Number of project-user rows written.
+
+    Raises:
+        ValueError: If the write fails.
+    """
+    rows = []
+    for i, (problem, assignment) in enumerate(zip(problems, assignments)):
+        placed = np.flatnonzero(assignment >= 0)
+        is_manager = np.zeros(problem.n_students, dtype=bool)
+        if managers is not None:
+            is_manager[managers[i][managers[i] >= 0]] = True
+        rows.extend(
+            {"project_id": project_id, "user_id": user_id, "is_project_manager": manager}
+            for user_id, project_id, manager in zip(
+                problem.user_ids[placed].tolist(),
+                problem.project_ids[assignment[placed]].tolist(),
+                is_manager[placed].tolist(),
+            )
+        )
+    project_ids = [project_id for problem in problems for project_id in problem.project_ids.tolist()]
+    course_ids = [problem.course_id for problem in problems]
+    try:
+        if project_ids:
+            db.query(ProjectUser).filter(
+                ProjectUser.project_id.in_(project_ids)
+            ).delete(synchronize_session=False)
+        if rows:
+            db.execute(insert(ProjectUser), rows)
+        db.commit()
+        logger.info(f"Wrote {len(rows)} project-user assignments for courses {course_ids}")
+        return len(rows)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to write assignments for courses {course_ids}: {e}")
+        raise ValueError(f"Assignment write failed: {str(e)}")
+
+def write_managers(db: Session, problem: MatchingProblem, managers: np.ndarray) -> int:
+    """Flag each team's project manager with one bulk UPDATE over the course's rows.
+
+    Every other project-user row of the course is cleared in the same
+    statement.
+
+    Returns:
+        int: Number of managers designated.
+
+    Raises:
+        ValueError: If the update fails.
+    """
+    staffed = np.flatnonzero(managers >= 0)
+    manager_ids = problem.user_ids[managers[staffed]].tolist()
+    try:
+        if problem.n_projects:
+            db.execute(
+                update(ProjectUser)
+                .where(ProjectUser.project_id.in_(problem.project_ids.tolist()))
+                .values(is_project_manager=ProjectUser.user_id.in_(manager_ids))
+                .execution_options(synchronize_session=False)
+            )
+        db.commit()
+        logger.info(f"Designated {len(manager_ids)} project managers for course {problem.course_id}")
+        return len(manager_ids)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to designate project managers for course {problem.course_id}: {e}")
+        raise ValueError(f"Project manager designation failed: {str(e)}")
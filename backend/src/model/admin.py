@@ -0,0 +1,21 @@
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+
+# Pydantic Models
+class AdminSummaryResponse(BaseModel):
+    total_users: int
+    total_semesters: int
+    total_courses: int
+    total_projects: int
+    total_skills: int
+    total_project_skills: int
+    total_project_users: int
+    total_user_courses: int
+    total_user_skills: int
+    total_project_preferences: int
+    total_teammate_preferences: int
+    total_do_not_pairs: int
+    total_matching_runs: int
+    generated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,68 @@
+from sqlalchemy import Column, Integer, String, DateTime, LargeBinary, ForeignKey
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
+from datetime import datetime
+from src.config.base import Base
+
+# Pydantic Models
+class AssignmentSnapshotCreate(BaseModel):
+    course_id: int
+    label: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class AssignmentSnapshotResponse(BaseModel):
+    id: Optional[int] = None
+    course_id: int
+    label: Optional[str] = None
+    source: str
+    matching_run_id: Optional[int] = None
+    n_students: int
+    created_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class MovedStudent(BaseModel):
+    user_id: int
+    from_project_id: Optional[int] = None
+    to_project_id: Optional[int] = None
+
+class ProjectDelta(BaseModel):
+    project_id: int
+    before: int
+    after: int
+    joined: int
+    left: int
+
+class AssignmentSnapshotDiffResponse(BaseModel):
+    from_snapshot_id: int
+    to_snapshot_id: int
+    n_students: int
+    n_moved: int
+    moved: List[MovedStudent] = []
+    project_deltas: List[ProjectDelta] = []
+
+# SQLAlchemy Model
+class AssignmentSnapshot(Base):
+    """An immutable copy of a course's student-to-project assignment.
+
+    ``user_ids`` and ``project_ids`` are zlib-compressed int32 arrays of
+    equal length, sorted by user ID; a project ID of 0 means unassigned.
+    """
+    __tablename__ = "assignment_snapshots"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False, index=True)
+    label = Column(String(255), nullable=True)
+    source = Column(String(50), nullable=False)
+    matching_run_id = Column(Integer, ForeignKey("matching_runs.id", ondelete="SET NULL"), nullable=True, index=True)
+    n_students = Column(Integer, nullable=False)
+    user_ids = Column(LargeBinary(length=2**24), nullable=False)
+    project_ids = Column(LargeBinary(length=2**24), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    course = relationship("Course")
+    matching_run = relationship("MatchingRun")
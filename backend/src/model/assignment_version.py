@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from src.config.base import Base
+
+# SQLAlchemy Model
+class AssignmentVersion(Base):
+    """Monotonic counter bumped whenever a course's assignment or preferences change."""
+    __tablename__ = "assignment_versions"
+
+    course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
+from src.model.course import CourseResponse
+from src.model.semester import SemesterResponse
+from src.model.skill import SkillResponse
+from src.model.user import UserResponse
+from src.model.user_course import UserCourseResponse
+from src.model.user_skill import UserSkillResponse
+
+# Pydantic Models
+class BootstrapResponse(BaseModel):
+    user: Optional[UserResponse] = None
+    current_semester: Optional[SemesterResponse] = None
+    skills: List[SkillResponse] = []
+    courses: List[CourseResponse] = []
+    user_courses: List[UserCourseResponse] = []
+    user_skills: List[UserSkillResponse] = []
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,23 @@
+from pydantic import BaseModel, ConfigDict
+from typing import List
+
+# Pydantic Models
+class TeamCoverage(BaseModel):
+    project_id: int
+    team_size: int
+    required_skills: int
+    covered_skills: int
+    missing_skill_ids: List[int] = []
+    fully_covered: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+class CourseCoverageResponse(BaseModel):
+    course_id: int
+    n_teams: int
+    n_fully_covered: int
+    n_missing_skills: int
+    compute_ms: float
+    teams: List[TeamCoverage] = []
+
+    model_config = ConfigDict(from_attributes=True)
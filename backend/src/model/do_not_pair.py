@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
+from src.config.base import Base
+
+# Pydantic Models
+class DoNotPairCreate(BaseModel):
+    course_id: int
+    user_id: int
+    other_user_id: int
+    model_config = ConfigDict(from_attributes=True)
+
+class DoNotPairResponse(BaseModel):
+    id: Optional[int] = None
+    course_id: int
+    user_id: int
+    other_user_id: int
+    model_config = ConfigDict(from_attributes=True)
+
+# SQLAlchemy Model
+class DoNotPair(Base):
+    """Two students of a course who must not be placed on the same project.
+
+    The pair is unordered and stored with ``user_id < other_user_id``.
+    """
+    __tablename__ = "do_not_pairs"
+    __table_args__ = (UniqueConstraint("course_id", "user_id", "other_user_id", name="uq_do_not_pair"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    other_user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # Relationships
+    course = relationship("Course")
+    user = relationship("User", foreign_keys=[user_id])
+    other_user = relationship("User", foreign_keys=[other_user_id])
@@ -0,0 +1,252 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional
+
+# Upper bound on weight vectors evaluated by one sweep request, and so on each list a sweep request gives.
+MAX_SWEEP_SIZE = 256
+
+# Pydantic Models
+class MatchingWeights(BaseModel):
+    """Relative weight of each score component in the matching objective."""
+    skill: float = Field(1.0, ge=0)
+    preference: float = Field(1.0, ge=0)
+    teammate: float = Field(1.0, ge=0)
+
+    model_config = ConfigDict(from_attributes=True)
+
+class BalancePenalties(BaseModel):
+    """Weight of each skill-balance term the team balancer minimizes."""
+    missing_skill: float = Field(1.0, ge=0)
+    single_holder: float = Field(0.5, ge=0)
+    spread: float = Field(0.05, ge=0)
+
+    model_config = ConfigDict(from_attributes=True)
+
+class MatchingRunRequest(BaseModel):
+    weights: MatchingWeights = Field(default_factory=MatchingWeights)
+    group_teammates: bool = True
+    engine: str = Field("utility", description="'utility' to maximize total utility, 'deferred_acceptance' for a stable matching, 'anytime' to keep improving until the time budget")
+    time_budget_ms: int = Field(2000, ge=1, le=60000, description="Wall-clock budget of the 'anytime' engine")
+
+    model_config = ConfigDict(from_attributes=True)
+
+class MatchingAssignment(BaseModel):
+    user_id: int
+    project_id: Optional[int] = None
+    is_project_manager: bool = False
+
+    model_config = ConfigDict(from_attributes=True)
+
+class QualityPoint(BaseModel):
+    elapsed_ms: float
+    utility: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+class MatchingRunResponse(BaseModel):
+    run_id: Optional[int] = None
+    course_id: int
+    input_hash: str
+    cached: bool = False
+    engine: str
+    n_students: int
+    n_units: int
+    problem_reduction: float
+    n_assigned: int
+    n_unmatched: int
+    utility: float
+    grouping_ms: float
+    scoring_ms: float
+    solve_ms: float
+    curve: List[QualityPoint] = []
+    assignments: List[MatchingAssignment] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+class MatchingWeightGrid(BaseModel):
+    """Axes whose cartesian product forms a grid of weight vectors."""
+    skill: List[float] = Field(default_factory=lambda: [1.0], max_length=MAX_SWEEP_SIZE)
+    preference: List[float] = Field(default_factory=lambda: [1.0], max_length=MAX_SWEEP_SIZE)
+    teammate: List[float] = Field(default_factory=lambda: [1.0], max_length=MAX_SWEEP_SIZE)
+
+    model_config = ConfigDict(from_attributes=True)
+
+class MatchingSweepRequest(BaseModel):
+    weights: List[MatchingWeights] = Field(default_factory=list, max_length=MAX_SWEEP_SIZE)
+    grid: Optional[MatchingWeightGrid] = None
+    group_teammates: bool = True
+    max_workers: Optional[int] = Field(None, ge=1)
+
+    model_config = ConfigDict(from_attributes=True)
+
+class MatchingSweepRow(BaseModel):
+    skill: float
+    preference: float
+    teammate: float
+    utility: float
+    first_choice_rate: float
+    skill_coverage: float
+    n_unmatched: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+class MatchingSweepResponse(BaseModel):
+    course_id: int
+    n_students: int
+    elapsed_ms: float
+    rows: List[MatchingSweepRow] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+class MatchExplanation(BaseModel):
+    """Why a student was placed where they were, from a run's cached score components."""
+    user_id: int
+    project_id: Optional[int] = None
+    preference_rank: Optional[int] = None
+    skill_score: float
+    matched_skills: int
+    required_skills: int
+    teammates_requested: int
+    teammates_satisfied: int
+    utility: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+class ProjectMatchExplanation(BaseModel):
+    run_id: int
+    project_id: int
+    members: List[MatchExplanation] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectFill(BaseModel):
+    project_id: int
+    capacity: int
+    filled: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+class AssignmentMetricsResponse(BaseModel):
+    """Quality of a course's current project-user assignment."""
+    course_id: int
+    assignment_version: int
+    n_students: int
+    n_assigned: int
+    first_choice: int
+    second_choice: int
+    third_choice: int
+    unranked: int
+    unassigned: int
+    top_choice_rate: float
+    utility_gini: float
+    mean_utility: float
+    capacity: int
+    capacity_fill: float
+    projects: List[ProjectFill] = []
+    unmet_teammate_pairs: int
+    unmet_mutual_pairs: int
+    violated_do_not_pairs: int = 0
+    compute_ms: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MatchingBalanceRequest(BaseModel):
+    weights: MatchingWeights = Field(default_factory=MatchingWeights)
+    penalties: BalancePenalties = Field(default_factory=BalancePenalties)
+    time_budget_ms: int = Field(500, ge=1, le=60000)
+    seed: int = 0
+    apply: bool = True
+
+    model_config = ConfigDict(from_attributes=True)
+
+class BalanceTracePoint(BaseModel):
+    elapsed_ms: float
+    objective: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+class MatchingBalanceResponse(BaseModel):
+    """Outcome of a local-search balancing pass over a course's current assignment."""
+    course_id: int
+    applied: bool
+    n_students: int
+    objective_before: float
+    objective_after: float
+    n_evaluated: int
+    n_moves: int
+    n_swaps: int
+    elapsed_ms: float
+    trace: List[BalanceTracePoint] = []
+    changes: List[MatchingAssignment] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectManagerDesignation(BaseModel):
+    project_id: int
+    user_id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+class ProjectManagerResponse(BaseModel):
+    course_id: int
+    n_teams: int
+    managers: List[ProjectManagerDesignation] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AssignmentImportRequest(BaseModel):
+    """A complete course assignment, e.g. one produced offline from a problem archive.
+
+    Enrolled students missing from ``assignments``, and rows whose
+    ``project_id`` is null, are left unassigned. If no row is flagged as
+    project manager, managers are designated automatically.
+    """
+    label: Optional[str] = None
+    assignments: List[MatchingAssignment] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+class AssignmentImportResponse(BaseModel):
+    course_id: int
+    snapshot_id: int
+    n_students: int
+    n_assigned: int
+    n_unmatched: int
+    n_project_managers: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SemesterMatchingRequest(MatchingRunRequest):
+    max_workers: Optional[int] = Field(None, ge=1, le=64)
+
+class CourseMatchingSummary(BaseModel):
+    course_id: int
+    run_id: Optional[int] = None
+    cached: bool = False
+    n_students: int
+    n_assigned: int
+    utility: float
+    load_ms: float
+    solve_ms: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+class SemesterMatchingResponse(BaseModel):
+    """Outcome of matching every course of a semester; stage times are wall-clock for the whole semester."""
+    semester_id: int
+    engine: str
+    n_courses: int
+    n_students: int
+    n_assigned: int
+    max_workers: int
+    load_ms: float
+    solve_ms: float
+    write_ms: float
+    elapsed_ms: float
+    courses: List[CourseMatchingSummary] = []
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, JSON, LargeBinary, ForeignKey
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from src.config.base import Base
+
+# SQLAlchemy Model
+class MatchingRun(Base):
+    """A solved matching run, keyed by a hash of everything that went into it.
+
+    ``user_ids`` and ``assignment`` are zlib-compressed little-endian int32
+    arrays of equal length; ``assignment`` holds the project ID for each
+    student, or 0 if the student was left unmatched. ``explanation`` holds
+    the per-student score components (see src.matching.explain).
+    """
+    __tablename__ = "matching_runs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False, index=True)
+    input_hash = Column(String(64), nullable=False, index=True)
+    engine = Column(String(50), nullable=False)
+    weights = Column(JSON, nullable=False)
+    group_teammates = Column(Boolean, nullable=False, default=True)
+    user_ids = Column(LargeBinary(length=2**24), nullable=False)
+    assignment = Column(LargeBinary(length=2**24), nullable=False)
+    explanation = Column(LargeBinary(length=2**24), nullable=True)
+    utility = Column(Float, nullable=False)
+    n_units = Column(Integer, nullable=False)
+    grouping_ms = Column(Float, nullable=False, default=0.0)
+    scoring_ms = Column(Float, nullable=False, default=0.0)
+    solve_ms = Column(Float, nullable=False, default=0.0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    course = relationship("Course")
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+from src.config.base import Base
+
+# Pydantic Models
+class ProjectPreferenceCreate(BaseModel):
+    user_id: int
+    project_id: int
+    rank: int = Field(..., ge=1, le=3)
+    model_config = ConfigDict(from_attributes=True)
+
+class ProjectPreferenceResponse(BaseModel):
+    id: Optional[int] = None
+    user_id: int
+    project_id: int
+    rank: int
+    model_config = ConfigDict(from_attributes=True)
+
+# SQLAlchemy Model
+class ProjectPreference(Base):
+    """A student's ranked project choice (1 = top choice, up to 3).
+
+    A student ranks a project at most once. Ranks are per course, so the
+    service checks that no other project of the same course has the rank.
+    """
+    __tablename__ = "project_preferences"
+    __table_args__ = (UniqueConstraint("user_id", "project_id", name="uq_project_preference_user_project"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    rank = Column(Integer, nullable=False)
+
+    # Relationships
+    user = relationship("User")
+    project = relationship("Project")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, Boolean, ForeignKey, false
 from sqlalchemy.orm import relationship
 from pydantic import BaseModel, ConfigDict
 from typing import Optional
@@ -8,12 +8,14 @@ from src.config.base import Base
 class ProjectUserCreate(BaseModel):
     project_id: int
     user_id: int
+    is_project_manager: bool = False
     model_config = ConfigDict(from_attributes=True)
 
 class ProjectUserResponse(BaseModel):
     id: Optional[int] = None
     project_id: int
     user_id: int
+    is_project_manager: bool = False
     model_config = ConfigDict(from_attributes=True)
 
 # SQLAlchemy Model
@@ -23,6 +25,7 @@ class ProjectUser(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    is_project_manager = Column(Boolean, nullable=False, default=False, server_default=false())
 
     # Relationships
     project = relationship("Project", back_populates="project_users")
@@ -0,0 +1,57 @@
+from pydantic import BaseModel, ConfigDict
+from typing import List
+
+# Pydantic Models
+class ProjectRecommendation(BaseModel):
+    project_id: int
+    course_id: int
+    title: str
+    score: float
+    matching_skill_ids: List[int] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+class ProjectRecommendationsResponse(BaseModel):
+    user_id: int
+    n_scored: int
+    compute_ms: float
+    projects: List[ProjectRecommendation] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+class CandidateStudent(BaseModel):
+    user_id: int
+    username: str
+    score: float
+    matching_skill_ids: List[int] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+class CandidateStudentsResponse(BaseModel):
+    project_id: int
+    course_id: int
+    n_enrolled: int
+    n_eligible: int
+    compute_ms: float
+    candidates: List[CandidateStudent] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+class TeammateSuggestion(BaseModel):
+    user_id: int
+    username: str
+    score: float
+    shared_skill_ids: List[int] = []
+    new_skill_ids: List[int] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+class TeammateSuggestionsResponse(BaseModel):
+    user_id: int
+    course_id: int
+    mode: str
+    n_compared: int
+    compute_ms: float
+    suggestions: List[TeammateSuggestion] = []
+
+    model_config = ConfigDict(from_attributes=True)
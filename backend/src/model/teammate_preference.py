@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
+from src.config.base import Base
+
+# Pydantic Models
+class TeammatePreferenceCreate(BaseModel):
+    user_id: int
+    teammate_id: int
+    model_config = ConfigDict(from_attributes=True)
+
+class TeammatePreferenceResponse(BaseModel):
+    id: Optional[int] = None
+    user_id: int
+    teammate_id: int
+    model_config = ConfigDict(from_attributes=True)
+
+# SQLAlchemy Model
+class TeammatePreference(Base):
+    """A student's request to be placed on the same team as another student."""
+    __tablename__ = "teammate_preferences"
+    __table_args__ = (UniqueConstraint("user_id", "teammate_id", name="uq_teammate_preference_pair"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    teammate_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # Relationships
+    user = relationship("User", foreign_keys=[user_id])
+    teammate = relationship("User", foreign_keys=[teammate_id])
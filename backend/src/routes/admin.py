@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from src.services.admin_service import AdminService
+from src.dependencies.dependencies import get_admin_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+@router.get("/summary")
+def get_admin_summary(admin_service: AdminService = Depends(get_admin_service)):
+    """Get the totals shown on the admin dashboard in one request."""
+    summary = admin_service.get_summary()
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": summary.model_dump(mode='json'), "error": None}
+    )
@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from src.model.assignment_snapshot import AssignmentSnapshotCreate, AssignmentSnapshotResponse
+from src.services.assignment_snapshot_service import AssignmentSnapshotService
+from src.dependencies.dependencies import get_assignment_snapshot_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/assignment-snapshots", tags=["assignment-snapshots"])
+
+@router.post("/", status_code=201)
+def create_assignment_snapshot(
+    snapshot: AssignmentSnapshotCreate,
+    assignment_snapshot_service: AssignmentSnapshotService = Depends(get_assignment_snapshot_service)
+):
+    """Snapshot a course's current project-user assignments."""
+    try:
+        created_snapshot = assignment_snapshot_service.create_snapshot_from_current(snapshot)
+        if not created_snapshot:
+            logger.warning(f"Course with ID {snapshot.course_id} not found for snapshot")
+            return JSONResponse(
+                status_code=404,
+                content={"success": False, "data": None, "error": "Course not found"}
+            )
+        return JSONResponse(
+            status_code=201,
+            content={"success": True, "data": created_snapshot.model_dump(mode='json'), "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Assignment snapshot creation failed: {e}")
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+
+@router.get("/diff")
+def diff_assignment_snapshots(
+    from_id: int = Query(..., description="ID of the baseline snapshot"),
+    to_id: int = Query(..., description="ID of the snapshot to compare"),
+    assignment_snapshot_service: AssignmentSnapshotService = Depends(get_assignment_snapshot_service)
+):
+    """List the students who moved between two snapshots and the per-project changes."""
+    diff = assignment_snapshot_service.diff_snapshots(from_id, to_id)
+    if not diff:
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "Assignment snapshot not found"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": diff.model_dump(mode='json'), "error": None}
+    )
+
+@router.get("/by-course/{course_id}")
+def get_assignment_snapshots_by_course(
+    course_id: int,
+    skip: int = Query(0, ge=0, description="Number of snapshots to skip"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of snapshots to return"),
+    assignment_snapshot_service: AssignmentSnapshotService = Depends(get_assignment_snapshot_service)
+):
+    """List a course's assignment snapshots, newest first."""
+    snapshots = assignment_snapshot_service.get_snapshots_by_course(course_id=course_id, skip=skip, limit=limit)
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": [AssignmentSnapshotResponse.model_validate(s).model_dump(mode='json') for s in snapshots], "error": None}
+    )
+
+@router.get("/{snapshot_id}")
+def get_assignment_snapshot(
+    snapshot_id: int,
+    assignment_snapshot_service: AssignmentSnapshotService = Depends(get_assignment_snapshot_service)
+):
+    """Retrieve an assignment snapshot's metadata by ID."""
+    snapshot = assignment_snapshot_service.get_snapshot_by_id(snapshot_id)
+    if not snapshot:
+        logger.warning(f"Assignment snapshot with ID {snapshot_id} not found")
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "Assignment snapshot not found"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": snapshot.model_dump(mode='json'), "error": None}
+    )
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Request
+from src.core.etag import etag_response
+from src.services.bootstrap_service import BootstrapService
+from src.dependencies.dependencies import get_bootstrap_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["bootstrap"])
+
+# The response depends on the session cookie, so only the user's own browser may reuse it, after
+# revalidating. Vary is set here rather than left to the session middleware, whose Vary handling
+# differs between Starlette versions; a repeated Cookie token is harmless.
+BOOTSTRAP_CACHE_HEADERS = {"Cache-Control": "private, no-cache", "Vary": "Cookie"}
+
+@router.get("/api/bootstrap")
+def get_bootstrap(request: Request, bootstrap_service: BootstrapService = Depends(get_bootstrap_service)):
+    """Get the signed-in user, current semester, skills and courses in one request.
+    
+    The response carries an ETag; a request whose If-None-Match matches it gets 304 Not Modified.
+    """
+    bootstrap = bootstrap_service.get_bootstrap(request.session.get('username'))
+    return etag_response(
+        request,
+        {"success": True, "data": bootstrap.model_dump(mode='json'), "error": None},
+        headers=BOOTSTRAP_CACHE_HEADERS,
+    )
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from src.model.course import CourseCreate, CourseResponse
 from src.services.course_service import CourseService
-from src.dependencies.dependencies import get_course_service
+from src.services.grouped_count_service import parse_ids
+from src.dependencies.dependencies import get_course_service, not_modified
 from typing import List, Optional
 import logging
 
@@ -29,20 +30,23 @@ def create_course(
             content={"success": False, "data": None, "error": str(e)}
         )
 
-@router.get("/")
+@router.get("/", dependencies=[not_modified("courses")])
 def list_courses(
     skip: int = Query(0, ge=0, description="Number of courses to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of courses to return"),
+    fetch_all: bool = Query(False, alias="all", description="Stream every course in one response, ignoring skip and limit"),
     course_service: CourseService = Depends(get_course_service)
 ):
     """List all courses with pagination."""
+    if fetch_all:
+        return StreamingResponse(course_service.stream_courses(), media_type="application/json")
     courses = course_service.list_courses(skip=skip, limit=limit)
     return JSONResponse(
         status_code=200,
         content={"success": True, "data": [CourseResponse.model_validate(c).model_dump(mode='json') for c in courses], "error": None}
     )
 
-@router.get("/count")
+@router.get("/count", dependencies=[not_modified("courses")])
 def get_courses_count(course_service: CourseService = Depends(get_course_service)):
     """Get the total number of courses."""
     count = course_service.get_courses_count()
@@ -51,7 +55,26 @@ def get_courses_count(course_service: CourseService = Depends(get_course_service
         content={"success": True, "data": {"total_courses": count}, "error": None}
     )
 
-@router.get("/search")
+@router.get("/count/by-semester", dependencies=[not_modified("courses")])
+def get_courses_count_by_semesters(
+    ids: Optional[str] = Query(None, description="Comma-separated semester IDs; every semester with courses if omitted"),
+    course_service: CourseService = Depends(get_course_service)
+):
+    """Get the number of courses of many semesters from one grouped query."""
+    try:
+        counts = course_service.get_courses_count_by_semesters(parse_ids(ids))
+    except ValueError as e:
+        logger.error(f"Grouped courses count failed: {e}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": {"total_courses": counts}, "error": None}
+    )
+
+@router.get("/search", dependencies=[not_modified("courses")])
 def search_courses(
     q: str = Query(..., description="Search term for course display name or CRN"),
     skip: int = Query(0, ge=0, description="Number of courses to skip"),
@@ -65,7 +88,7 @@ def search_courses(
         content={"success": True, "data": [CourseResponse.model_validate(c).model_dump(mode='json') for c in courses], "error": None}
     )
 
-@router.get("/by-semester/{semester_id}")
+@router.get("/by-semester/{semester_id}", dependencies=[not_modified("courses")])
 def get_courses_by_semester(
     semester_id: int,
     skip: int = Query(0, ge=0, description="Number of courses to skip"),
@@ -79,7 +102,7 @@ def get_courses_by_semester(
         content={"success": True, "data": [CourseResponse.model_validate(c).model_dump(mode='json') for c in courses], "error": None}
     )
 
-@router.get("/by-semester/{semester_id}/count")
+@router.get("/by-semester/{semester_id}/count", dependencies=[not_modified("courses")])
 def get_courses_count_by_semester(
     semester_id: int,
     course_service: CourseService = Depends(get_course_service)
@@ -91,7 +114,7 @@ def get_courses_count_by_semester(
         content={"success": True, "data": {"total_courses": count, "semester_id": semester_id}, "error": None}
     )
 
-@router.get("/without-semester")
+@router.get("/without-semester", dependencies=[not_modified("courses")])
 def get_courses_without_semester(
     skip: int = Query(0, ge=0, description="Number of courses to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of courses to return"),
@@ -104,7 +127,7 @@ def get_courses_without_semester(
         content={"success": True, "data": [CourseResponse.model_validate(c).model_dump(mode='json') for c in courses], "error": None}
     )
 
-@router.get("/{course_id}")
+@router.get("/{course_id}", dependencies=[not_modified("courses")])
 def get_course(
     course_id: int, 
     course_service: CourseService = Depends(get_course_service)
@@ -122,7 +145,7 @@ def get_course(
         content={"success": True, "data": CourseResponse.model_validate(course).model_dump(mode='json'), "error": None}
     )
 
-@router.get("/by-crn/{crn}")
+@router.get("/by-crn/{crn}", dependencies=[not_modified("courses")])
 def get_course_by_crn(
     crn: str, 
     course_service: CourseService = Depends(get_course_service)
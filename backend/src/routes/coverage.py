@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from src.services.coverage_service import CoverageService
+from src.dependencies.dependencies import get_coverage_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/coverage", tags=["coverage"])
+
+@router.get("/by-course/{course_id}")
+def get_course_coverage(
+    course_id: int,
+    refresh: bool = Query(False, description="Recompute instead of serving the report cached after the last assignment change"),
+    coverage_service: CoverageService = Depends(get_coverage_service)
+):
+    """Get the required skills each team in a course is missing."""
+    coverage = coverage_service.get_course_coverage(course_id, refresh=refresh)
+    if not coverage:
+        logger.warning(f"Course with ID {course_id} not found for coverage")
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "Course not found"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": coverage.model_dump(mode='json'), "error": None}
+    )
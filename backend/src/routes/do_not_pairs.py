@@ -0,0 +1,106 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from src.model.do_not_pair import DoNotPairCreate, DoNotPairResponse
+from src.services.do_not_pair_service import DoNotPairService
+from src.dependencies.dependencies import get_do_not_pair_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/do-not-pairs", tags=["do-not-pairs"])
+
+@router.post("/", status_code=201)
+def create_do_not_pair(
+    pair: DoNotPairCreate,
+    do_not_pair_service: DoNotPairService = Depends(get_do_not_pair_service)
+):
+    """Record that two students of a course must not be placed on the same project."""
+    try:
+        created_pair = do_not_pair_service.create_do_not_pair(pair)
+        return JSONResponse(
+            status_code=201,
+            content={"success": True, "data": DoNotPairResponse.model_validate(created_pair).model_dump(mode='json'), "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Do-not-pair creation failed: {e}")
+        return JSONResponse(
+            status_code=409,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+
+@router.get("/")
+def list_do_not_pairs(
+    skip: int = Query(0, ge=0, description="Number of do-not-pair constraints to skip"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of do-not-pair constraints to return"),
+    do_not_pair_service: DoNotPairService = Depends(get_do_not_pair_service)
+):
+    """List all do-not-pair constraints with pagination."""
+    pairs = do_not_pair_service.list_do_not_pairs(skip=skip, limit=limit)
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": [DoNotPairResponse.model_validate(p).model_dump(mode='json') for p in pairs], "error": None}
+    )
+
+@router.get("/count")
+def get_do_not_pairs_count(do_not_pair_service: DoNotPairService = Depends(get_do_not_pair_service)):
+    """Get the total number of do-not-pair constraints."""
+    count = do_not_pair_service.get_do_not_pairs_count()
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": {"total_do_not_pairs": count}, "error": None}
+    )
+
+@router.get("/by-course/{course_id}")
+def get_do_not_pairs_by_course(
+    course_id: int,
+    do_not_pair_service: DoNotPairService = Depends(get_do_not_pair_service)
+):
+    """Get every do-not-pair constraint of a course."""
+    pairs = do_not_pair_service.get_do_not_pairs_by_course(course_id=course_id)
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": [DoNotPairResponse.model_validate(p).model_dump(mode='json') for p in pairs], "error": None}
+    )
+
+@router.get("/{pair_id}")
+def get_do_not_pair(
+    pair_id: int,
+    do_not_pair_service: DoNotPairService = Depends(get_do_not_pair_service)
+):
+    """Retrieve a do-not-pair constraint by ID."""
+    pair = do_not_pair_service.get_do_not_pair_by_id(pair_id)
+    if not pair:
+        logger.warning(f"Do-not-pair constraint with ID {pair_id} not found")
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "Do-not-pair constraint not found"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": DoNotPairResponse.model_validate(pair).model_dump(mode='json'), "error": None}
+    )
+
+@router.delete("/{pair_id}")
+def delete_do_not_pair(
+    pair_id: int,
+    do_not_pair_service: DoNotPairService = Depends(get_do_not_pair_service)
+):
+    """Delete a do-not-pair constraint by ID."""
+    try:
+        deleted = do_not_pair_service.delete_do_not_pair(pair_id)
+        if not deleted:
+            logger.warning(f"Do-not-pair constraint with ID {pair_id} not found for deletion")
+            return JSONResponse(
+                status_code=404,
+                content={"success": False, "data": None, "error": "Do-not-pair constraint not found"}
+            )
+        return JSONResponse(
+            status_code=200,
+            content={"success": True, "data": {"message": f"Do-not-pair constraint with ID {pair_id} deleted successfully"}, "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Deletion failed for do-not-pair constraint {pair_id}: {e}")
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "data": None, "error": str(e)}
+        )
@@ -0,0 +1,237 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from src.model.matching import MatchingRunRequest, MatchingSweepRequest, MatchingWeights, MatchingBalanceRequest, AssignmentImportRequest, SemesterMatchingRequest
+from src.services.matching_service import MatchingService
+from src.dependencies.dependencies import get_matching_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/matching", tags=["matching"])
+
+@router.post("/courses/{course_id}/run")
+def run_course_matching(
+    course_id: int,
+    request: MatchingRunRequest = MatchingRunRequest(),
+    matching_service: MatchingService = Depends(get_matching_service)
+):
+    """Match a course's students to its projects and replace its project-user assignments."""
+    try:
+        run = matching_service.run_course_matching(course_id, request)
+        if not run:
+            logger.warning(f"Course with ID {course_id} not found for matching")
+            return JSONResponse(
+                status_code=404,
+                content={"success": False, "data": None, "error": "Course not found"}
+            )
+        return JSONResponse(
+            status_code=200,
+            content={"success": True, "data": run.model_dump(mode='json'), "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Matching failed for course {course_id}: {e}")
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+
+@router.post("/semesters/{semester_id}/run")
+def run_semester_matching(
+    semester_id: int,
+    request: SemesterMatchingRequest = SemesterMatchingRequest(),
+    matching_service: MatchingService = Depends(get_matching_service)
+):
+    """Match every course of a semester in parallel and replace their project-user assignments."""
+    try:
+        run = matching_service.run_semester_matching(semester_id, request)
+        if not run:
+            logger.warning(f"Semester with ID {semester_id} not found for matching")
+            return JSONResponse(
+                status_code=404,
+                content={"success": False, "data": None, "error": "Semester not found"}
+            )
+        return JSONResponse(
+            status_code=200,
+            content={"success": True, "data": run.model_dump(mode='json'), "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Matching failed for semester {semester_id}: {e}")
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+
+@router.post("/courses/{course_id}/sweep")
+def sweep_course_weights(
+    course_id: int,
+    request: MatchingSweepRequest,
+    matching_service: MatchingService = Depends(get_matching_service)
+):
+    """Compare matching outcomes for a grid of weightings without changing assignments."""
+    try:
+        sweep = matching_service.sweep_course_weights(course_id, request)
+        if not sweep:
+            logger.warning(f"Course with ID {course_id} not found for weight sweep")
+            return JSONResponse(
+                status_code=404,
+                content={"success": False, "data": None, "error": "Course not found"}
+            )
+        return JSONResponse(
+            status_code=200,
+            content={"success": True, "data": sweep.model_dump(mode='json'), "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Weight sweep failed for course {course_id}: {e}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+
+@router.post("/courses/{course_id}/balance")
+def balance_course(
+    course_id: int,
+    request: MatchingBalanceRequest = MatchingBalanceRequest(),
+    matching_service: MatchingService = Depends(get_matching_service)
+):
+    """Even out skills across a course's current teams with a time-boxed swap/move search."""
+    try:
+        balance = matching_service.balance_course(course_id, request)
+        if not balance:
+            logger.warning(f"Course with ID {course_id} not found for balancing")
+            return JSONResponse(
+                status_code=404,
+                content={"success": False, "data": None, "error": "Course not found"}
+            )
+        return JSONResponse(
+            status_code=200,
+            content={"success": True, "data": balance.model_dump(mode='json'), "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Balancing failed for course {course_id}: {e}")
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+
+@router.post("/courses/{course_id}/assignments/import")
+def import_course_assignment(
+    course_id: int,
+    request: AssignmentImportRequest,
+    matching_service: MatchingService = Depends(get_matching_service)
+):
+    """Replace a course's project-user assignments in bulk, e.g. with one computed offline."""
+    try:
+        imported = matching_service.import_course_assignment(course_id, request)
+        if not imported:
+            logger.warning(f"Course with ID {course_id} not found for assignment import")
+            return JSONResponse(
+                status_code=404,
+                content={"success": False, "data": None, "error": "Course not found"}
+            )
+        return JSONResponse(
+            status_code=200,
+            content={"success": True, "data": imported.model_dump(mode='json'), "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Assignment import failed for course {course_id}: {e}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+
+@router.post("/courses/{course_id}/project-managers")
+def designate_project_managers(
+    course_id: int,
+    matching_service: MatchingService = Depends(get_matching_service)
+):
+    """Pick one project manager per team of a course by skill breadth and preference."""
+    try:
+        designation = matching_service.designate_project_managers(course_id)
+        if not designation:
+            logger.warning(f"Course with ID {course_id} not found for project manager designation")
+            return JSONResponse(
+                status_code=404,
+                content={"success": False, "data": None, "error": "Course not found"}
+            )
+        return JSONResponse(
+            status_code=200,
+            content={"success": True, "data": designation.model_dump(mode='json'), "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Project manager designation failed for course {course_id}: {e}")
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+
+@router.get("/courses/{course_id}/metrics")
+def get_assignment_metrics(
+    course_id: int,
+    skill: float = Query(1.0, ge=0),
+    preference: float = Query(1.0, ge=0),
+    teammate: float = Query(1.0, ge=0),
+    matching_service: MatchingService = Depends(get_matching_service)
+):
+    """Report preference, fairness, capacity and teammate metrics for a course's current assignment."""
+    weights = MatchingWeights(skill=skill, preference=preference, teammate=teammate)
+    metrics = matching_service.get_assignment_metrics(course_id, weights)
+    if not metrics:
+        logger.warning(f"Course with ID {course_id} not found for assignment metrics")
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "Course not found"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": metrics.model_dump(mode='json'), "error": None}
+    )
+
+@router.get("/runs/{run_id}/projects/{project_id}/explain")
+def explain_project(
+    run_id: int,
+    project_id: int,
+    matching_service: MatchingService = Depends(get_matching_service)
+):
+    """Explain the placement of every student a run put on a project."""
+    try:
+        explanation = matching_service.explain_project(run_id, project_id)
+    except ValueError as e:
+        logger.error(f"Explanation failed for run {run_id}, project {project_id}: {e}")
+        return JSONResponse(
+            status_code=409,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+    if not explanation:
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "Matching run not found"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": explanation.model_dump(mode='json'), "error": None}
+    )
+
+@router.get("/runs/{run_id}/explain/{user_id}")
+def explain_student(
+    run_id: int,
+    user_id: int,
+    matching_service: MatchingService = Depends(get_matching_service)
+):
+    """Explain why a run placed a student on their project."""
+    try:
+        explanation = matching_service.explain_student(run_id, user_id)
+    except ValueError as e:
+        logger.error(f"Explanation failed for run {run_id}, user {user_id}: {e}")
+        return JSONResponse(
+            status_code=409,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+    if not explanation:
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "Matching run or student not found"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": explanation.model_dump(mode='json'), "error": None}
+    )
@@ -0,0 +1,132 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from src.model.project_preference import ProjectPreferenceCreate, ProjectPreferenceResponse
+from src.services.project_preference_service import ProjectPreferenceService
+from src.dependencies.dependencies import get_project_preference_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/project-preferences", tags=["project-preferences"])
+
+@router.post("/", status_code=201)
+def create_project_preference(
+    preference: ProjectPreferenceCreate,
+    project_preference_service: ProjectPreferenceService = Depends(get_project_preference_service)
+):
+    """Create a ranked project choice for a student."""
+    try:
+        created_preference = project_preference_service.create_project_preference(preference)
+        return JSONResponse(
+            status_code=201,
+            content={"success": True, "data": ProjectPreferenceResponse.model_validate(created_preference).model_dump(mode='json'), "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Project preference creation failed: {e}")
+        return JSONResponse(
+            status_code=409,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+
+@router.get("/")
+def list_project_preferences(
+    skip: int = Query(0, ge=0, description="Number of project preferences to skip"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of project preferences to return"),
+    project_preference_service: ProjectPreferenceService = Depends(get_project_preference_service)
+):
+    """List all project preferences with pagination."""
+    preferences = project_preference_service.list_project_preferences(skip=skip, limit=limit)
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": [ProjectPreferenceResponse.model_validate(p).model_dump(mode='json') for p in preferences], "error": None}
+    )
+
+@router.get("/count")
+def get_project_preferences_count(project_preference_service: ProjectPreferenceService = Depends(get_project_preference_service)):
+    """Get the total number of project preferences."""
+    count = project_preference_service.get_project_preferences_count()
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": {"total_project_preferences": count}, "error": None}
+    )
+
+@router.get("/by-user/{user_id}")
+def get_project_preferences_by_user(
+    user_id: int,
+    project_preference_service: ProjectPreferenceService = Depends(get_project_preference_service)
+):
+    """Get a student's ranked project choices."""
+    preferences = project_preference_service.get_project_preferences_by_user(user_id=user_id)
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": [ProjectPreferenceResponse.model_validate(p).model_dump(mode='json') for p in preferences], "error": None}
+    )
+
+@router.get("/by-project/{project_id}")
+def get_project_preferences_by_project(
+    project_id: int,
+    skip: int = Query(0, ge=0, description="Number of project preferences to skip"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of project preferences to return"),
+    project_preference_service: ProjectPreferenceService = Depends(get_project_preference_service)
+):
+    """Get all preferences that rank a specific project."""
+    preferences = project_preference_service.get_project_preferences_by_project(project_id=project_id, skip=skip, limit=limit)
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": [ProjectPreferenceResponse.model_validate(p).model_dump(mode='json') for p in preferences], "error": None}
+    )
+
+@router.get("/count/by-project/{project_id}")
+def get_project_preferences_count_by_project(
+    project_id: int,
+    project_preference_service: ProjectPreferenceService = Depends(get_project_preference_service)
+):
+    """Get the number of students who ranked a specific project."""
+    count = project_preference_service.get_project_preferences_count_by_project(project_id=project_id)
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": {"total_project_preferences": count}, "error": None}
+    )
+
+@router.get("/{preference_id}")
+def get_project_preference(
+    preference_id: int,
+    project_preference_service: ProjectPreferenceService = Depends(get_project_preference_service)
+):
+    """Retrieve a project preference by ID."""
+    preference = project_preference_service.get_project_preference_by_id(preference_id)
+    if not preference:
+        logger.warning(f"Project preference with ID {preference_id} not found")
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "Project preference not found"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": ProjectPreferenceResponse.model_validate(preference).model_dump(mode='json'), "error": None}
+    )
+
+@router.delete("/{preference_id}")
+def delete_project_preference(
+    preference_id: int,
+    project_preference_service: ProjectPreferenceService = Depends(get_project_preference_service)
+):
+    """Delete a project preference by ID."""
+    try:
+        deleted = project_preference_service.delete_project_preference(preference_id)
+        if not deleted:
+            logger.warning(f"Project preference with ID {preference_id} not found for deletion")
+            return JSONResponse(
+                status_code=404,
+                content={"success": False, "data": None, "error": "Project preference not found"}
+            )
+        return JSONResponse(
+            status_code=200,
+            content={"success": True, "data": {"message": f"Project preference with ID {preference_id} deleted successfully"}, "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Deletion failed for project preference {preference_id}: {e}")
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "data": None, "error": str(e)}
+        )
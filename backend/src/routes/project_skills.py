@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 from src.model.project_skill import ProjectSkillCreate, ProjectSkillResponse
 from src.services.project_skill_service import ProjectSkillService
-from src.dependencies.dependencies import get_project_skill_service
+from src.services.grouped_count_service import parse_ids
+from src.dependencies.dependencies import get_project_skill_service, not_modified
 from typing import List, Optional
 import logging
 
@@ -29,7 +30,7 @@ def create_project_skill(
             content={"success": False, "data": None, "error": str(e)}
         )
 
-@router.get("/")
+@router.get("/", dependencies=[not_modified("project_skills")])
 def list_project_skills(
     skip: int = Query(0, ge=0, description="Number of project-skill relationships to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of project-skill relationships to return"),
@@ -42,7 +43,7 @@ def list_project_skills(
         content={"success": True, "data": [ProjectSkillResponse.model_validate(ps).model_dump(mode='json') for ps in project_skills], "error": None}
     )
 
-@router.get("/count")
+@router.get("/count", dependencies=[not_modified("project_skills")])
 def get_project_skills_count(project_skill_service: ProjectSkillService = Depends(get_project_skill_service)):
     """Get the total number of project-skill relationships."""
     count = project_skill_service.get_project_skills_count()
@@ -51,7 +52,7 @@ def get_project_skills_count(project_skill_service: ProjectSkillService = Depend
         content={"success": True, "data": {"total_project_skills": count}, "error": None}
     )
 
-@router.get("/by-project/{project_id}")
+@router.get("/by-project/{project_id}", dependencies=[not_modified("project_skills")])
 def get_project_skills_by_project(
     project_id: int,
     skip: int = Query(0, ge=0, description="Number of project-skill relationships to skip"),
@@ -65,7 +66,7 @@ def get_project_skills_by_project(
         content={"success": True, "data": [ProjectSkillResponse.model_validate(ps).model_dump(mode='json') for ps in project_skills], "error": None}
     )
 
-@router.get("/by-skill/{skill_id}")
+@router.get("/by-skill/{skill_id}", dependencies=[not_modified("project_skills")])
 def get_project_skills_by_skill(
     skill_id: int,
     skip: int = Query(0, ge=0, description="Number of project-skill relationships to skip"),
@@ -79,7 +80,7 @@ def get_project_skills_by_skill(
         content={"success": True, "data": [ProjectSkillResponse.model_validate(ps).model_dump(mode='json') for ps in project_skills], "error": None}
     )
 
-@router.get("/count/by-project/{project_id}")
+@router.get("/count/by-project/{project_id}", dependencies=[not_modified("project_skills")])
 def get_project_skills_count_by_project(
     project_id: int,
     project_skill_service: ProjectSkillService = Depends(get_project_skill_service)
@@ -91,7 +92,26 @@ def get_project_skills_count_by_project(
         content={"success": True, "data": {"total_project_skills": count}, "error": None}
     )
 
-@router.get("/count/by-skill/{skill_id}")
+@router.get("/count/by-skill", dependencies=[not_modified("project_skills")])
+def get_project_skills_count_by_skills(
+    ids: Optional[str] = Query(None, description="Comma-separated skill IDs; every skill with project-skill relationships if omitted"),
+    project_skill_service: ProjectSkillService = Depends(get_project_skill_service)
+):
+    """Get the number of project-skill relationships of many skills from one grouped query."""
+    try:
+        counts = project_skill_service.get_project_skills_count_by_skills(parse_ids(ids))
+    except ValueError as e:
+        logger.error(f"Grouped project-skill relationships count failed: {e}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": {"total_project_skills": counts}, "error": None}
+    )
+
+@router.get("/count/by-skill/{skill_id}", dependencies=[not_modified("project_skills")])
 def get_project_skills_count_by_skill(
     skill_id: int,
     project_skill_service: ProjectSkillService = Depends(get_project_skill_service)
@@ -103,7 +123,7 @@ def get_project_skills_count_by_skill(
         content={"success": True, "data": {"total_project_skills": count}, "error": None}
     )
 
-@router.get("/{project_skill_id}")
+@router.get("/{project_skill_id}", dependencies=[not_modified("project_skills")])
 def get_project_skill(
     project_skill_id: int,
     project_skill_service: ProjectSkillService = Depends(get_project_skill_service)
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 from src.model.project_user import ProjectUserCreate, ProjectUserResponse
 from src.services.project_user_service import ProjectUserService
-from src.dependencies.dependencies import get_project_user_service
+from src.dependencies.dependencies import get_project_user_service, not_modified
 from typing import List, Optional
 import logging
 
@@ -29,7 +29,7 @@ def create_project_user(
             content={"success": False, "data": None, "error": str(e)}
         )
 
-@router.get("/")
+@router.get("/", dependencies=[not_modified("project_users")])
 def list_project_users(
     skip: int = Query(0, ge=0, description="Number of project-user relationships to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of project-user relationships to return"),
@@ -42,7 +42,7 @@ def list_project_users(
         content={"success": True, "data": [ProjectUserResponse.model_validate(pu).model_dump(mode='json') for pu in project_users], "error": None}
     )
 
-@router.get("/count")
+@router.get("/count", dependencies=[not_modified("project_users")])
 def get_project_users_count(project_user_service: ProjectUserService = Depends(get_project_user_service)):
     """Get the total number of project-user relationships."""
     count = project_user_service.get_project_users_count()
@@ -51,7 +51,7 @@ def get_project_users_count(project_user_service: ProjectUserService = Depends(g
         content={"success": True, "data": {"total_project_users": count}, "error": None}
     )
 
-@router.get("/by-project/{project_id}")
+@router.get("/by-project/{project_id}", dependencies=[not_modified("project_users")])
 def get_project_users_by_project(
     project_id: int,
     skip: int = Query(0, ge=0, description="Number of project-user relationships to skip"),
@@ -65,7 +65,7 @@ def get_project_users_by_project(
         content={"success": True, "data": [ProjectUserResponse.model_validate(pu).model_dump(mode='json') for pu in project_users], "error": None}
     )
 
-@router.get("/by-user/{user_id}")
+@router.get("/by-user/{user_id}", dependencies=[not_modified("project_users")])
 def get_project_users_by_user(
     user_id: int,
     skip: int = Query(0, ge=0, description="Number of project-user relationships to skip"),
@@ -79,7 +79,7 @@ def get_project_users_by_user(
         content={"success": True, "data": [ProjectUserResponse.model_validate(pu).model_dump(mode='json') for pu in project_users], "error": None}
     )
 
-@router.get("/count/by-project/{project_id}")
+@router.get("/count/by-project/{project_id}", dependencies=[not_modified("project_users")])
 def get_project_users_count_by_project(
     project_id: int,
     project_user_service: ProjectUserService = Depends(get_project_user_service)
@@ -91,7 +91,7 @@ def get_project_users_count_by_project(
         content={"success": True, "data": {"total_project_users": count}, "error": None}
     )
 
-@router.get("/count/by-user/{user_id}")
+@router.get("/count/by-user/{user_id}", dependencies=[not_modified("project_users")])
 def get_project_users_count_by_user(
     user_id: int,
     project_user_service: ProjectUserService = Depends(get_project_user_service)
@@ -103,7 +103,7 @@ def get_project_users_count_by_user(
         content={"success": True, "data": {"total_project_users": count}, "error": None}
     )
 
-@router.get("/{project_user_id}")
+@router.get("/{project_user_id}", dependencies=[not_modified("project_users")])
 def get_project_user(
     project_user_id: int,
     project_user_service: ProjectUserService = Depends(get_project_user_service)
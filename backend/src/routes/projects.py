@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from src.model.project import ProjectCreate, ProjectResponse
 from src.services.project_service import ProjectService
-from src.dependencies.dependencies import get_project_service
+from src.services.recommendation_service import RecommendationService
+from src.services.grouped_count_service import parse_ids
+from src.dependencies.dependencies import get_project_service, get_recommendation_service, not_modified
 from typing import List, Optional
 import logging
 
@@ -29,20 +31,23 @@ def create_project(
             content={"success": False, "data": None, "error": str(e)}
         )
 
-@router.get("/")
+@router.get("/", dependencies=[not_modified("projects")])
 def list_projects(
     skip: int = Query(0, ge=0, description="Number of projects to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of projects to return"),
+    fetch_all: bool = Query(False, alias="all", description="Stream every project in one response, ignoring skip and limit"),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """List all projects with pagination."""
+    if fetch_all:
+        return StreamingResponse(project_service.stream_projects(), media_type="application/json")
     projects = project_service.list_projects(skip=skip, limit=limit)
     return JSONResponse(
         status_code=200,
         content={"success": True, "data": [ProjectResponse.model_validate(p).model_dump(mode='json') for p in projects], "error": None}
     )
 
-@router.get("/count")
+@router.get("/count", dependencies=[not_modified("projects")])
 def get_projects_count(project_service: ProjectService = Depends(get_project_service)):
     """Get the total number of projects."""
     count = project_service.get_projects_count()
@@ -51,7 +56,7 @@ def get_projects_count(project_service: ProjectService = Depends(get_project_ser
         content={"success": True, "data": {"total_projects": count}, "error": None}
     )
 
-@router.get("/search")
+@router.get("/search", dependencies=[not_modified("projects")])
 def search_projects(
     q: str = Query(..., description="Search term for title, description, or team name"),
     skip: int = Query(0, ge=0, description="Number of projects to skip"),
@@ -65,7 +70,7 @@ def search_projects(
         content={"success": True, "data": [ProjectResponse.model_validate(p).model_dump(mode='json') for p in projects], "error": None}
     )
 
-@router.get("/by-course/{course_id}")
+@router.get("/by-course/{course_id}", dependencies=[not_modified("projects")])
 def get_projects_by_course(
     course_id: int,
     skip: int = Query(0, ge=0, description="Number of projects to skip"),
@@ -79,7 +84,7 @@ def get_projects_by_course(
         content={"success": True, "data": [ProjectResponse.model_validate(p).model_dump(mode='json') for p in projects], "error": None}
     )
 
-@router.get("/by-team/{team_name}")
+@router.get("/by-team/{team_name}", dependencies=[not_modified("projects")])
 def get_projects_by_team_name(
     team_name: str,
     skip: int = Query(0, ge=0, description="Number of projects to skip"),
@@ -93,7 +98,7 @@ def get_projects_by_team_name(
         content={"success": True, "data": [ProjectResponse.model_validate(p).model_dump(mode='json') for p in projects], "error": None}
     )
 
-@router.get("/by-capacity")
+@router.get("/by-capacity", dependencies=[not_modified("projects")])
 def get_projects_by_capacity(
     min_capacity: Optional[int] = Query(None, ge=0, description="Minimum capacity filter"),
     max_capacity: Optional[int] = Query(None, ge=0, description="Maximum capacity filter"),
@@ -108,7 +113,7 @@ def get_projects_by_capacity(
         content={"success": True, "data": [ProjectResponse.model_validate(p).model_dump(mode='json') for p in projects], "error": None}
     )
 
-@router.get("/without-course")
+@router.get("/without-course", dependencies=[not_modified("projects")])
 def get_projects_without_course(
     skip: int = Query(0, ge=0, description="Number of projects to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of projects to return"),
@@ -121,7 +126,26 @@ def get_projects_without_course(
         content={"success": True, "data": [ProjectResponse.model_validate(p).model_dump(mode='json') for p in projects], "error": None}
     )
 
-@router.get("/count/by-course/{course_id}")
+@router.get("/count/by-course", dependencies=[not_modified("projects")])
+def get_projects_count_by_courses(
+    ids: Optional[str] = Query(None, description="Comma-separated course IDs; every course with projects if omitted"),
+    project_service: ProjectService = Depends(get_project_service)
+):
+    """Get the number of projects of many courses from one grouped query."""
+    try:
+        counts = project_service.get_projects_count_by_courses(parse_ids(ids))
+    except ValueError as e:
+        logger.error(f"Grouped projects count failed: {e}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": {"total_projects": counts}, "error": None}
+    )
+
+@router.get("/count/by-course/{course_id}", dependencies=[not_modified("projects")])
 def get_projects_count_by_course(
     course_id: int,
     project_service: ProjectService = Depends(get_project_service)
@@ -133,7 +157,33 @@ def get_projects_count_by_course(
         content={"success": True, "data": {"total_projects": count}, "error": None}
     )
 
-@router.get("/{project_id}")
+@router.get("/{project_id}/candidates")
+def get_project_candidates(
+    project_id: int,
+    k: int = Query(10, ge=1, le=100, description="Number of students to return"),
+    recommendation_service: RecommendationService = Depends(get_recommendation_service)
+):
+    """Get the unassigned students of a project's course whose skills best fit the project."""
+    try:
+        candidates = recommendation_service.candidate_students(project_id, k=k)
+    except ValueError as e:
+        logger.error(f"Candidate search failed for project {project_id}: {e}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+    if not candidates:
+        logger.warning(f"Project with ID {project_id} not found for candidate search")
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "Project not found"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": candidates.model_dump(mode='json'), "error": None}
+    )
+
+@router.get("/{project_id}", dependencies=[not_modified("projects")])
 def get_project(
     project_id: int,
     project_service: ProjectService = Depends(get_project_service)
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from src.services.report_service import REPORT_FORMATS, ReportService
+from src.dependencies.dependencies import get_report_service
+from typing import Callable, Iterator, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/reports", tags=["reports"])
+
+def _report_response(
+    report_service: ReportService,
+    stream: Callable[..., Iterator[bytes]],
+    name: str,
+    report_format: str,
+    course_id: Optional[int],
+    semester_id: Optional[int],
+):
+    """Validate a report's scope, then stream it as a download.
+
+    Args:
+        report_service (ReportService): Service whose session checks the scope.
+        stream (Callable[..., Iterator[bytes]]): The service's ``stream_*`` method for this report.
+        name (str): Report name, used in logs and the download's filename.
+        report_format (str): One of ``REPORT_FORMATS``.
+        course_id (Optional[int]): Only this course's rows.
+        semester_id (Optional[int]): Only rows of this semester's courses.
+    """
+    try:
+        missing = report_service.check_scope(course_id, semester_id, report_format)
+    except ValueError as e:
+        logger.error(f"Report {name} failed: {e}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+    if missing:
+        logger.warning(f"Report {name} requested for a missing scope: {missing}")
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": missing}
+        )
+    scope = f"-course-{course_id}" if course_id is not None else f"-semester-{semester_id}" if semester_id is not None else ""
+    return StreamingResponse(
+        stream(report_format, course_id=course_id, semester_id=semester_id),
+        media_type=REPORT_FORMATS[report_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}{scope}.{report_format}"'},
+    )
+
+@router.get("/team-assignments")
+def get_team_assignments_report(
+    format: str = Query("csv", description="csv or jsonl"),
+    course_id: Optional[int] = Query(None, description="Only this course's teams"),
+    semester_id: Optional[int] = Query(None, description="Only teams of this semester's courses"),
+    report_service: ReportService = Depends(get_report_service)
+):
+    """Stream every student's team placement with their course, project and skills."""
+    return _report_response(report_service, report_service.stream_team_assignments, "team-assignments", format, course_id, semester_id)
+
+@router.get("/project-allocations")
+def get_project_allocations_report(
+    format: str = Query("csv", description="csv or jsonl"),
+    course_id: Optional[int] = Query(None, description="Only this course's projects"),
+    semester_id: Optional[int] = Query(None, description="Only projects of this semester's courses"),
+    report_service: ReportService = Depends(get_report_service)
+):
+    """Stream every project's fill, open seats, required skills and members."""
+    return _report_response(report_service, report_service.stream_project_allocations, "project-allocations", format, course_id, semester_id)
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from src.model.semester import SemesterCreate, SemesterResponse
 from src.services.semester_service import SemesterService
-from src.dependencies.dependencies import get_semester_service
+from src.dependencies.dependencies import get_semester_service, not_modified
 from typing import List, Optional
 import logging
 
@@ -29,20 +29,23 @@ def create_semester(
             content={"success": False, "data": None, "error": str(e)}
         )
 
-@router.get("/")
+@router.get("/", dependencies=[not_modified("semesters")])
 def list_semesters(
     skip: int = Query(0, ge=0, description="Number of semesters to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of semesters to return"),
+    fetch_all: bool = Query(False, alias="all", description="Stream every semester in one response, ignoring skip and limit"),
     semester_service: SemesterService = Depends(get_semester_service)
 ):
     """List all semesters with pagination."""
+    if fetch_all:
+        return StreamingResponse(semester_service.stream_semesters(), media_type="application/json")
     semesters = semester_service.list_semesters(skip=skip, limit=limit)
     return JSONResponse(
         status_code=200,
         content={"success": True, "data": [SemesterResponse.model_validate(s).model_dump(mode='json') for s in semesters], "error": None}
     )
 
-@router.get("/count")
+@router.get("/count", dependencies=[not_modified("semesters")])
 def get_semesters_count(semester_service: SemesterService = Depends(get_semester_service)):
     """Get the total number of semesters."""
     count = semester_service.get_semesters_count()
@@ -51,7 +54,7 @@ def get_semesters_count(semester_service: SemesterService = Depends(get_semester
         content={"success": True, "data": {"total_semesters": count}, "error": None}
     )
 
-@router.get("/search")
+@router.get("/search", dependencies=[not_modified("semesters")])
 def search_semesters(
     q: str = Query(..., description="Search term for semester display name"),
     skip: int = Query(0, ge=0, description="Number of semesters to skip"),
@@ -80,7 +83,7 @@ def get_current_semester(semester_service: SemesterService = Depends(get_semeste
         content={"success": True, "data": SemesterResponse.model_validate(semester).model_dump(mode='json'), "error": None}
     )
 
-@router.get("/{semester_id}")
+@router.get("/{semester_id}", dependencies=[not_modified("semesters")])
 def get_semester(
     semester_id: int, 
     semester_service: SemesterService = Depends(get_semester_service)
@@ -98,7 +101,7 @@ def get_semester(
         content={"success": True, "data": SemesterResponse.model_validate(semester).model_dump(mode='json'), "error": None}
     )
 
-@router.get("/by-display-name/{display_name}")
+@router.get("/by-display-name/{display_name}", dependencies=[not_modified("semesters")])
 def get_semester_by_display_name(
     display_name: str, 
     semester_service: SemesterService = Depends(get_semester_service)
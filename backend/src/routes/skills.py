@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from src.model.skill import SkillCreate, SkillResponse
 from src.services.skill_service import SkillService
-from src.dependencies.dependencies import get_skill_service
+from src.dependencies.dependencies import get_skill_service, not_modified
 from typing import List, Optional
 import logging
 
@@ -75,20 +75,23 @@ def create_multiple_skills(
         }
     )
 
-@router.get("/")
+@router.get("/", dependencies=[not_modified("skills")])
 def list_skills(
     skip: int = Query(0, ge=0, description="Number of skills to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of skills to return"),
+    fetch_all: bool = Query(False, alias="all", description="Stream every skill in one response, ignoring skip and limit"),
     skill_service: SkillService = Depends(get_skill_service)
 ):
     """List all skills with pagination."""
+    if fetch_all:
+        return StreamingResponse(skill_service.stream_skills(), media_type="application/json")
     skills = skill_service.list_skills(skip=skip, limit=limit)
     return JSONResponse(
         status_code=200,
         content={"success": True, "data": [SkillResponse.model_validate(s).model_dump(mode='json') for s in skills], "error": None}
     )
 
-@router.get("/count")
+@router.get("/count", dependencies=[not_modified("skills")])
 def get_skills_count(skill_service: SkillService = Depends(get_skill_service)):
     """Get the total number of skills."""
     count = skill_service.get_skills_count()
@@ -97,7 +100,7 @@ def get_skills_count(skill_service: SkillService = Depends(get_skill_service)):
         content={"success": True, "data": {"total_skills": count}, "error": None}
     )
 
-@router.get("/search")
+@router.get("/search", dependencies=[not_modified("skills")])
 def search_skills(
     q: str = Query(..., description="Search term for skill name"),
     skip: int = Query(0, ge=0, description="Number of skills to skip"),
@@ -111,7 +114,7 @@ def search_skills(
         content={"success": True, "data": [SkillResponse.model_validate(s).model_dump(mode='json') for s in skills], "error": None}
     )
 
-@router.get("/multi-select")
+@router.get("/multi-select", dependencies=[not_modified("skills")])
 def get_skills_for_multi_select(
     skill_service: SkillService = Depends(get_skill_service)
 ):
@@ -141,7 +144,7 @@ def get_skills_for_multi_select(
         }
     )
 
-@router.get("/{skill_id}")
+@router.get("/{skill_id}", dependencies=[not_modified("skills")])
 def get_skill(
     skill_id: int,
     skill_service: SkillService = Depends(get_skill_service)
@@ -0,0 +1,106 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from src.model.teammate_preference import TeammatePreferenceCreate, TeammatePreferenceResponse
+from src.services.teammate_preference_service import TeammatePreferenceService
+from src.dependencies.dependencies import get_teammate_preference_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/teammate-preferences", tags=["teammate-preferences"])
+
+@router.post("/", status_code=201)
+def create_teammate_preference(
+    preference: TeammatePreferenceCreate,
+    teammate_preference_service: TeammatePreferenceService = Depends(get_teammate_preference_service)
+):
+    """Record that a student wants to work with another student."""
+    try:
+        created_preference = teammate_preference_service.create_teammate_preference(preference)
+        return JSONResponse(
+            status_code=201,
+            content={"success": True, "data": TeammatePreferenceResponse.model_validate(created_preference).model_dump(mode='json'), "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Teammate preference creation failed: {e}")
+        return JSONResponse(
+            status_code=409,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+
+@router.get("/")
+def list_teammate_preferences(
+    skip: int = Query(0, ge=0, description="Number of teammate preferences to skip"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of teammate preferences to return"),
+    teammate_preference_service: TeammatePreferenceService = Depends(get_teammate_preference_service)
+):
+    """List all teammate preferences with pagination."""
+    preferences = teammate_preference_service.list_teammate_preferences(skip=skip, limit=limit)
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": [TeammatePreferenceResponse.model_validate(p).model_dump(mode='json') for p in preferences], "error": None}
+    )
+
+@router.get("/count")
+def get_teammate_preferences_count(teammate_preference_service: TeammatePreferenceService = Depends(get_teammate_preference_service)):
+    """Get the total number of teammate preferences."""
+    count = teammate_preference_service.get_teammate_preferences_count()
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": {"total_teammate_preferences": count}, "error": None}
+    )
+
+@router.get("/by-user/{user_id}")
+def get_teammate_preferences_by_user(
+    user_id: int,
+    teammate_preference_service: TeammatePreferenceService = Depends(get_teammate_preference_service)
+):
+    """Get the teammates a student has requested."""
+    preferences = teammate_preference_service.get_teammate_preferences_by_user(user_id=user_id)
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": [TeammatePreferenceResponse.model_validate(p).model_dump(mode='json') for p in preferences], "error": None}
+    )
+
+@router.get("/{preference_id}")
+def get_teammate_preference(
+    preference_id: int,
+    teammate_preference_service: TeammatePreferenceService = Depends(get_teammate_preference_service)
+):
+    """Retrieve a teammate preference by ID."""
+    preference = teammate_preference_service.get_teammate_preference_by_id(preference_id)
+    if not preference:
+        logger.warning(f"Teammate preference with ID {preference_id} not found")
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "Teammate preference not found"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": TeammatePreferenceResponse.model_validate(preference).model_dump(mode='json'), "error": None}
+    )
+
+@router.delete("/{preference_id}")
+def delete_teammate_preference(
+    preference_id: int,
+    teammate_preference_service: TeammatePreferenceService = Depends(get_teammate_preference_service)
+):
+    """Delete a teammate preference by ID."""
+    try:
+        deleted = teammate_preference_service.delete_teammate_preference(preference_id)
+        if not deleted:
+            logger.warning(f"Teammate preference with ID {preference_id} not found for deletion")
+            return JSONResponse(
+                status_code=404,
+                content={"success": False, "data": None, "error": "Teammate preference not found"}
+            )
+        return JSONResponse(
+            status_code=200,
+            content={"success": True, "data": {"message": f"Teammate preference with ID {preference_id} deleted successfully"}, "error": None}
+        )
+    except ValueError as e:
+        logger.error(f"Deletion failed for teammate preference {preference_id}: {e}")
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "data": None, "error": str(e)}
+        )
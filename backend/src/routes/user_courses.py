@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 from src.model.user_course import UserCourseCreate, UserCourseResponse
 from src.services.user_course_service import UserCourseService
-from src.dependencies.dependencies import get_user_course_service
+from src.services.grouped_count_service import parse_ids
+from src.dependencies.dependencies import get_user_course_service, not_modified
 from typing import List, Optional
 import logging
 
@@ -29,7 +30,7 @@ def create_user_course(
             content={"success": False, "data": None, "error": str(e)}
         )
 
-@router.get("/")
+@router.get("/", dependencies=[not_modified("user_courses")])
 def list_user_courses(
     skip: int = Query(0, ge=0, description="Number of user-course relationships to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of user-course relationships to return"),
@@ -42,7 +43,7 @@ def list_user_courses(
         content={"success": True, "data": [UserCourseResponse.model_validate(uc).model_dump(mode='json') for uc in user_courses], "error": None}
     )
 
-@router.get("/count")
+@router.get("/count", dependencies=[not_modified("user_courses")])
 def get_user_courses_count(user_course_service: UserCourseService = Depends(get_user_course_service)):
     """Get the total number of user-course relationships."""
     count = user_course_service.get_user_courses_count()
@@ -51,7 +52,7 @@ def get_user_courses_count(user_course_service: UserCourseService = Depends(get_
         content={"success": True, "data": {"total_user_courses": count}, "error": None}
     )
 
-@router.get("/by-user/{user_id}")
+@router.get("/by-user/{user_id}", dependencies=[not_modified("user_courses")])
 def get_user_courses_by_user(
     user_id: int,
     skip: int = Query(0, ge=0, description="Number of user-course relationships to skip"),
@@ -65,7 +66,7 @@ def get_user_courses_by_user(
         content={"success": True, "data": [UserCourseResponse.model_validate(uc).model_dump(mode='json') for uc in user_courses], "error": None}
     )
 
-@router.get("/by-course/{course_id}")
+@router.get("/by-course/{course_id}", dependencies=[not_modified("user_courses")])
 def get_user_courses_by_course(
     course_id: int,
     skip: int = Query(0, ge=0, description="Number of user-course relationships to skip"),
@@ -79,7 +80,7 @@ def get_user_courses_by_course(
         content={"success": True, "data": [UserCourseResponse.model_validate(uc).model_dump(mode='json') for uc in user_courses], "error": None}
     )
 
-@router.get("/count/by-user/{user_id}")
+@router.get("/count/by-user/{user_id}", dependencies=[not_modified("user_courses")])
 def get_user_courses_count_by_user(
     user_id: int,
     user_course_service: UserCourseService = Depends(get_user_course_service)
@@ -91,7 +92,26 @@ def get_user_courses_count_by_user(
         content={"success": True, "data": {"total_user_courses": count}, "error": None}
     )
 
-@router.get("/count/by-course/{course_id}")
+@router.get("/count/by-course", dependencies=[not_modified("user_courses")])
+def get_user_courses_count_by_courses(
+    ids: Optional[str] = Query(None, description="Comma-separated course IDs; every course with user-course relationships if omitted"),
+    user_course_service: UserCourseService = Depends(get_user_course_service)
+):
+    """Get the number of user-course relationships of many courses from one grouped query."""
+    try:
+        counts = user_course_service.get_user_courses_count_by_courses(parse_ids(ids))
+    except ValueError as e:
+        logger.error(f"Grouped user-course relationships count failed: {e}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": {"total_user_courses": counts}, "error": None}
+    )
+
+@router.get("/count/by-course/{course_id}", dependencies=[not_modified("user_courses")])
 def get_user_courses_count_by_course(
     course_id: int,
     user_course_service: UserCourseService = Depends(get_user_course_service)
@@ -103,7 +123,7 @@ def get_user_courses_count_by_course(
         content={"success": True, "data": {"total_user_courses": count}, "error": None}
     )
 
-@router.get("/{user_course_id}")
+@router.get("/{user_course_id}", dependencies=[not_modified("user_courses")])
 def get_user_course(
     user_course_id: int,
     user_course_service: UserCourseService = Depends(get_user_course_service)
@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 from src.model.user_skill import UserSkillCreate, UserSkillResponse
 from src.services.user_skill_service import UserSkillService
-from src.dependencies.dependencies import get_user_skill_service
+from src.services.grouped_count_service import parse_ids
+from src.dependencies.dependencies import get_user_skill_service, not_modified
 from typing import List, Optional
 import logging
 
@@ -29,7 +30,7 @@ def create_user_skill(
             content={"success": False, "data": None, "error": str(e)}
         )
 
-@router.get("/")
+@router.get("/", dependencies=[not_modified("user_skills")])
 def list_user_skills(
     skip: int = Query(0, ge=0, description="Number of user-skill relationships to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of user-skill relationships to return"),
@@ -42,7 +43,7 @@ def list_user_skills(
         content={"success": True, "data": [UserSkillResponse.model_validate(us).model_dump(mode='json') for us in user_skills], "error": None}
     )
 
-@router.get("/count")
+@router.get("/count", dependencies=[not_modified("user_skills")])
 def get_user_skills_count(user_skill_service: UserSkillService = Depends(get_user_skill_service)):
     """Get the total number of user-skill relationships."""
     count = user_skill_service.get_user_skills_count()
@@ -51,7 +52,7 @@ def get_user_skills_count(user_skill_service: UserSkillService = Depends(get_use
         content={"success": True, "data": {"total_user_skills": count}, "error": None}
     )
 
-@router.get("/by-user/{user_id}")
+@router.get("/by-user/{user_id}", dependencies=[not_modified("user_skills")])
 def get_user_skills_by_user(
     user_id: int,
     skip: int = Query(0, ge=0, description="Number of user-skill relationships to skip"),
@@ -65,7 +66,7 @@ def get_user_skills_by_user(
         content={"success": True, "data": [UserSkillResponse.model_validate(us).model_dump(mode='json') for us in user_skills], "error": None}
     )
 
-@router.get("/by-skill/{skill_id}")
+@router.get("/by-skill/{skill_id}", dependencies=[not_modified("user_skills")])
 def get_user_skills_by_skill(
     skill_id: int,
     skip: int = Query(0, ge=0, description="Number of user-skill relationships to skip"),
@@ -79,7 +80,7 @@ def get_user_skills_by_skill(
         content={"success": True, "data": [UserSkillResponse.model_validate(us).model_dump(mode='json') for us in user_skills], "error": None}
     )
 
-@router.get("/count/by-user/{user_id}")
+@router.get("/count/by-user/{user_id}", dependencies=[not_modified("user_skills")])
 def get_user_skills_count_by_user(
     user_id: int,
     user_skill_service: UserSkillService = Depends(get_user_skill_service)
@@ -91,7 +92,26 @@ def get_user_skills_count_by_user(
         content={"success": True, "data": {"total_user_skills": count}, "error": None}
     )
 
-@router.get("/count/by-skill/{skill_id}")
+@router.get("/count/by-skill", dependencies=[not_modified("user_skills")])
+def get_user_skills_count_by_skills(
+    ids: Optional[str] = Query(None, description="Comma-separated skill IDs; every skill with user-skill relationships if omitted"),
+    user_skill_service: UserSkillService = Depends(get_user_skill_service)
+):
+    """Get the number of user-skill relationships of many skills from one grouped query."""
+    try:
+        counts = user_skill_service.get_user_skills_count_by_skills(parse_ids(ids))
+    except ValueError as e:
+        logger.error(f"Grouped user-skill relationships count failed: {e}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": {"total_user_skills": counts}, "error": None}
+    )
+
+@router.get("/count/by-skill/{skill_id}", dependencies=[not_modified("user_skills")])
 def get_user_skills_count_by_skill(
     skill_id: int,
     user_skill_service: UserSkillService = Depends(get_user_skill_service)
@@ -103,7 +123,7 @@ def get_user_skills_count_by_skill(
         content={"success": True, "data": {"total_user_skills": count}, "error": None}
     )
 
-@router.get("/{user_skill_id}")
+@router.get("/{user_skill_id}", dependencies=[not_modified("user_skills")])
 def get_user_skill(
     user_skill_id: int,
     user_skill_service: UserSkillService = Depends(get_user_skill_service)
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from src.model.user import UserCreate, UserResponse
 from src.services.user_service import UserService
-from src.dependencies.dependencies import get_user_service
+from src.services.recommendation_service import RecommendationService
+from src.dependencies.dependencies import get_user_service, get_recommendation_service, not_modified
 from typing import List, Optional
 import logging
 
@@ -29,20 +30,23 @@ def create_user(
             content={"success": False, "data": None, "error": str(e)}
         )
 
-@router.get("/")
+@router.get("/", dependencies=[not_modified("users")])
 def list_users(
     skip: int = Query(0, ge=0, description="Number of users to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of users to return"),
+    fetch_all: bool = Query(False, alias="all", description="Stream every user in one response, ignoring skip and limit"),
     user_service: UserService = Depends(get_user_service)
 ):
     """List all users with pagination."""
+    if fetch_all:
+        return StreamingResponse(user_service.stream_users(), media_type="application/json")
     users = user_service.list_users(skip=skip, limit=limit)
     return JSONResponse(
         status_code=200,
         content={"success": True, "data": [UserResponse.model_validate(u).model_dump(mode='json') for u in users], "error": None}
     )
 
-@router.get("/count")
+@router.get("/count", dependencies=[not_modified("users")])
 def get_users_count(user_service: UserService = Depends(get_user_service)):
     """Get the total number of users."""
     count = user_service.get_users_count()
@@ -51,7 +55,7 @@ def get_users_count(user_service: UserService = Depends(get_user_service)):
         content={"success": True, "data": {"total_users": count}, "error": None}
     )
 
-@router.get("/search")
+@router.get("/search", dependencies=[not_modified("users")])
 def search_users(
     q: str = Query(..., description="Search term for username, UUPID, or edupersonprincipalname"),
     skip: int = Query(0, ge=0, description="Number of users to skip"),
@@ -65,7 +69,7 @@ def search_users(
         content={"success": True, "data": [UserResponse.model_validate(u).model_dump(mode='json') for u in users], "error": None}
     )
 
-@router.get("/{user_id}")
+@router.get("/{user_id}", dependencies=[not_modified("users")])
 def get_user(
     user_id: int, 
     user_service: UserService = Depends(get_user_service)
@@ -83,7 +87,54 @@ def get_user(
         content={"success": True, "data": UserResponse.model_validate(user).model_dump(mode='json'), "error": None}
     )
 
-@router.get("/by-uupid/{uupid}")
+@router.get("/{user_id}/recommended-projects")
+def get_recommended_projects(
+    user_id: int,
+    k: int = Query(5, ge=1, le=50, description="Number of projects to return"),
+    recommendation_service: RecommendationService = Depends(get_recommendation_service)
+):
+    """Get the projects in a student's courses that best fit their skills."""
+    recommendations = recommendation_service.recommend_projects(user_id, k=k)
+    if not recommendations:
+        logger.warning(f"User with ID {user_id} not found for project recommendations")
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "User not found"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": recommendations.model_dump(mode='json'), "error": None}
+    )
+
+@router.get("/{user_id}/teammate-suggestions")
+def get_teammate_suggestions(
+    user_id: int,
+    course_id: int = Query(..., description="Course to search for teammates"),
+    k: int = Query(5, ge=1, le=50, description="Number of classmates to return"),
+    mode: str = Query("similar", description="'similar' for overlapping skills, 'complementary' for skills the student lacks"),
+    recommendation_service: RecommendationService = Depends(get_recommendation_service)
+):
+    """Suggest classmates whose skills are similar to, or complement, a student's."""
+    try:
+        suggestions = recommendation_service.suggest_teammates(user_id, course_id, k=k, mode=mode)
+    except ValueError as e:
+        logger.error(f"Teammate suggestions failed for user {user_id}: {e}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "data": None, "error": str(e)}
+        )
+    if not suggestions:
+        logger.warning(f"User {user_id} is not enrolled in course {course_id}")
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "data": None, "error": "User is not enrolled in this course"}
+        )
+    return JSONResponse(
+        status_code=200,
+        content={"success": True, "data": suggestions.model_dump(mode='json'), "error": None}
+    )
+
+@router.get("/by-uupid/{uupid}", dependencies=[not_modified("users")])
 def get_user_by_uupid(
     uupid: str, 
     user_service: UserService = Depends(get_user_service)
@@ -101,7 +152,7 @@ def get_user_by_uupid(
         content={"success": True, "data": UserResponse.model_validate(user).model_dump(mode='json'), "error": None}
     )
 
-@router.get("/by-username/{username}")
+@router.get("/by-username/{username}", dependencies=[not_modified("users")])
 def get_user_by_username(
     username: str, 
     user_service: UserService = Depends(get_user_service)
@@ -0,0 +1,80 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from src.model.admin import AdminSummaryResponse
+from src.model.course import Course
+from src.model.do_not_pair import DoNotPair
+from src.model.matching_run import MatchingRun
+from src.model.project import Project
+from src.model.project_preference import ProjectPreference
+from src.model.project_skill import ProjectSkill
+from src.model.project_user import ProjectUser
+from src.model.semester import Semester
+from src.model.skill import Skill
+from src.model.teammate_preference import TeammatePreference
+from src.model.user import User
+from src.model.user_course import UserCourse
+from src.model.user_skill import UserSkill
+from datetime import datetime
+from typing import Optional, Tuple
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Seconds a dashboard summary is served from memory before the totals are counted again.
+SUMMARY_TTL_SECONDS = 10.0
+
+# Summary field -> model whose rows it counts.
+SUMMARY_COUNTS = {
+    "total_users": User,
+    "total_semesters": Semester,
+    "total_courses": Course,
+    "total_projects": Project,
+    "total_skills": Skill,
+    "total_project_skills": ProjectSkill,
+    "total_project_users": ProjectUser,
+    "total_user_courses": UserCourse,
+    "total_user_skills": UserSkill,
+    "total_project_preferences": ProjectPreference,
+    "total_teammate_preferences": TeammatePreference,
+    "total_do_not_pairs": DoNotPair,
+    "total_matching_runs": MatchingRun,
+}
+
+# Latest summary and the monotonic time it was counted at.
+_summary_cache: Optional[Tuple[float, AdminSummaryResponse]] = None
+_summary_lock = threading.Lock()
+
+class AdminService:
+    """Service class for the admin dashboard."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_summary(self) -> AdminSummaryResponse:
+        """Get the row totals shown on the admin dashboard.
+        
+        Every total comes from one statement of scalar ``COUNT(*)``
+        subqueries, and the result is reused for ``SUMMARY_TTL_SECONDS``.
+        
+        Returns:
+            AdminSummaryResponse: Row totals of every table, and when they were counted.
+        """
+        global _summary_cache
+        with _summary_lock:
+            cached = _summary_cache
+        if cached is not None and time.monotonic() - cached[0] < SUMMARY_TTL_SECONDS:
+            return cached[1]
+        
+        started = time.perf_counter()
+        statement = select(*[
+            select(func.count()).select_from(model).scalar_subquery().label(name)
+            for name, model in SUMMARY_COUNTS.items()
+        ])
+        row = self.db.execute(statement).one()
+        summary = AdminSummaryResponse(**row._asdict(), generated_at=datetime.now())
+        with _summary_lock:
+            _summary_cache = (time.monotonic(), summary)
+        logger.info(f"Counted admin summary of {len(SUMMARY_COUNTS)} tables in {(time.perf_counter() - started) * 1000:.1f} ms")
+        return summary
@@ -0,0 +1,133 @@
+from sqlalchemy.orm import Session
+from src.model.assignment_snapshot import (
+    AssignmentSnapshot, AssignmentSnapshotCreate, AssignmentSnapshotResponse,
+    AssignmentSnapshotDiffResponse, MovedStudent, ProjectDelta
+)
+from src.model.course import Course
+from src.model.project import Project
+from src.model.project_user import ProjectUser
+from src.model.user_course import UserCourse
+from src.matching.cache import pack_ids, unpack_ids
+from src.matching.snapshots import diff_assignments, align
+from typing import List, Optional
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+def build_snapshot(course_id: int, user_ids: np.ndarray, project_ids: np.ndarray, source: str, label: Optional[str] = None) -> AssignmentSnapshot:
+    """Create an (unsaved) snapshot row from aligned user and project ID arrays."""
+    order = np.argsort(user_ids, kind="stable")
+    return AssignmentSnapshot(
+        course_id=course_id,
+        label=label,
+        source=source,
+        n_students=int(user_ids.shape[0]),
+        user_ids=pack_ids(user_ids[order]),
+        project_ids=pack_ids(project_ids[order]),
+    )
+
+class AssignmentSnapshotService:
+    """Service class for immutable assignment snapshots and their diffs."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def create_snapshot_from_current(self, snapshot_data: AssignmentSnapshotCreate) -> Optional[AssignmentSnapshotResponse]:
+        """Snapshot a course's current project-user assignments.
+        
+        Enrolled students without a project are recorded as unassigned. If a
+        student has several project-user rows in the course, the newest wins.
+        
+        Args:
+            snapshot_data (AssignmentSnapshotCreate): The course and an optional label.
+            
+        Returns:
+            Optional[AssignmentSnapshotResponse]: The new snapshot, or None if the course does not exist.
+            
+        Raises:
+            ValueError: If the snapshot cannot be saved.
+        """
+        course_id = snapshot_data.course_id
+        if not self.db.query(Course.id).filter(Course.id == course_id).first():
+            return None
+        
+        enrolled = np.unique(np.array(
+            [row[0] for row in self.db.query(UserCourse.user_id).filter(UserCourse.course_id == course_id).all()],
+            dtype=np.int64,
+        ))
+        rows = np.array(
+            self.db.query(ProjectUser.user_id, ProjectUser.project_id)
+            .join(Project, Project.id == ProjectUser.project_id)
+            .filter(Project.course_id == course_id)
+            .order_by(ProjectUser.id.desc()).all(),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        # np.unique keeps the first occurrence, i.e. the newest row per user.
+        assigned_users, first = np.unique(rows[:, 0], return_index=True)
+        user_ids = np.union1d(enrolled, assigned_users)
+        project_ids = align(assigned_users, rows[first, 1], user_ids)
+        
+        try:
+            snapshot = build_snapshot(course_id, user_ids, project_ids, source="manual", label=snapshot_data.label)
+            self.db.add(snapshot)
+            self.db.commit()
+            self.db.refresh(snapshot)
+            logger.info(f"Created assignment snapshot {snapshot.id} for course {course_id}")
+            return AssignmentSnapshotResponse.model_validate(snapshot)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to create assignment snapshot for course {course_id}: {e}")
+            raise ValueError(f"Snapshot creation failed: {str(e)}")
+    
+    def get_snapshot_by_id(self, snapshot_id: int) -> Optional[AssignmentSnapshotResponse]:
+        snapshot = self.db.query(AssignmentSnapshot).filter(AssignmentSnapshot.id == snapshot_id).first()
+        if snapshot:
+            return AssignmentSnapshotResponse.model_validate(snapshot)
+        return None
+    
+    def get_snapshots_by_course(self, course_id: int, skip: int = 0, limit: int = 10) -> List[AssignmentSnapshotResponse]:
+        snapshots = self.db.query(AssignmentSnapshot).filter(
+            AssignmentSnapshot.course_id == course_id
+        ).order_by(AssignmentSnapshot.id.desc()).offset(skip).limit(limit).all()
+        logger.info(f"Retrieved {len(snapshots)} assignment snapshots for course {course_id}")
+        return [AssignmentSnapshotResponse.model_validate(s) for s in snapshots]
+    
+    def diff_snapshots(self, from_snapshot_id: int, to_snapshot_id: int) -> Optional[AssignmentSnapshotDiffResponse]:
+        """Compare two snapshots student by student.
+        
+        Args:
+            from_snapshot_id (int): The earlier (baseline) snapshot.
+            to_snapshot_id (int): The snapshot to compare against the baseline.
+            
+        Returns:
+            Optional[AssignmentSnapshotDiffResponse]: Moved students and per-project deltas, or None if either snapshot does not exist.
+        """
+        snapshots = {
+            s.id: s for s in self.db.query(AssignmentSnapshot).filter(
+                AssignmentSnapshot.id.in_([from_snapshot_id, to_snapshot_id])
+            ).all()
+        }
+        if from_snapshot_id not in snapshots or to_snapshot_id not in snapshots:
+            return None
+        a, b = snapshots[from_snapshot_id], snapshots[to_snapshot_id]
+        diff = diff_assignments(unpack_ids(a.user_ids), unpack_ids(a.project_ids), unpack_ids(b.user_ids), unpack_ids(b.project_ids))
+        
+        moved = np.flatnonzero(diff.moved)
+        return AssignmentSnapshotDiffResponse(
+            from_snapshot_id=from_snapshot_id,
+            to_snapshot_id=to_snapshot_id,
+            n_students=int(diff.user_ids.shape[0]),
+            n_moved=int(moved.shape[0]),
+            moved=[
+                MovedStudent(user_id=user_id, from_project_id=before or None, to_project_id=after or None)
+                for user_id, before, after in zip(diff.user_ids[moved].tolist(), diff.before[moved].tolist(), diff.after[moved].tolist())
+            ],
+            project_deltas=[
+                ProjectDelta(project_id=project_id, before=before, after=after, joined=joined, left=left)
+                for project_id, before, after, joined, left in zip(
+                    diff.project_ids.tolist(), diff.count_before.tolist(), diff.count_after.tolist(),
+                    diff.joined.tolist(), diff.left.tolist()
+                )
+            ],
+        )
@@ -0,0 +1,91 @@
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session
+from src.model.assignment_version import AssignmentVersion
+from src.model.project import Project
+from src.model.user_course import UserCourse
+from typing import Iterable, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AssignmentVersionService:
+    """Service class for the per-course assignment version counters used as cache keys."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_version(self, course_id: int) -> int:
+        row = self.db.query(AssignmentVersion.version).filter(AssignmentVersion.course_id == course_id).first()
+        return row[0] if row else 0
+    
+    def bump(self, course_ids: Iterable[int], commit: bool = True) -> None:
+        """Increment the version of each course.
+        
+        On MySQL and SQLite this is a single upsert, so two writers creating
+        the same course's first version do not collide on the primary key.
+        
+        Args:
+            course_ids (Iterable[int]): Courses whose assignment or preferences changed.
+            commit (bool): Commit immediately; pass False to join the caller's transaction.
+        """
+        course_ids = sorted({course_id for course_id in course_ids if course_id is not None})
+        if not course_ids:
+            return
+        rows = [{"course_id": course_id, "version": 1} for course_id in course_ids]
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "mysql":
+            self.db.execute(
+                mysql.insert(AssignmentVersion).values(rows).on_duplicate_key_update(
+                    version=AssignmentVersion.version + 1, updated_at=func.now()
+                )
+            )
+        elif dialect == "sqlite":
+            self.db.execute(
+                sqlite.insert(AssignmentVersion).values(rows).on_conflict_do_update(
+                    index_elements=[AssignmentVersion.course_id],
+                    set_={"version": AssignmentVersion.version + 1, "updated_at": func.now()},
+                )
+            )
+        else:
+            self._bump_rows(course_ids)
+        if commit:
+            self.db.commit()
+        logger.debug(f"Bumped assignment version for courses {course_ids}")
+    
+    def _bump_rows(self, course_ids: List[int]) -> None:
+        # Read-then-write fallback for other dialects; concurrent first bumps of a course can conflict here.
+        existing = {
+            row.course_id: row for row in self.db.query(AssignmentVersion).filter(
+                AssignmentVersion.course_id.in_(course_ids)
+            ).all()
+        }
+        for course_id in course_ids:
+            if course_id in existing:
+                existing[course_id].version = AssignmentVersion.version + 1
+            else:
+                self.db.add(AssignmentVersion(course_id=course_id, version=1))
+    
+    def courses_for_projects(self, project_ids: Iterable[int]) -> List[int]:
+        project_ids = list(set(project_ids))
+        if not project_ids:
+            return []
+        return [row[0] for row in self.db.query(Project.course_id).filter(
+            Project.id.in_(project_ids), Project.course_id.isnot(None)
+        ).distinct().all()]
+    
+    def courses_for_users(self, user_ids: Iterable[int]) -> List[int]:
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return []
+        return [row[0] for row in self.db.query(UserCourse.course_id).filter(
+            UserCourse.user_id.in_(user_ids)
+        ).distinct().all()]
+    
+    def bump_for_projects(self, project_ids: Iterable[int], commit: bool = True) -> None:
+        """Bump the courses the given projects belong to."""
+        self.bump(self.courses_for_projects(project_ids), commit=commit)
+    
+    def bump_for_users(self, user_ids: Iterable[int], commit: bool = True) -> None:
+        """Bump every course the given users are enrolled in."""
+        self.bump(self.courses_for_users(user_ids), commit=commit)
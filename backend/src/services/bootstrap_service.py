@@ -0,0 +1,54 @@
+from sqlalchemy.orm import Session
+from src.model.bootstrap import BootstrapResponse
+from src.services.course_service import CourseService
+from src.services.semester_service import SemesterService
+from src.services.skill_service import SkillService
+from src.services.user_course_service import UserCourseService
+from src.services.user_service import UserService
+from src.services.user_skill_service import UserSkillService
+from typing import Optional
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rows returned per list, as for the skills multi-select.
+BOOTSTRAP_LIST_LIMIT = 1000
+
+class BootstrapService:
+    """Service class for the data the frontend loads before its first render."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_bootstrap(self, username: Optional[str]) -> BootstrapResponse:
+        """Assemble the signed-in user, current semester, skills and courses.
+        
+        Every part comes from the existing services, sharing this service's
+        session.
+        
+        Args:
+            username (Optional[str]): Username from the session, or None if nobody is signed in.
+            
+        Returns:
+            BootstrapResponse: The user and their enrollments and skills (empty when signed out),
+            the current semester, every skill, and the current semester's courses, or every
+            course when no semester is current.
+        """
+        started = time.perf_counter()
+        course_service = CourseService(self.db)
+        bootstrap = BootstrapResponse(
+            current_semester=SemesterService(self.db).get_current_semester(),
+            skills=SkillService(self.db).list_skills(limit=BOOTSTRAP_LIST_LIMIT),
+        )
+        if bootstrap.current_semester is not None:
+            bootstrap.courses = course_service.get_courses_by_semester(bootstrap.current_semester.id, limit=BOOTSTRAP_LIST_LIMIT)
+        else:
+            bootstrap.courses = course_service.list_courses(limit=BOOTSTRAP_LIST_LIMIT)
+        if username:
+            bootstrap.user = UserService(self.db).get_user_by_username(username)
+        if bootstrap.user is not None:
+            bootstrap.user_courses = UserCourseService(self.db).get_user_courses_by_user(bootstrap.user.id, limit=BOOTSTRAP_LIST_LIMIT)
+            bootstrap.user_skills = UserSkillService(self.db).get_user_skills_by_user(bootstrap.user.id, limit=BOOTSTRAP_LIST_LIMIT)
+        logger.info(f"Assembled bootstrap for {username or 'anonymous user'} in {(time.perf_counter() - started) * 1000:.1f} ms")
+        return bootstrap
@@ -1,7 +1,10 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.model.course import Course, CourseCreate, CourseResponse
-from typing import List, Optional
+from src.core.streaming import stream_envelope
+from src.services.semester_snapshot_service import SemesterSnapshotService, notify_change
+from src.services.grouped_count_service import grouped_counts
+from typing import Dict, Iterator, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,7 @@ class CourseService:
             self.db.commit()
             self.db.refresh(db_course)
             logger.info(f"Created course with ID: {db_course.id}")
+            notify_change("courses")
             return CourseResponse.model_validate(db_course)
         except IntegrityError as e:
             self.db.rollback()
@@ -100,6 +104,14 @@ class CourseService:
         logger.info(f"Retrieved {len(courses)} courses with skip={skip}, limit={limit}")
         return [CourseResponse.model_validate(course) for course in courses]
     
+    def stream_courses(self) -> Iterator[bytes]:
+        """Stream every course in ID order as one JSON response body.
+        
+        Returns:
+            Iterator[bytes]: Encoded chunks of the response envelope.
+        """
+        return stream_envelope(self.db, self.db.query(Course).order_by(Course.id), CourseResponse, "courses")
+    
     def update_course(self, course_id: int, course_data: CourseCreate) -> Optional[CourseResponse]:
         """Update an existing course by ID.
         
@@ -123,6 +135,7 @@ class CourseService:
             self.db.commit()
             self.db.refresh(db_course)
             logger.info(f"Updated course with ID: {db_course.id}")
+            notify_change("courses")
             return CourseResponse.model_validate(db_course)
         except IntegrityError as e:
             self.db.rollback()
@@ -148,6 +161,7 @@ class CourseService:
             self.db.delete(db_course)
             self.db.commit()
             logger.info(f"Deleted course with ID {course_id} and {len(user_courses)} user relationships")
+            notify_change("courses")
             return True
         except Exception as e:
             self.db.rollback()
@@ -171,8 +185,22 @@ class CourseService:
         Returns:
             int: Total number of courses for the semester.
         """
+        snapshot = SemesterSnapshotService(self.db).get_snapshot()
+        if snapshot.semester_id == semester_id:
+            return snapshot.count("courses", "semester_id", semester_id)
         return self.db.query(Course).filter(Course.semester_id == semester_id).count()
     
+    def get_courses_count_by_semesters(self, semester_ids: Optional[List[int]] = None) -> Dict[int, int]:
+        """Get the number of courses of many semesters with one grouped query.
+        
+        Args:
+            semester_ids (Optional[List[int]]): The IDs of the semesters, or None for every semester with courses.
+            
+        Returns:
+            Dict[int, int]: Number of courses per semester ID.
+        """
+        return grouped_counts(self.db, "courses", Course.semester_id, semester_ids)
+    
     def search_courses(self, search_term: str, skip: int = 0, limit: int = 10) -> List[CourseResponse]:
         """Search courses by display name or CRN.
         
@@ -0,0 +1,125 @@
+from sqlalchemy.orm import Session
+from src.model.course import Course
+from src.model.coverage import CourseCoverageResponse, TeamCoverage
+from src.model.project import Project
+from src.model.project_skill import ProjectSkill
+from src.model.project_user import ProjectUser
+from src.model.user_skill import UserSkill
+from src.matching.bitsets import build_bitsets, missing_team_skills, popcount, to_indices
+from src.matching.problem import index_of
+from typing import Dict, Optional
+import numpy as np
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Latest coverage per course, recomputed after every assignment change in this process.
+_coverage_cache: Dict[int, CourseCoverageResponse] = {}
+_coverage_lock = threading.Lock()
+
+def invalidate_coverage(course_id: Optional[int] = None) -> None:
+    """Drop cached coverage for one course, or for all courses when skills change."""
+    with _coverage_lock:
+        if course_id is None:
+            _coverage_cache.clear()
+        else:
+            _coverage_cache.pop(course_id, None)
+
+class CoverageService:
+    """Service class for checking that each team covers its project's required skills."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_course_coverage(self, course_id: int, refresh: bool = False) -> Optional[CourseCoverageResponse]:
+        """Return the cached coverage report for a course, computing it if needed.
+        
+        Args:
+            course_id (int): The ID of the course.
+            refresh (bool): Recompute even if a cached report exists.
+            
+        Returns:
+            Optional[CourseCoverageResponse]: Per-team coverage, or None if the course does not exist.
+        """
+        if not refresh:
+            with _coverage_lock:
+                cached = _coverage_cache.get(course_id)
+            if cached:
+                return cached
+        return self.refresh_course_coverage(course_id)
+    
+    def refresh_course_coverage(self, course_id: int) -> Optional[CourseCoverageResponse]:
+        """Recompute and cache a course's coverage report.
+        
+        Each user's and project's skills become fixed-width uint64 bitsets;
+        a team's skills are the OR of its members' bitsets and its missing
+        skills are ``required & ~team``.
+        """
+        if not self.db.query(Course.id).filter(Course.id == course_id).first():
+            invalidate_coverage(course_id)
+            return None
+        
+        project_ids = np.array(
+            [row[0] for row in self.db.query(Project.id).filter(Project.course_id == course_id).order_by(Project.id).all()],
+            dtype=np.int64,
+        )
+        required_pairs = np.array(
+            self.db.query(ProjectSkill.project_id, ProjectSkill.skill_id)
+            .join(Project, Project.id == ProjectSkill.project_id)
+            .filter(Project.course_id == course_id).all(),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        member_pairs = np.array(
+            self.db.query(ProjectUser.project_id, ProjectUser.user_id)
+            .join(Project, Project.id == ProjectUser.project_id)
+            .filter(Project.course_id == course_id).all(),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        member_skill_pairs = np.array(
+            self.db.query(ProjectUser.user_id, UserSkill.skill_id)
+            .join(Project, Project.id == ProjectUser.project_id)
+            .join(UserSkill, UserSkill.user_id == ProjectUser.user_id)
+            .filter(Project.course_id == course_id).distinct().all(),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        
+        started = time.perf_counter()
+        skill_ids = np.unique(np.concatenate([required_pairs[:, 1], member_skill_pairs[:, 1]]))
+        user_ids = np.unique(member_pairs[:, 1])
+        n_projects, n_skills = project_ids.shape[0], skill_ids.shape[0]
+        
+        required = build_bitsets(index_of(project_ids, required_pairs[:, 0]), index_of(skill_ids, required_pairs[:, 1]), n_projects, n_skills)
+        user_bits = build_bitsets(index_of(user_ids, member_skill_pairs[:, 0]), index_of(skill_ids, member_skill_pairs[:, 1]), user_ids.shape[0], n_skills)
+        missing = missing_team_skills(required, user_bits[index_of(user_ids, member_pairs[:, 1])], index_of(project_ids, member_pairs[:, 0]))
+        
+        required_counts = popcount(required).tolist()
+        missing_counts = popcount(missing).tolist()
+        missing_skills = [skill_ids[bits].tolist() for bits in to_indices(missing)]
+        team_sizes = np.bincount(index_of(project_ids, member_pairs[:, 0]), minlength=n_projects).tolist()
+        compute_ms = (time.perf_counter() - started) * 1000
+        
+        teams = [
+            TeamCoverage(
+                project_id=project_id,
+                team_size=team_sizes[i],
+                required_skills=required_counts[i],
+                covered_skills=required_counts[i] - missing_counts[i],
+                missing_skill_ids=missing_skills[i],
+                fully_covered=missing_counts[i] == 0,
+            )
+            for i, project_id in enumerate(project_ids.tolist())
+        ]
+        report = CourseCoverageResponse(
+            course_id=course_id,
+            n_teams=n_projects,
+            n_fully_covered=sum(1 for t in teams if t.fully_covered),
+            n_missing_skills=int(sum(missing_counts)),
+            compute_ms=compute_ms,
+            teams=teams,
+        )
+        with _coverage_lock:
+            _coverage_cache[course_id] = report
+        logger.info(f"Coverage for course {course_id}: {report.n_fully_covered}/{n_projects} teams fully covered ({compute_ms:.2f} ms)")
+        return report
@@ -0,0 +1,93 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from src.model.course import Course
+from src.model.do_not_pair import DoNotPair, DoNotPairCreate, DoNotPairResponse
+from src.model.user_course import UserCourse
+from src.services.assignment_version_service import AssignmentVersionService
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+class DoNotPairService:
+    """Service class for handling do-not-pair constraint business logic."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def create_do_not_pair(self, pair_data: DoNotPairCreate) -> DoNotPairResponse:
+        """Record that two students of a course must not share a project.
+        
+        The pair is unordered, so (a, b) and (b, a) are the same constraint.
+        
+        Raises:
+            ValueError: If both IDs are the same user, the course does not exist,
+                either user is not enrolled in it, or the pair already exists.
+        """
+        if pair_data.user_id == pair_data.other_user_id:
+            raise ValueError("Do-not-pair creation failed: a user cannot be separated from themselves")
+        if not self.db.query(Course.id).filter(Course.id == pair_data.course_id).first():
+            raise ValueError(f"Do-not-pair creation failed: course {pair_data.course_id} does not exist")
+        enrolled = {
+            row[0] for row in self.db.query(UserCourse.user_id).filter(
+                UserCourse.course_id == pair_data.course_id,
+                UserCourse.user_id.in_([pair_data.user_id, pair_data.other_user_id]),
+            ).all()
+        }
+        missing = sorted({pair_data.user_id, pair_data.other_user_id} - enrolled)
+        if missing:
+            raise ValueError(f"Do-not-pair creation failed: users {missing} are not enrolled in course {pair_data.course_id}")
+        try:
+            db_pair = DoNotPair(
+                course_id=pair_data.course_id,
+                user_id=min(pair_data.user_id, pair_data.other_user_id),
+                other_user_id=max(pair_data.user_id, pair_data.other_user_id),
+            )
+            self.db.add(db_pair)
+            AssignmentVersionService(self.db).bump([db_pair.course_id], commit=False)
+            self.db.commit()
+            self.db.refresh(db_pair)
+            logger.info(f"Created do-not-pair constraint with ID: {db_pair.id}")
+            return DoNotPairResponse.model_validate(db_pair)
+        except IntegrityError as e:
+            self.db.rollback()
+            logger.error(f"Failed to create do-not-pair constraint due to integrity error: {e}")
+            raise ValueError("Do-not-pair creation failed: integrity constraint violation")
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to create do-not-pair constraint: {e}")
+            raise ValueError(f"Do-not-pair creation failed: {str(e)}")
+    
+    def get_do_not_pair_by_id(self, pair_id: int) -> Optional[DoNotPairResponse]:
+        pair = self.db.query(DoNotPair).filter(DoNotPair.id == pair_id).first()
+        if pair:
+            return DoNotPairResponse.model_validate(pair)
+        return None
+    
+    def get_do_not_pairs_by_course(self, course_id: int) -> List[DoNotPairResponse]:
+        pairs = self.db.query(DoNotPair).filter(DoNotPair.course_id == course_id).order_by(DoNotPair.id).all()
+        logger.info(f"Retrieved {len(pairs)} do-not-pair constraints for course {course_id}")
+        return [DoNotPairResponse.model_validate(p) for p in pairs]
+    
+    def list_do_not_pairs(self, skip: int = 0, limit: int = 10) -> List[DoNotPairResponse]:
+        pairs = self.db.query(DoNotPair).offset(skip).limit(limit).all()
+        logger.info(f"Retrieved {len(pairs)} do-not-pair constraints with skip={skip}, limit={limit}")
+        return [DoNotPairResponse.model_validate(p) for p in pairs]
+    
+    def delete_do_not_pair(self, pair_id: int) -> bool:
+        db_pair = self.db.query(DoNotPair).filter(DoNotPair.id == pair_id).first()
+        if not db_pair:
+            return False
+        try:
+            AssignmentVersionService(self.db).bump([db_pair.course_id], commit=False)
+            self.db.delete(db_pair)
+            self.db.commit()
+            logger.info(f"Deleted do-not-pair constraint with ID: {pair_id}")
+            return True
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to delete do-not-pair constraint {pair_id}: {e}")
+            raise ValueError(f"Deletion failed: {str(e)}")
+    
+    def get_do_not_pairs_count(self) -> int:
+        return self.db.query(DoNotPair).count()
@@ -0,0 +1,64 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from src.core.etag import make_etag
+from src.model.course import Course
+from src.model.project import Project
+from src.model.project_skill import ProjectSkill
+from src.model.project_user import ProjectUser
+from src.model.semester import Semester
+from src.model.skill import Skill
+from src.model.user import User
+from src.model.user_course import UserCourse
+from src.model.user_skill import UserSkill
+from src.services.semester_snapshot_service import table_version
+from typing import Sequence
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tables whose GET routes answer conditional requests, by change-hook name.
+ETAG_TABLES = {
+    "users": User,
+    "semesters": Semester,
+    "courses": Course,
+    "projects": Project,
+    "skills": Skill,
+    "project_skills": ProjectSkill,
+    "project_users": ProjectUser,
+    "user_courses": UserCourse,
+    "user_skills": UserSkill,
+}
+
+class EtagService:
+    """Service class for entity tags of responses read from whole tables."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def table_etag(self, tables: Sequence[str], key: str) -> str:
+        """Entity tag for a response that only reads ``tables``, without building the response.
+        
+        Each table contributes its change-hook version, which covers writes
+        made through this process, and its row count, highest ID and, where
+        the table has one, latest ``updated_at``. The aggregates catch rows
+        that other processes insert or delete, and edits they make to tables
+        with ``updated_at``; an in-place edit by another process to a table
+        without it, such as the manager flag on ``project_users``, is not
+        seen until this process's next write to the table. The aggregates
+        come from one query per table.
+        
+        Args:
+            tables (Sequence[str]): Tables the response is built from, keys of ``ETAG_TABLES``.
+            key (str): What else the response depends on, e.g. the request path and query string.
+            
+        Returns:
+            str: A strong entity tag, quoted.
+        """
+        parts = [key]
+        for table in tables:
+            model = ETAG_TABLES[table]
+            columns = [func.count(), func.max(model.id)]
+            if hasattr(model, "updated_at"):
+                columns.append(func.max(model.updated_at))
+            parts.append((table, table_version(table), tuple(self.db.query(*columns).one())))
+        return make_etag(repr(parts).encode())
@@ -0,0 +1,66 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from src.services.semester_snapshot_service import table_version
+from typing import Dict, List, Optional, Tuple
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on IDs in one grouped count request.
+MAX_GROUPED_IDS = 1000
+
+# Row counts of a whole table per key, tagged with the table version they were counted at.
+_count_cache: Dict[Tuple[str, str], Tuple[int, Dict[int, int]]] = {}
+_count_lock = threading.Lock()
+
+def parse_ids(ids: Optional[str]) -> Optional[List[int]]:
+    """Parse a comma-separated ID list from a query string; None means every ID.
+
+    Raises:
+        ValueError: If an entry is not an integer or there are too many.
+    """
+    if ids is None:
+        return None
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise ValueError(f"Invalid ID list: {ids}")
+    if len(parsed) > MAX_GROUPED_IDS:
+        raise ValueError(f"At most {MAX_GROUPED_IDS} IDs can be counted at once")
+    return parsed
+
+def grouped_counts(db: Session, table: str, column, ids: Optional[List[int]] = None) -> Dict[int, int]:
+    """Row counts of a table grouped by one column, from a single ``GROUP BY`` query.
+
+    The counts for every key are cached until the table's next change, so
+    later requests for other IDs are answered without a query.
+
+    Args:
+        db (Session): Database session.
+        table (str): Table name, as passed to the change hook.
+        column: Mapped column to group by, e.g. ``Project.course_id``.
+        ids (Optional[List[int]]): Keys to report, each with 0 if it has no rows; every key with rows if None.
+
+    Returns:
+        Dict[int, int]: Row count per key.
+    """
+    key = (table, column.key)
+    version = table_version(table)
+    with _count_lock:
+        cached = _count_cache.get(key)
+    if cached is not None and cached[0] == version:
+        counts = cached[1]
+    else:
+        started = time.perf_counter()
+        counts = {
+            value: count
+            for value, count in db.query(column, func.count()).filter(column.isnot(None)).group_by(column).all()
+        }
+        with _count_lock:
+            _count_cache[key] = (version, counts)
+        logger.info(f"Counted {table} by {column.key} for {len(counts)} keys in {(time.perf_counter() - started) * 1000:.1f} ms")
+    if ids is None:
+        return dict(counts)
+    return {value: counts.get(value, 0) for value in ids}
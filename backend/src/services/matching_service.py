@@ -0,0 +1,594 @@
+from sqlalchemy.orm import Session
+from src.model.course import Course
+from src.model.semester import Semester
+from src.model.matching_run import MatchingRun
+from src.model.matching import MAX_SWEEP_SIZE, MatchingRunRequest, MatchingRunResponse, MatchingAssignment, MatchingWeights, MatchingSweepRequest, MatchingSweepResponse, MatchingSweepRow, MatchExplanation, ProjectMatchExplanation, AssignmentMetricsResponse, ProjectFill, MatchingBalanceRequest, MatchingBalanceResponse, BalanceTracePoint, ProjectManagerResponse, ProjectManagerDesignation, AssignmentImportRequest, AssignmentImportResponse, QualityPoint, SemesterMatchingRequest, SemesterMatchingResponse, CourseMatchingSummary
+from src.matching.problem import MatchingProblem, index_of
+from src.matching.loader import load_course_problem, load_current_assignment
+from src.matching.cache import input_hash, pack_ids, unpack_ids, pack_assignment, unpack_assignment
+from src.services.assignment_snapshot_service import build_snapshot
+from src.services.coverage_service import CoverageService
+from src.services.assignment_version_service import AssignmentVersionService
+from src.services.semester_snapshot_service import notify_change
+from src.matching.writer import write_assignment, write_assignments, write_managers
+from src.matching.roles import designate_managers
+from src.matching.solver import ENGINES
+from src.matching.anytime import ANYTIME_ENGINE
+from src.matching.parallel import CourseSolve, solve_course, solve_courses
+from src.matching.sweep import sweep_weights
+from src.matching.explain import explain_assignment, pack_explanation, unpack_explanation
+from src.matching.metrics import assignment_quality
+from src.matching.balance import balance_assignment
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import itertools
+import os
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Points kept from an improvement trace or quality curve in a response.
+MAX_TRACE_POINTS = 200
+
+# Weightings whose metrics are kept per course, least recently used dropped first.
+MAX_CACHED_WEIGHTINGS = 8
+
+# Metrics per course and weights, for the assignment version they were computed at; a new version replaces the course's entry.
+_metrics_cache: Dict[int, Tuple[int, "OrderedDict[Tuple[float, float, float], AssignmentMetricsResponse]"]] = {}
+_metrics_lock = threading.Lock()
+
+class MatchingService:
+    """Service class for running the student-to-project matcher."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def run_course_matching(self, course_id: int, request: MatchingRunRequest) -> Optional[MatchingRunResponse]:
+        """Match a course's students to its projects and store the assignment.
+        
+        Runs are keyed by a hash of their inputs; when a previous run of the
+        course has the same hash its stored assignment is reused instead of
+        solving again.
+        
+        Args:
+            course_id (int): The ID of the course to match.
+            request (MatchingRunRequest): Score weights and grouping options.
+            
+        Returns:
+            Optional[MatchingRunResponse]: Run summary and assignments, or None if the course does not exist.
+            
+        Raises:
+            ValueError: If the engine is unknown or the assignment cannot be written.
+        """
+        if request.engine not in ENGINES and request.engine != ANYTIME_ENGINE:
+            raise ValueError(f"Unknown matching engine: {request.engine}")
+        if not self.db.query(Course.id).filter(Course.id == course_id).first():
+            return None
+        
+        engine = request.engine
+        budget_ms = request.time_budget_ms if engine == ANYTIME_ENGINE else None
+        problem = load_course_problem(self.db, course_id)
+        key = input_hash(problem, request.weights, engine, request.group_teammates, budget_ms)
+        curve = []
+        run = self.db.query(MatchingRun).filter(
+            MatchingRun.course_id == course_id,
+            MatchingRun.input_hash == key
+        ).order_by(MatchingRun.id.desc()).first()
+        cached = run is not None
+        
+        if cached:
+            assignment = unpack_assignment(problem, run.assignment)
+            logger.info(f"Matching run for course {course_id} served from cached run {run.id}")
+        else:
+            solve = solve_course(problem, request.weights, request.group_teammates, engine, budget_ms / 1000 if budget_ms else None)
+            assignment, curve = solve.result.assignment, solve.curve
+            run = self._record_run(problem, request, key, solve)
+        # A new run, its snapshot and the version bump commit in the same transaction as the assignment.
+        AssignmentVersionService(self.db).bump([course_id], commit=False)
+        write_assignment(self.db, problem, assignment)
+        notify_change("project_users")
+        managers = designate_managers(problem, assignment)
+        write_managers(self.db, problem, managers)
+        # Again, since a read between the two writes is tagged with the unflagged rows.
+        notify_change("project_users")
+        CoverageService(self.db).refresh_course_coverage(course_id)
+        return self._run_response(problem, run, assignment, managers, cached, curve)
+    
+    def run_semester_matching(self, semester_id: int, request: SemesterMatchingRequest) -> Optional[SemesterMatchingResponse]:
+        """Match every course of a semester, solving the courses concurrently.
+        
+        Each course is loaded and looked up in the run cache on its own;
+        the uncached ones are solved across a process pool. All new runs,
+        snapshots and assignments are then written in one transaction.
+        
+        Args:
+            semester_id (int): The ID of the semester.
+            request (SemesterMatchingRequest): Matching options shared by every course, plus the pool size.
+            
+        Returns:
+            Optional[SemesterMatchingResponse]: Per-course summaries and timings, or None if the semester does not exist.
+            
+        Raises:
+            ValueError: If the engine is unknown or the assignments cannot be written.
+        """
+        if request.engine not in ENGINES and request.engine != ANYTIME_ENGINE:
+            raise ValueError(f"Unknown matching engine: {request.engine}")
+        if not self.db.query(Semester.id).filter(Semester.id == semester_id).first():
+            return None
+        
+        started = time.perf_counter()
+        engine = request.engine
+        budget_ms = request.time_budget_ms if engine == ANYTIME_ENGINE else None
+        course_ids = [row[0] for row in self.db.query(Course.id).filter(Course.semester_id == semester_id).order_by(Course.id).all()]
+        problems, keys, load_ms = [], [], []
+        for course_id in course_ids:
+            course_started = time.perf_counter()
+            problem = load_course_problem(self.db, course_id)
+            problems.append(problem)
+            keys.append(input_hash(problem, request.weights, engine, request.group_teammates, budget_ms))
+            load_ms.append((time.perf_counter() - course_started) * 1000)
+        runs = {}
+        if keys:
+            for run in self.db.query(MatchingRun).filter(
+                MatchingRun.course_id.in_(course_ids),
+                MatchingRun.input_hash.in_(keys)
+            ).order_by(MatchingRun.id).all():
+                runs[(run.course_id, run.input_hash)] = run
+        loaded = time.perf_counter()
+        
+        pending = [i for i, (course_id, key) in enumerate(zip(course_ids, keys)) if (course_id, key) not in runs]
+        workers = min(request.max_workers or os.cpu_count() or 1, max(len(pending), 1))
+        solves = solve_courses(
+            [problems[i] for i in pending], request.weights, request.group_teammates, engine,
+            budget_ms / 1000 if budget_ms else None, workers,
+        )
+        solved = dict(zip(pending, solves))
+        solved_at = time.perf_counter()
+        
+        assignments, managers, course_runs = [], [], []
+        for i, (problem, key) in enumerate(zip(problems, keys)):
+            if i in solved:
+                run = self._record_run(problem, request, key, solved[i])
+                assignment = solved[i].result.assignment
+            else:
+                run = runs[(problem.course_id, key)]
+                assignment = unpack_assignment(problem, run.assignment)
+            assignments.append(assignment)
+            managers.append(designate_managers(problem, assignment))
+            course_runs.append(run)
+        AssignmentVersionService(self.db).bump(course_ids, commit=False)
+        write_assignments(self.db, problems, assignments, managers)
+        notify_change("project_users")
+        coverage_service = CoverageService(self.db)
+        for course_id in course_ids:
+            coverage_service.refresh_course_coverage(course_id)
+        written = time.perf_counter()
+        
+        courses = [
+            CourseMatchingSummary(
+                course_id=problem.course_id,
+                run_id=run.id,
+                cached=i not in solved,
+                n_students=problem.n_students,
+                n_assigned=int((assignment >= 0).sum()),
+                utility=run.utility,
+                load_ms=load_ms[i],
+                solve_ms=solved[i].seconds * 1000 if i in solved else 0.0,
+            )
+            for i, (problem, run, assignment) in enumerate(zip(problems, course_runs, assignments))
+        ]
+        logger.info(f"Matched {len(course_ids)} courses of semester {semester_id} ({len(pending)} solved) in {(written - started) * 1000:.1f} ms")
+        return SemesterMatchingResponse(
+            semester_id=semester_id,
+            engine=engine,
+            n_courses=len(course_ids),
+            n_students=sum(course.n_students for course in courses),
+            n_assigned=sum(course.n_assigned for course in courses),
+            max_workers=workers,
+            load_ms=(loaded - started) * 1000,
+            solve_ms=(solved_at - loaded) * 1000,
+            write_ms=(written - solved_at) * 1000,
+            elapsed_ms=(written - started) * 1000,
+            courses=courses,
+        )
+    
+    def _record_run(self, problem: MatchingProblem, request: MatchingRunRequest, key: str, solve: CourseSolve) -> MatchingRun:
+        """Add a new run and its matching snapshot to the session without committing."""
+        result = solve.result
+        run = MatchingRun(
+            course_id=problem.course_id,
+            input_hash=key,
+            engine=request.engine,
+            weights=request.weights.model_dump(),
+            group_teammates=request.group_teammates,
+            user_ids=pack_ids(problem.user_ids),
+            assignment=pack_assignment(problem, result.assignment),
+            explanation=pack_explanation(explain_assignment(problem, request.weights, result.assignment)),
+            utility=result.utility,
+            n_units=result.n_units,
+            grouping_ms=result.grouping_seconds * 1000,
+            scoring_ms=result.scoring_seconds * 1000,
+            solve_ms=result.solve_seconds * 1000,
+        )
+        self.db.add(run)
+        snapshot = build_snapshot(problem.course_id, problem.user_ids, unpack_ids(run.assignment), source="matching")
+        snapshot.matching_run = run
+        self.db.add(snapshot)
+        return run
+    
+    def get_assignment_metrics(self, course_id: int, weights: Optional[MatchingWeights] = None) -> Optional[AssignmentMetricsResponse]:
+        """Measure the quality of a course's current project-user assignment.
+        
+        Results are cached for the last MAX_CACHED_WEIGHTINGS weightings of a
+        course, until the course's assignment version changes.
+        
+        Args:
+            course_id (int): The ID of the course.
+            weights (Optional[MatchingWeights]): Weights for the utility figures; defaults to equal weights.
+            
+        Returns:
+            Optional[AssignmentMetricsResponse]: The metrics, or None if the course does not exist.
+        """
+        if not self.db.query(Course.id).filter(Course.id == course_id).first():
+            return None
+        weights = weights or MatchingWeights()
+        key = (weights.skill, weights.preference, weights.teammate)
+        version = AssignmentVersionService(self.db).get_version(course_id)
+        with _metrics_lock:
+            entry = _metrics_cache.get(course_id)
+            if entry and entry[0] == version and key in entry[1]:
+                entry[1].move_to_end(key)
+                return entry[1][key]
+        
+        started = time.perf_counter()
+        problem = load_course_problem(self.db, course_id)
+        assignment = load_current_assignment(self.db, problem)
+        quality = assignment_quality(problem, weights, assignment)
+        rank_counts = quality.rank_counts.tolist()
+        n_assigned = problem.n_students - rank_counts[4]
+        metrics = AssignmentMetricsResponse(
+            course_id=course_id,
+            assignment_version=version,
+            n_students=problem.n_students,
+            n_assigned=n_assigned,
+            first_choice=rank_counts[0],
+            second_choice=rank_counts[1],
+            third_choice=rank_counts[2],
+            unranked=rank_counts[3],
+            unassigned=rank_counts[4],
+            top_choice_rate=quality.top_choice_rate,
+            utility_gini=quality.utility_gini,
+            mean_utility=quality.mean_utility,
+            capacity=quality.capacity,
+            capacity_fill=n_assigned / quality.capacity if quality.capacity else 0.0,
+            projects=[
+                ProjectFill(project_id=project_id, capacity=capacity, filled=filled)
+                for project_id, capacity, filled in zip(problem.project_ids.tolist(), problem.capacities.tolist(), quality.filled.tolist())
+            ],
+            unmet_teammate_pairs=quality.unmet_teammate_pairs,
+            unmet_mutual_pairs=quality.unmet_mutual_pairs,
+            violated_do_not_pairs=quality.violated_do_not_pairs,
+            compute_ms=(time.perf_counter() - started) * 1000,
+        )
+        with _metrics_lock:
+            entry = _metrics_cache.get(course_id)
+            if entry is None or entry[0] < version:
+                entry = _metrics_cache[course_id] = (version, OrderedDict())
+            if entry[0] == version:
+                entry[1][key] = metrics
+                if len(entry[1]) > MAX_CACHED_WEIGHTINGS:
+                    entry[1].popitem(last=False)
+        return metrics
+    
+    def balance_course(self, course_id: int, request: MatchingBalanceRequest) -> Optional[MatchingBalanceResponse]:
+        """Rebalance a course's current teams by local search under a time budget.
+        
+        When ``request.apply`` is set and any student moved, the balanced
+        assignment replaces the course's project-user rows and is recorded
+        as a snapshot.
+        
+        Args:
+            course_id (int): The ID of the course.
+            request (MatchingBalanceRequest): Weights, balance penalties and time budget.
+            
+        Returns:
+            Optional[MatchingBalanceResponse]: The improvement and the changed placements, or None if the course does not exist.
+            
+        Raises:
+            ValueError: If the balanced assignment cannot be written.
+        """
+        if not self.db.query(Course.id).filter(Course.id == course_id).first():
+            return None
+        
+        problem = load_course_problem(self.db, course_id)
+        current = load_current_assignment(self.db, problem)
+        result = balance_assignment(
+            problem, request.weights, current, request.penalties,
+            time_budget=request.time_budget_ms / 1000, seed=request.seed,
+        )
+        changed = np.flatnonzero(result.assignment != current)
+        applied = bool(request.apply and changed.shape[0])
+        if applied:
+            project_ids = np.where(result.assignment >= 0, problem.project_ids[np.maximum(result.assignment, 0)], 0)
+            self.db.add(build_snapshot(course_id, problem.user_ids, project_ids, source="balance"))
+            AssignmentVersionService(self.db).bump([course_id], commit=False)
+            write_assignment(self.db, problem, result.assignment)
+            notify_change("project_users")
+            write_managers(self.db, problem, designate_managers(problem, result.assignment))
+            notify_change("project_users")
+            CoverageService(self.db).refresh_course_coverage(course_id)
+        
+        return MatchingBalanceResponse(
+            course_id=course_id,
+            applied=applied,
+            n_students=problem.n_students,
+            objective_before=result.objective_before,
+            objective_after=result.objective_after,
+            n_evaluated=result.n_evaluated,
+            n_moves=result.n_moves,
+            n_swaps=result.n_swaps,
+            elapsed_ms=result.elapsed_seconds * 1000,
+            trace=[
+                BalanceTracePoint(elapsed_ms=seconds * 1000, objective=objective)
+                for seconds, objective in _downsample(result.trace)
+            ],
+            changes=[
+                MatchingAssignment(user_id=int(problem.user_ids[i]), project_id=int(problem.project_ids[result.assignment[i]]))
+                for i in changed.tolist()
+            ],
+        )
+    
+    def designate_project_managers(self, course_id: int) -> Optional[ProjectManagerResponse]:
+        """Re-pick one project manager per team from a course's current assignment.
+        
+        Args:
+            course_id (int): The ID of the course.
+            
+        Returns:
+            Optional[ProjectManagerResponse]: The designated managers, or None if the course does not exist.
+            
+        Raises:
+            ValueError: If the designations cannot be written.
+        """
+        if not self.db.query(Course.id).filter(Course.id == course_id).first():
+            return None
+        problem = load_course_problem(self.db, course_id)
+        managers = designate_managers(problem, load_current_assignment(self.db, problem))
+        write_managers(self.db, problem, managers)
+        notify_change("project_users")
+        staffed = np.flatnonzero(managers >= 0)
+        return ProjectManagerResponse(
+            course_id=course_id,
+            n_teams=int(staffed.shape[0]),
+            managers=[
+                ProjectManagerDesignation(project_id=project_id, user_id=user_id)
+                for project_id, user_id in zip(problem.project_ids[staffed].tolist(), problem.user_ids[managers[staffed]].tolist())
+            ],
+        )
+    
+    def import_course_assignment(self, course_id: int, request: AssignmentImportRequest) -> Optional[AssignmentImportResponse]:
+        """Replace a course's project-user rows with a complete assignment given by ID.
+        
+        Args:
+            course_id (int): The ID of the course.
+            request (AssignmentImportRequest): One row per student, plus an optional snapshot label.
+            
+        Returns:
+            Optional[AssignmentImportResponse]: Import summary, or None if the course does not exist.
+            
+        Raises:
+            ValueError: If a row names a student not enrolled in the course or a project outside it,
+                a non-positive project ID, a student appears twice, a project is over capacity or has several managers, or the write fails.
+        """
+        if not self.db.query(Course.id).filter(Course.id == course_id).first():
+            return None
+        
+        invalid = [row.project_id for row in request.assignments if row.project_id is not None and row.project_id <= 0]
+        if invalid:
+            raise ValueError(f"Import failed: invalid project IDs {sorted(set(invalid))}; leave project_id null for an unassigned student")
+        problem = load_course_problem(self.db, course_id)
+        user_ids = np.array([row.user_id for row in request.assignments], dtype=np.int64)
+        # Unassigned rows (project_id null) become 0, which no project has.
+        project_ids = np.array([0 if row.project_id is None else row.project_id for row in request.assignments], dtype=np.int64)
+        flagged = np.array([row.is_project_manager for row in request.assignments], dtype=bool)
+        
+        students = index_of(problem.user_ids, user_ids)
+        if (students < 0).any():
+            raise ValueError(f"Import failed: {int((students < 0).sum())} students are not enrolled in course {course_id}")
+        if np.unique(students).shape[0] != students.shape[0]:
+            raise ValueError("Import failed: a student appears more than once")
+        projects = np.where(project_ids > 0, index_of(problem.project_ids, project_ids), -1)
+        if ((project_ids > 0) & (projects < 0)).any():
+            raise ValueError(f"Import failed: {int(((project_ids > 0) & (projects < 0)).sum())} rows name a project outside course {course_id}")
+        assignment = np.full(problem.n_students, -1, dtype=np.int64)
+        assignment[students] = projects
+        over = np.flatnonzero(np.bincount(assignment[assignment >= 0], minlength=problem.n_projects) > problem.capacities)
+        if over.shape[0]:
+            raise ValueError(f"Import failed: projects {problem.project_ids[over].tolist()} are over capacity")
+        
+        flagged &= projects >= 0
+        if flagged.any():
+            if np.unique(projects[flagged]).shape[0] != int(flagged.sum()):
+                raise ValueError("Import failed: a project has more than one project manager")
+            managers = np.full(problem.n_projects, -1, dtype=np.int64)
+            managers[projects[flagged]] = students[flagged]
+        else:
+            managers = designate_managers(problem, assignment)
+        
+        snapshot = build_snapshot(course_id, problem.user_ids, np.where(assignment >= 0, problem.project_ids[np.maximum(assignment, 0)], 0), source="import", label=request.label)
+        self.db.add(snapshot)
+        AssignmentVersionService(self.db).bump([course_id], commit=False)
+        write_assignment(self.db, problem, assignment)
+        notify_change("project_users")
+        write_managers(self.db, problem, managers)
+        notify_change("project_users")
+        CoverageService(self.db).refresh_course_coverage(course_id)
+        n_assigned = int((assignment >= 0).sum())
+        return AssignmentImportResponse(
+            course_id=course_id,
+            snapshot_id=snapshot.id,
+            n_students=problem.n_students,
+            n_assigned=n_assigned,
+            n_unmatched=problem.n_students - n_assigned,
+            n_project_managers=int((managers >= 0).sum()),
+        )
+    
+    def explain_student(self, run_id: int, user_id: int) -> Optional[MatchExplanation]:
+        """Explain one student's placement from a run's cached score components.
+        
+        Args:
+            run_id (int): The ID of the matching run.
+            user_id (int): The ID of the student.
+            
+        Returns:
+            Optional[MatchExplanation]: The breakdown, or None if the run does not exist or did not include the student.
+            
+        Raises:
+            ValueError: If the run predates cached explanations.
+        """
+        loaded = self._load_explained_run(run_id)
+        if not loaded:
+            return None
+        user_ids, project_ids, explanation = loaded
+        row = int(index_of(user_ids, np.array([user_id]))[0])
+        if row < 0:
+            return None
+        return _to_explanations(user_ids, project_ids, explanation, np.array([row]))[0]
+    
+    def explain_project(self, run_id: int, project_id: int) -> Optional[ProjectMatchExplanation]:
+        """Explain every placement on one project of a run in a single vectorized pass.
+        
+        Args:
+            run_id (int): The ID of the matching run.
+            project_id (int): The ID of the project.
+            
+        Returns:
+            Optional[ProjectMatchExplanation]: One breakdown per team member, or None if the run does not exist.
+            
+        Raises:
+            ValueError: If the run predates cached explanations.
+        """
+        loaded = self._load_explained_run(run_id)
+        if not loaded:
+            return None
+        user_ids, project_ids, explanation = loaded
+        rows = np.flatnonzero(project_ids == project_id)
+        return ProjectMatchExplanation(
+            run_id=run_id,
+            project_id=project_id,
+            members=_to_explanations(user_ids, project_ids, explanation, rows),
+        )
+    
+    def _load_explained_run(self, run_id: int) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        run = self.db.query(MatchingRun).filter(MatchingRun.id == run_id).first()
+        if not run:
+            return None
+        if run.explanation is None:
+            raise ValueError(f"Matching run {run_id} has no cached explanation")
+        return unpack_ids(run.user_ids), unpack_ids(run.assignment), unpack_explanation(run.explanation)
+    
+    def _run_response(self, problem: MatchingProblem, run: MatchingRun, assignment: np.ndarray, managers: np.ndarray, cached: bool, curve: List[Tuple[float, float]]) -> MatchingRunResponse:
+        project_ids = problem.project_ids.tolist()
+        is_manager = np.zeros(problem.n_students, dtype=bool)
+        is_manager[managers[managers >= 0]] = True
+        assignments = [
+            MatchingAssignment(user_id=user_id, project_id=project_ids[project] if project >= 0 else None, is_project_manager=manager)
+            for user_id, project, manager in zip(problem.user_ids.tolist(), assignment.tolist(), is_manager.tolist())
+        ]
+        n_assigned = int((assignment >= 0).sum())
+        return MatchingRunResponse(
+            run_id=run.id,
+            course_id=run.course_id,
+            input_hash=run.input_hash,
+            cached=cached,
+            engine=run.engine,
+            n_students=problem.n_students,
+            n_units=run.n_units,
+            problem_reduction=1.0 - run.n_units / problem.n_students if problem.n_students else 0.0,
+            n_assigned=n_assigned,
+            n_unmatched=problem.n_students - n_assigned,
+            utility=run.utility,
+            grouping_ms=run.grouping_ms,
+            scoring_ms=run.scoring_ms,
+            solve_ms=run.solve_ms,
+            curve=[QualityPoint(elapsed_ms=seconds * 1000, utility=utility) for seconds, utility in _downsample(curve)],
+            assignments=assignments,
+        )
+    
+    def sweep_course_weights(self, course_id: int, request: MatchingSweepRequest) -> Optional[MatchingSweepResponse]:
+        """Evaluate a grid of weightings for a course without storing any assignment.
+        
+        Args:
+            course_id (int): The ID of the course to match.
+            request (MatchingSweepRequest): Explicit weight vectors and/or a grid of axes.
+            
+        Returns:
+            Optional[MatchingSweepResponse]: One comparison row per weighting, or None if the course does not exist.
+            
+        Raises:
+            ValueError: If the sweep is empty or larger than MAX_SWEEP_SIZE.
+        """
+        n_vectors = len(request.weights)
+        if request.grid:
+            n_vectors += len(request.grid.skill) * len(request.grid.preference) * len(request.grid.teammate)
+        if not n_vectors:
+            raise ValueError("Sweep failed: no weight vectors given")
+        if n_vectors > MAX_SWEEP_SIZE:
+            raise ValueError(f"Sweep failed: {n_vectors} weight vectors exceeds the limit of {MAX_SWEEP_SIZE}")
+        grid: List[MatchingWeights] = list(request.weights)
+        if request.grid:
+            grid.extend(
+                MatchingWeights(skill=skill, preference=preference, teammate=teammate)
+                for skill, preference, teammate in itertools.product(request.grid.skill, request.grid.preference, request.grid.teammate)
+            )
+        if not self.db.query(Course.id).filter(Course.id == course_id).first():
+            return None
+        
+        started = time.perf_counter()
+        problem = load_course_problem(self.db, course_id)
+        rows = sweep_weights(problem, grid, group_teammates=request.group_teammates, max_workers=request.max_workers)
+        return MatchingSweepResponse(
+            course_id=course_id,
+            n_students=problem.n_students,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+            rows=[
+                MatchingSweepRow(
+                    skill=row.weights.skill,
+                    preference=row.weights.preference,
+                    teammate=row.weights.teammate,
+                    utility=row.utility,
+                    first_choice_rate=row.first_choice_rate,
+                    skill_coverage=row.skill_coverage,
+                    n_unmatched=row.n_unmatched,
+                )
+                for row in rows
+            ],
+        )
+
+def _downsample(trace: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """At most MAX_TRACE_POINTS evenly spaced points of a trace, always keeping both ends."""
+    if len(trace) <= MAX_TRACE_POINTS:
+        return trace
+    keep = np.unique(np.linspace(0, len(trace) - 1, MAX_TRACE_POINTS).astype(np.int64))
+    return [trace[i] for i in keep.tolist()]
+
+def _to_explanations(user_ids: np.ndarray, project_ids: np.ndarray, explanation: np.ndarray, rows: np.ndarray) -> List[MatchExplanation]:
+    selected = explanation[rows]
+    columns = {name: selected[name].tolist() for name in selected.dtype.names}
+    return [
+        MatchExplanation(
+            user_id=user_id,
+            project_id=project_id or None,
+            preference_rank=columns["preference_rank"][i] or None,
+            skill_score=columns["skill_score"][i],
+            matched_skills=columns["matched_skills"][i],
+            required_skills=columns["required_skills"][i],
+            teammates_requested=columns["teammates_requested"][i],
+            teammates_satisfied=columns["teammates_satisfied"][i],
+            utility=columns["utility"][i],
+        )
+        for i, (user_id, project_id) in enumerate(zip(user_ids[rows].tolist(), project_ids[rows].tolist()))
+    ]
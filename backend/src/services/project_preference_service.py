@@ -0,0 +1,98 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from src.model.project import Project
+from src.model.project_preference import ProjectPreference, ProjectPreferenceCreate, ProjectPreferenceResponse
+from src.services.assignment_version_service import AssignmentVersionService
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ProjectPreferenceService:
+    """Service class for handling student project preference business logic."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def create_project_preference(self, preference_data: ProjectPreferenceCreate) -> ProjectPreferenceResponse:
+        """Record a student's ranked choice of a project.
+        
+        Ranks are per course: a student enrolled in several courses has a
+        first choice in each.
+        
+        Raises:
+            ValueError: If the project does not exist, the student already ranked it,
+                or another project of its course already has the rank.
+        """
+        project = self.db.query(Project.course_id).filter(Project.id == preference_data.project_id).first()
+        if not project:
+            raise ValueError(f"Project preference creation failed: project {preference_data.project_id} does not exist")
+        taken = self.db.query(ProjectPreference.project_id).join(Project, Project.id == ProjectPreference.project_id).filter(
+            ProjectPreference.user_id == preference_data.user_id,
+            ProjectPreference.rank == preference_data.rank,
+            Project.course_id == project.course_id,
+        ).first()
+        if taken:
+            raise ValueError(f"Project preference creation failed: rank {preference_data.rank} is already given to project {taken[0]} of this course")
+        try:
+            db_preference = ProjectPreference(**preference_data.model_dump())
+            self.db.add(db_preference)
+            AssignmentVersionService(self.db).bump_for_projects([db_preference.project_id], commit=False)
+            self.db.commit()
+            self.db.refresh(db_preference)
+            logger.info(f"Created project preference with ID: {db_preference.id}")
+            return ProjectPreferenceResponse.model_validate(db_preference)
+        except IntegrityError as e:
+            self.db.rollback()
+            logger.error(f"Failed to create project preference due to integrity error: {e}")
+            raise ValueError("Project preference creation failed: integrity constraint violation")
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to create project preference: {e}")
+            raise ValueError(f"Project preference creation failed: {str(e)}")
+    
+    def get_project_preference_by_id(self, preference_id: int) -> Optional[ProjectPreferenceResponse]:
+        preference = self.db.query(ProjectPreference).filter(ProjectPreference.id == preference_id).first()
+        if preference:
+            return ProjectPreferenceResponse.model_validate(preference)
+        return None
+    
+    def get_project_preferences_by_user(self, user_id: int) -> List[ProjectPreferenceResponse]:
+        preferences = self.db.query(ProjectPreference).filter(
+            ProjectPreference.user_id == user_id
+        ).order_by(ProjectPreference.rank).all()
+        logger.info(f"Retrieved {len(preferences)} project preferences for user {user_id}")
+        return [ProjectPreferenceResponse.model_validate(p) for p in preferences]
+    
+    def get_project_preferences_by_project(self, project_id: int, skip: int = 0, limit: int = 10) -> List[ProjectPreferenceResponse]:
+        preferences = self.db.query(ProjectPreference).filter(
+            ProjectPreference.project_id == project_id
+        ).offset(skip).limit(limit).all()
+        logger.info(f"Retrieved {len(preferences)} project preferences for project {project_id}")
+        return [ProjectPreferenceResponse.model_validate(p) for p in preferences]
+    
+    def list_project_preferences(self, skip: int = 0, limit: int = 10) -> List[ProjectPreferenceResponse]:
+        preferences = self.db.query(ProjectPreference).offset(skip).limit(limit).all()
+        logger.info(f"Retrieved {len(preferences)} project preferences with skip={skip}, limit={limit}")
+        return [ProjectPreferenceResponse.model_validate(p) for p in preferences]
+    
+    def delete_project_preference(self, preference_id: int) -> bool:
+        db_preference = self.db.query(ProjectPreference).filter(ProjectPreference.id == preference_id).first()
+        if not db_preference:
+            return False
+        try:
+            AssignmentVersionService(self.db).bump_for_projects([db_preference.project_id], commit=False)
+            self.db.delete(db_preference)
+            self.db.commit()
+            logger.info(f"Deleted project preference with ID: {preference_id}")
+            return True
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to delete project preference {preference_id}: {e}")
+            raise ValueError(f"Deletion failed: {str(e)}")
+    
+    def get_project_preferences_count(self) -> int:
+        return self.db.query(ProjectPreference).count()
+    
+    def get_project_preferences_count_by_project(self, project_id: int) -> int:
+        return self.db.query(ProjectPreference).filter(ProjectPreference.project_id == project_id).count()
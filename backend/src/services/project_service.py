@@ -1,7 +1,13 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.model.project import Project, ProjectCreate, ProjectResponse
-from typing import List, Optional
+from src.services.coverage_service import invalidate_coverage
+from src.services.recommendation_service import invalidate_project_index
+from src.services.assignment_version_service import AssignmentVersionService
+from src.core.streaming import stream_envelope
+from src.services.semester_snapshot_service import SemesterSnapshotService, notify_change
+from src.services.grouped_count_service import grouped_counts
+from typing import Dict, Iterator, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,9 +33,13 @@ class ProjectService:
         try:
             db_project = Project(**project_data.model_dump())
             self.db.add(db_project)
+            AssignmentVersionService(self.db).bump([db_project.course_id], commit=False)
             self.db.commit()
             self.db.refresh(db_project)
             logger.info(f"Created project with ID: {db_project.id}")
+            notify_change("projects")
+            invalidate_coverage(db_project.course_id)
+            invalidate_project_index(db_project.course_id)
             return ProjectResponse.model_validate(db_project)
         except IntegrityError as e:
             self.db.rollback()
@@ -86,6 +96,14 @@ class ProjectService:
         logger.info(f"Retrieved {len(projects)} projects with skip={skip}, limit={limit}")
         return [ProjectResponse.model_validate(project) for project in projects]
     
+    def stream_projects(self) -> Iterator[bytes]:
+        """Stream every project in ID order as one JSON response body.
+        
+        Returns:
+            Iterator[bytes]: Encoded chunks of the response envelope.
+        """
+        return stream_envelope(self.db, self.db.query(Project).order_by(Project.id), ProjectResponse, "projects")
+    
     def update_project(self, project_id: int, project_data: ProjectCreate) -> Optional[ProjectResponse]:
         """Update an existing project by ID.
         
@@ -104,11 +122,16 @@ class ProjectService:
             return None
         
         try:
+            previous_course_id = db_project.course_id
             for key, value in project_data.model_dump().items():
                 setattr(db_project, key, value)
+            AssignmentVersionService(self.db).bump([previous_course_id, db_project.course_id], commit=False)
             self.db.commit()
             self.db.refresh(db_project)
             logger.info(f"Updated project with ID: {db_project.id}")
+            notify_change("projects")
+            invalidate_coverage()
+            invalidate_project_index()
             return ProjectResponse.model_validate(db_project)
         except IntegrityError as e:
             self.db.rollback()
@@ -137,9 +160,13 @@ class ProjectService:
                 self.db.delete(project_user)
             
             # Delete the project itself
+            AssignmentVersionService(self.db).bump([db_project.course_id], commit=False)
             self.db.delete(db_project)
             self.db.commit()
             logger.info(f"Deleted project with ID {project_id} and {len(project_skills)} skill relationships and {len(project_users)} user relationships")
+            notify_change("projects")
+            invalidate_coverage()
+            invalidate_project_index()
             return True
         except Exception as e:
             self.db.rollback()
@@ -163,8 +190,22 @@ class ProjectService:
         Returns:
             int: Total number of projects for the course.
         """
+        snapshot = SemesterSnapshotService(self.db).get_snapshot()
+        if snapshot.has_course(course_id):
+            return snapshot.count("projects", "course_id", course_id)
         return self.db.query(Project).filter(Project.course_id == course_id).count()
     
+    def get_projects_count_by_courses(self, course_ids: Optional[List[int]] = None) -> Dict[int, int]:
+        """Get the number of projects of many courses with one grouped query.
+        
+        Args:
+            course_ids (Optional[List[int]]): The IDs of the courses, or None for every course with projects.
+            
+        Returns:
+            Dict[int, int]: Number of projects per course ID.
+        """
+        return grouped_counts(self.db, "projects", Project.course_id, course_ids)
+    
     def search_projects(self, search_term: str, skip: int = 0, limit: int = 10) -> List[ProjectResponse]:
         """Search projects by title, description, or team name.
         
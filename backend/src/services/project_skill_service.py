@@ -1,7 +1,12 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.model.project_skill import ProjectSkill, ProjectSkillCreate, ProjectSkillResponse
-from typing import List, Optional
+from src.services.coverage_service import invalidate_coverage
+from src.services.recommendation_service import invalidate_project_index
+from src.services.assignment_version_service import AssignmentVersionService
+from src.services.semester_snapshot_service import SemesterSnapshotService, notify_change
+from src.services.grouped_count_service import grouped_counts
+from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,9 +21,13 @@ class ProjectSkillService:
         try:
             db_project_skill = ProjectSkill(**project_skill_data.model_dump())
             self.db.add(db_project_skill)
+            AssignmentVersionService(self.db).bump_for_projects([db_project_skill.project_id], commit=False)
             self.db.commit()
             self.db.refresh(db_project_skill)
             logger.info(f"Created project-skill relationship with ID: {db_project_skill.id}")
+            notify_change("project_skills")
+            invalidate_coverage()
+            invalidate_project_index()
             return ProjectSkillResponse.model_validate(db_project_skill)
         except IntegrityError as e:
             self.db.rollback()
@@ -59,11 +68,16 @@ class ProjectSkillService:
         if not db_project_skill:
             return None
         try:
+            previous_project_id = db_project_skill.project_id
             for key, value in project_skill_data.model_dump().items():
                 setattr(db_project_skill, key, value)
+            AssignmentVersionService(self.db).bump_for_projects([previous_project_id, db_project_skill.project_id], commit=False)
             self.db.commit()
             self.db.refresh(db_project_skill)
             logger.info(f"Updated project-skill relationship with ID: {db_project_skill.id}")
+            notify_change("project_skills")
+            invalidate_coverage()
+            invalidate_project_index()
             return ProjectSkillResponse.model_validate(db_project_skill)
         except IntegrityError as e:
             self.db.rollback()
@@ -79,9 +93,13 @@ class ProjectSkillService:
         if not db_project_skill:
             return False
         try:
+            AssignmentVersionService(self.db).bump_for_projects([db_project_skill.project_id], commit=False)
             self.db.delete(db_project_skill)
             self.db.commit()
             logger.info(f"Deleted project-skill relationship with ID: {project_skill_id}")
+            notify_change("project_skills")
+            invalidate_coverage()
+            invalidate_project_index()
             return True
         except Exception as e:
             self.db.rollback()
@@ -92,7 +110,13 @@ class ProjectSkillService:
         return self.db.query(ProjectSkill).count()
     
     def get_project_skills_count_by_project(self, project_id: int) -> int:
+        snapshot = SemesterSnapshotService(self.db).get_snapshot()
+        if snapshot.has_project(project_id):
+            return snapshot.count("project_skills", "project_id", project_id)
         return self.db.query(ProjectSkill).filter(ProjectSkill.project_id == project_id).count()
     
     def get_project_skills_count_by_skill(self, skill_id: int) -> int:
-        return self.db.query(ProjectSkill).filter(ProjectSkill.skill_id == skill_id).count() 
\ No newline at end of file
+        return self.db.query(ProjectSkill).filter(ProjectSkill.skill_id == skill_id).count()
+    
+    def get_project_skills_count_by_skills(self, skill_ids: Optional[List[int]] = None) -> Dict[int, int]:
+        return grouped_counts(self.db, "project_skills", ProjectSkill.skill_id, skill_ids) 
\ No newline at end of file
@@ -1,6 +1,9 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.model.project_user import ProjectUser, ProjectUserCreate, ProjectUserResponse
+from src.services.coverage_service import CoverageService
+from src.services.assignment_version_service import AssignmentVersionService
+from src.services.semester_snapshot_service import SemesterSnapshotService, notify_change
 from typing import List, Optional
 import logging
 
@@ -19,7 +22,9 @@ class ProjectUserService:
             self.db.commit()
             self.db.refresh(db_project_user)
             logger.info(f"Created project-user relationship with ID: {db_project_user.id}")
-            return ProjectUserResponse.model_validate(db_project_user)
+            response = ProjectUserResponse.model_validate(db_project_user)
+            self._on_assignment_change(response.project_id)
+            return response
         except IntegrityError as e:
             self.db.rollback()
             logger.error(f"Failed to create project-user relationship due to integrity error: {e}")
@@ -58,13 +63,16 @@ class ProjectUserService:
         db_project_user = self.db.query(ProjectUser).filter(ProjectUser.id == project_user_id).first()
         if not db_project_user:
             return None
+        previous_project_id = db_project_user.project_id
         try:
             for key, value in project_user_data.model_dump().items():
                 setattr(db_project_user, key, value)
             self.db.commit()
             self.db.refresh(db_project_user)
             logger.info(f"Updated project-user relationship with ID: {db_project_user.id}")
-            return ProjectUserResponse.model_validate(db_project_user)
+            response = ProjectUserResponse.model_validate(db_project_user)
+            self._on_assignment_change(previous_project_id, response.project_id)
+            return response
         except IntegrityError as e:
             self.db.rollback()
             logger.error(f"Failed to update project-user relationship {project_user_id} due to integrity error: {e}")
@@ -78,10 +86,12 @@ class ProjectUserService:
         db_project_user = self.db.query(ProjectUser).filter(ProjectUser.id == project_user_id).first()
         if not db_project_user:
             return False
+        project_id = db_project_user.project_id
         try:
             self.db.delete(db_project_user)
             self.db.commit()
             logger.info(f"Deleted project-user relationship with ID: {project_user_id}")
+            self._on_assignment_change(project_id)
             return True
         except Exception as e:
             self.db.rollback()
@@ -92,7 +102,24 @@ class ProjectUserService:
         return self.db.query(ProjectUser).count()
     
     def get_project_users_count_by_project(self, project_id: int) -> int:
+        snapshot = SemesterSnapshotService(self.db).get_snapshot()
+        if snapshot.has_project(project_id):
+            return snapshot.count("project_users", "project_id", project_id)
         return self.db.query(ProjectUser).filter(ProjectUser.project_id == project_id).count()
     
     def get_project_users_count_by_user(self, user_id: int) -> int:
-        return self.db.query(ProjectUser).filter(ProjectUser.user_id == user_id).count() 
\ No newline at end of file
+        return self.db.query(ProjectUser).filter(ProjectUser.user_id == user_id).count()
+    
+    def _on_assignment_change(self, *project_ids: int) -> None:
+        """Bump the affected courses' assignment versions and re-run their skill-coverage check."""
+        notify_change("project_users")
+        try:
+            version_service = AssignmentVersionService(self.db)
+            course_ids = version_service.courses_for_projects(project_ids)
+            version_service.bump(course_ids)
+            coverage_service = CoverageService(self.db)
+            for course_id in course_ids:
+                coverage_service.refresh_course_coverage(course_id)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to process assignment change: {e}")
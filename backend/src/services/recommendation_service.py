@@ -0,0 +1,306 @@
+from sqlalchemy.orm import Session
+from src.model.project import Project
+from src.model.project_skill import ProjectSkill
+from src.model.project_user import ProjectUser
+from src.model.recommendation import (
+    CandidateStudent, CandidateStudentsResponse, ProjectRecommendation, ProjectRecommendationsResponse,
+    TeammateSuggestion, TeammateSuggestionsResponse,
+)
+from src.model.user import User
+from src.model.user_course import UserCourse
+from src.model.user_skill import UserSkill
+from src.matching.problem import index_of
+from src.matching.profiles import SkillProfileIndex
+from src.matching.similarity import SkillIndex, build_skill_index, top_k
+from src.services.semester_snapshot_service import SemesterSnapshotService
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Per-course project skill index and project titles, rebuilt on first use after a project or project-skill write.
+_project_index_cache: Dict[int, Tuple[SkillIndex, List[str]]] = {}
+_project_index_lock = threading.Lock()
+
+def invalidate_project_index(course_id: Optional[int] = None) -> None:
+    """Drop the cached project index of one course, or of all courses."""
+    with _project_index_lock:
+        if course_id is None:
+            _project_index_cache.clear()
+        else:
+            _project_index_cache.pop(course_id, None)
+
+# Per-course skill index of the enrolled students, rebuilt on first use after a user-skill or enrollment write.
+_student_index_cache: Dict[int, SkillIndex] = {}
+_student_index_lock = threading.Lock()
+
+def invalidate_student_index(course_id: Optional[int] = None) -> None:
+    """Drop the cached student index of one course, or of all courses."""
+    with _student_index_lock:
+        if course_id is None:
+            _student_index_cache.clear()
+        else:
+            _student_index_cache.pop(course_id, None)
+
+# Per-course skill bitsets of the enrolled students, updated in place on user-skill writes.
+_profile_cache: Dict[int, SkillProfileIndex] = {}
+_profile_lock = threading.Lock()
+
+# Ranking modes of teammate suggestions.
+SUGGESTION_MODES = ("similar", "complementary")
+
+def invalidate_skill_profiles(course_id: Optional[int] = None) -> None:
+    """Drop the cached skill profiles of one course, or of all courses."""
+    with _profile_lock:
+        if course_id is None:
+            _profile_cache.clear()
+        else:
+            _profile_cache.pop(course_id, None)
+
+class RecommendationService:
+    """Service class for skill-based project recommendations and team candidates."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def recommend_projects(self, user_id: int, k: int = 5) -> Optional[ProjectRecommendationsResponse]:
+        """Rank the projects of a student's courses by how well they fit the student's skills.
+        
+        Every project of the student's courses is scored at once as the
+        cosine similarity of TF-IDF weighted skill vectors, against a
+        per-course project index cached in this process.
+        
+        Args:
+            user_id (int): The ID of the student.
+            k (int): Number of projects to return.
+            
+        Returns:
+            Optional[ProjectRecommendationsResponse]: The best ``k`` projects, or None if the user does not exist.
+        """
+        if not self.db.query(User.id).filter(User.id == user_id).first():
+            return None
+        course_ids = [row[0] for row in self.db.query(UserCourse.course_id).filter(UserCourse.user_id == user_id).distinct().all()]
+        skill_ids = np.array(
+            [row[0] for row in self.db.query(UserSkill.skill_id).filter(UserSkill.user_id == user_id).all()],
+            dtype=np.int64,
+        )
+        indexes = [(course_id, self._project_index(course_id)) for course_id in sorted(course_ids)]
+        
+        started = time.perf_counter()
+        scores = np.concatenate([index.scores(skill_ids) for _, (index, _) in indexes] or [np.empty(0, dtype=np.float32)])
+        best = top_k(scores, k).tolist()
+        compute_ms = (time.perf_counter() - started) * 1000
+        
+        # Scores are concatenated course by course; offsets map a position back to its course's row.
+        offsets = np.cumsum([0] + [index.n_rows for _, (index, _) in indexes])
+        projects = []
+        for position in best:
+            owner = int(np.searchsorted(offsets, position, side="right")) - 1
+            course_id, (index, titles) = indexes[owner]
+            row = position - int(offsets[owner])
+            matching = np.intersect1d(index.row_skills(row), skill_ids)
+            projects.append(ProjectRecommendation(
+                project_id=int(index.ids[row]),
+                course_id=course_id,
+                title=titles[row],
+                score=float(scores[position]),
+                matching_skill_ids=matching.tolist(),
+            ))
+        logger.info(f"Scored {scores.shape[0]} projects for user {user_id} in {compute_ms:.3f} ms")
+        return ProjectRecommendationsResponse(user_id=user_id, n_scored=int(scores.shape[0]), compute_ms=compute_ms, projects=projects)
+    
+    def candidate_students(self, project_id: int, k: int = 10) -> Optional[CandidateStudentsResponse]:
+        """Rank the unassigned students of a project's course by how well they fit the project.
+        
+        Enrolled students' skill vectors come from a per-course index cached
+        in this process and are scored with one matrix-vector product
+        against the project's required skills. Students already on a team
+        in the course, this one included, are filtered out with a mask
+        built from a single query.
+        
+        Args:
+            project_id (int): The ID of the project to staff.
+            k (int): Number of students to return.
+            
+        Returns:
+            Optional[CandidateStudentsResponse]: The best ``k`` students, or None if the project does not exist.
+            
+        Raises:
+            ValueError: If the project does not belong to a course.
+        """
+        project = self.db.query(Project.id, Project.course_id).filter(Project.id == project_id).first()
+        if not project:
+            return None
+        course_id = project.course_id
+        if course_id is None:
+            raise ValueError(f"Project {project_id} is not part of a course")
+        projects, _ = self._project_index(course_id)
+        students = self._student_index(course_id)
+        snapshot = SemesterSnapshotService(self.db).get_snapshot()
+        if snapshot.has_course(course_id):
+            assigned_ids = snapshot.course_assignees(course_id)
+        else:
+            assigned_ids = np.array(
+                [row[0] for row in self.db.query(ProjectUser.user_id)
+                 .join(Project, Project.id == ProjectUser.project_id)
+                 .filter(Project.course_id == course_id).distinct().all()],
+                dtype=np.int64,
+            )
+        
+        started = time.perf_counter()
+        required = projects.row_skills(int(index_of(projects.ids, np.array([project_id]))[0]))
+        scores = students.scores(required)
+        assigned = index_of(students.ids, assigned_ids)
+        scores[assigned[assigned >= 0]] = -np.inf
+        n_eligible = int(np.isfinite(scores).sum())
+        best = [row for row in top_k(scores, k).tolist() if np.isfinite(scores[row])]
+        compute_ms = (time.perf_counter() - started) * 1000
+        
+        best_ids = students.ids[best].tolist()
+        usernames = dict(self.db.query(User.id, User.username).filter(User.id.in_(best_ids)).all()) if best_ids else {}
+        candidates = [
+            CandidateStudent(
+                user_id=user_id,
+                username=usernames.get(user_id, ""),
+                score=float(scores[row]),
+                matching_skill_ids=np.intersect1d(students.row_skills(row), required).tolist(),
+            )
+            for row, user_id in zip(best, best_ids)
+        ]
+        logger.info(f"Scored {n_eligible}/{students.n_rows} students of course {course_id} for project {project_id} in {compute_ms:.3f} ms")
+        return CandidateStudentsResponse(
+            project_id=project_id,
+            course_id=course_id,
+            n_enrolled=students.n_rows,
+            n_eligible=n_eligible,
+            compute_ms=compute_ms,
+            candidates=candidates,
+        )
+    
+    def suggest_teammates(self, user_id: int, course_id: int, k: int = 5, mode: str = "similar") -> Optional[TeammateSuggestionsResponse]:
+        """Suggest classmates with a similar or a complementary skill set.
+        
+        ``similar`` ranks by the Jaccard index of the two skill sets;
+        ``complementary`` by the share of the combined skill set that only
+        the classmate brings. Both compare the student against every
+        classmate at once on bitsets cached per course.
+        
+        Args:
+            user_id (int): The ID of the student.
+            course_id (int): The course to search for teammates.
+            k (int): Number of classmates to return.
+            mode (str): ``similar`` or ``complementary``.
+            
+        Returns:
+            Optional[TeammateSuggestionsResponse]: The best ``k`` classmates, or None if the student is not enrolled in the course.
+            
+        Raises:
+            ValueError: If ``mode`` is not a known ranking mode.
+        """
+        if mode not in SUGGESTION_MODES:
+            raise ValueError(f"Unknown suggestion mode: {mode}")
+        profiles = self._skill_profiles(course_id)
+        started = time.perf_counter()
+        with _profile_lock:
+            row = profiles.row_of(user_id)
+            if row < 0:
+                return None
+            best, scores = profiles.rank(user_id, k, complementary=mode == "complementary")
+            mine = set(profiles.skills_of(profiles.bits[row]))
+            theirs = [profiles.skills_of(profiles.bits[other]) for other in best.tolist()]
+        compute_ms = (time.perf_counter() - started) * 1000
+        
+        best_ids = profiles.user_ids[best].tolist()
+        usernames = dict(self.db.query(User.id, User.username).filter(User.id.in_(best_ids)).all()) if best_ids else {}
+        suggestions = [
+            TeammateSuggestion(
+                user_id=other_id,
+                username=usernames.get(other_id, ""),
+                score=float(score),
+                shared_skill_ids=[skill_id for skill_id in skills if skill_id in mine],
+                new_skill_ids=[skill_id for skill_id in skills if skill_id not in mine],
+            )
+            for other_id, score, skills in zip(best_ids, scores.tolist(), theirs)
+        ]
+        logger.info(f"Ranked {profiles.n_users - 1} classmates of user {user_id} in course {course_id} by {mode} skills in {compute_ms:.3f} ms")
+        return TeammateSuggestionsResponse(
+            user_id=user_id,
+            course_id=course_id,
+            mode=mode,
+            n_compared=profiles.n_users - 1,
+            compute_ms=compute_ms,
+            suggestions=suggestions,
+        )
+    
+    def refresh_skill_profile(self, user_id: int) -> None:
+        """Rewrite one user's row in every cached skill profile index that holds them."""
+        with _profile_lock:
+            indexes = list(_profile_cache.values())
+        if not indexes:
+            return
+        skill_ids = [row[0] for row in self.db.query(UserSkill.skill_id).filter(UserSkill.user_id == user_id).distinct().all()]
+        with _profile_lock:
+            updated = sum(1 for profiles in indexes if profiles.set_skills(user_id, skill_ids))
+        logger.info(f"Updated skill profile of user {user_id} in {updated} course indexes")
+    
+    def _project_index(self, course_id: int) -> Tuple[SkillIndex, List[str]]:
+        """Cached skill index and titles of a course's projects, built with two queries on a miss."""
+        with _project_index_lock:
+            cached = _project_index_cache.get(course_id)
+        if cached:
+            return cached
+        project_rows = self.db.query(Project.id, Project.title).filter(Project.course_id == course_id).order_by(Project.id).all()
+        pairs = np.array(
+            self.db.query(ProjectSkill.project_id, ProjectSkill.skill_id)
+            .join(Project, Project.id == ProjectSkill.project_id)
+            .filter(Project.course_id == course_id).all(),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        index = build_skill_index(np.array([row[0] for row in project_rows], dtype=np.int64), pairs)
+        entry = (index, [row[1] for row in project_rows])
+        with _project_index_lock:
+            _project_index_cache[course_id] = entry
+        logger.info(f"Built project skill index for course {course_id}: {index.n_rows} projects, {index.skill_ids.shape[0]} skills")
+        return entry
+    
+    def _student_index(self, course_id: int) -> SkillIndex:
+        """Cached skill index of a course's enrolled students, built with two queries on a miss."""
+        with _student_index_lock:
+            cached = _student_index_cache.get(course_id)
+        if cached:
+            return cached
+        index = build_skill_index(*self._enrolled_skills(course_id))
+        with _student_index_lock:
+            _student_index_cache[course_id] = index
+        logger.info(f"Built student skill index for course {course_id}: {index.n_rows} students, {index.skill_ids.shape[0]} skills")
+        return index
+    
+    def _skill_profiles(self, course_id: int) -> SkillProfileIndex:
+        """Cached skill bitsets of a course's enrolled students, built with two queries on a miss."""
+        with _profile_lock:
+            cached = _profile_cache.get(course_id)
+        if cached:
+            return cached
+        user_ids, pairs = self._enrolled_skills(course_id)
+        profiles = SkillProfileIndex(user_ids, pairs)
+        with _profile_lock:
+            _profile_cache[course_id] = profiles
+        logger.info(f"Built skill profiles for course {course_id}: {profiles.n_users} students, {len(profiles.skill_ids)} skills")
+        return profiles
+    
+    def _enrolled_skills(self, course_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """IDs of a course's enrolled students and their (user id, skill id) pairs."""
+        user_ids = np.array(
+            [row[0] for row in self.db.query(UserCourse.user_id).filter(UserCourse.course_id == course_id).all()],
+            dtype=np.int64,
+        )
+        pairs = np.array(
+            self.db.query(UserSkill.user_id, UserSkill.skill_id)
+            .join(UserCourse, UserCourse.user_id == UserSkill.user_id)
+            .filter(UserCourse.course_id == course_id).all(),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        return user_ids, pairs
@@ -0,0 +1,174 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from src.model.course import Course
+from src.model.project import Project
+from src.model.project_skill import ProjectSkill
+from src.model.project_user import ProjectUser
+from src.model.semester import Semester
+from src.model.skill import Skill
+from src.model.user import User
+from src.model.user_skill import UserSkill
+from typing import Iterable, Iterator, List, Optional, Sequence
+import csv
+import io
+import json
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Media type of each report format.
+REPORT_FORMATS = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
+# Rows fetched per round trip from the server-side cursor, and encoded per streamed chunk.
+REPORT_BATCH_SIZE = 1000
+# Separator of the list columns (skills, members).
+LIST_SEPARATOR = ";"
+
+TEAM_ASSIGNMENT_COLUMNS = [
+    "course_id", "crn", "course_name", "project_id", "project_title", "team_name",
+    "user_id", "username", "is_project_manager", "skills",
+]
+PROJECT_ALLOCATION_COLUMNS = [
+    "course_id", "crn", "course_name", "project_id", "project_title", "team_name",
+    "max_capacity", "n_assigned", "open_seats", "required_skills", "members",
+]
+
+def encode_rows(rows: Iterable[Sequence], columns: List[str], report_format: str) -> Iterator[bytes]:
+    """Encode rows as CSV (with a header line) or JSON Lines, one chunk per ``REPORT_BATCH_SIZE`` rows."""
+    buffer = io.StringIO()
+    if report_format == "csv":
+        writer = csv.writer(buffer)
+        write = writer.writerow
+        write(columns)
+    else:
+        def write(row):
+            buffer.write(json.dumps(dict(zip(columns, row)), default=str))
+            buffer.write("\n")
+    n_rows = 0
+    for row in rows:
+        write(row)
+        n_rows += 1
+        if n_rows % REPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+class ReportService:
+    """Service class for streamed team assignment and project allocation reports."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def check_scope(self, course_id: Optional[int], semester_id: Optional[int], report_format: str) -> Optional[str]:
+        """Validate a report request before streaming starts.
+
+        Args:
+            course_id (Optional[int]): Course to report on.
+            semester_id (Optional[int]): Semester to report on.
+            report_format (str): One of ``REPORT_FORMATS``.
+
+        Returns:
+            Optional[str]: What was not found, or None if the scope exists.
+
+        Raises:
+            ValueError: If the format is unknown.
+        """
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format {report_format}, expected one of {', '.join(REPORT_FORMATS)}")
+        if course_id is not None and not self.db.query(Course.id).filter(Course.id == course_id).first():
+            return "Course not found"
+        if semester_id is not None and not self.db.query(Semester.id).filter(Semester.id == semester_id).first():
+            return "Semester not found"
+        return None
+
+    def stream_team_assignments(self, report_format: str, course_id: Optional[int] = None, semester_id: Optional[int] = None) -> Iterator[bytes]:
+        """Stream every student's team placement with their course, project and skills.
+
+        Rows come from one query whose skills column is an aggregated
+        correlated subquery, read through a server-side cursor, so memory
+        does not grow with the number of rows.
+
+        Args:
+            report_format (str): One of ``REPORT_FORMATS``.
+            course_id (Optional[int]): Only this course's teams.
+            semester_id (Optional[int]): Only teams of this semester's courses.
+
+        Returns:
+            Iterator[bytes]: Encoded chunks of ``TEAM_ASSIGNMENT_COLUMNS`` rows.
+        """
+        skills = (
+            select(func.aggregate_strings(Skill.name, LIST_SEPARATOR))
+            .join(UserSkill, UserSkill.skill_id == Skill.id)
+            .where(UserSkill.user_id == ProjectUser.user_id)
+            .scalar_subquery()
+        )
+        query = self._scoped(
+            self.db.query(
+                Course.id, Course.crn, Course.displayName, Project.id, Project.title, Project.teamName,
+                User.id, User.username, ProjectUser.is_project_manager, skills,
+            )
+            .select_from(ProjectUser)
+            .join(Project, Project.id == ProjectUser.project_id)
+            .join(User, User.id == ProjectUser.user_id)
+            .join(Course, Course.id == Project.course_id),
+            course_id, semester_id,
+        ).order_by(Course.id, Project.id, User.username)
+        return self._stream("team assignments", query, TEAM_ASSIGNMENT_COLUMNS, report_format)
+
+    def stream_project_allocations(self, report_format: str, course_id: Optional[int] = None, semester_id: Optional[int] = None) -> Iterator[bytes]:
+        """Stream every project's fill, open seats, required skills and members.
+
+        Args:
+            report_format (str): One of ``REPORT_FORMATS``.
+            course_id (Optional[int]): Only this course's projects.
+            semester_id (Optional[int]): Only projects of this semester's courses.
+
+        Returns:
+            Iterator[bytes]: Encoded chunks of ``PROJECT_ALLOCATION_COLUMNS`` rows.
+        """
+        n_assigned = (
+            select(func.count(ProjectUser.id)).where(ProjectUser.project_id == Project.id).scalar_subquery()
+        )
+        required = (
+            select(func.aggregate_strings(Skill.name, LIST_SEPARATOR))
+            .join(ProjectSkill, ProjectSkill.skill_id == Skill.id)
+            .where(ProjectSkill.project_id == Project.id)
+            .scalar_subquery()
+        )
+        members = (
+            select(func.aggregate_strings(User.username, LIST_SEPARATOR))
+            .join(ProjectUser, ProjectUser.user_id == User.id)
+            .where(ProjectUser.project_id == Project.id)
+            .scalar_subquery()
+        )
+        query = self._scoped(
+            self.db.query(
+                Course.id, Course.crn, Course.displayName, Project.id, Project.title, Project.teamName,
+                Project.maxCapacity, n_assigned, Project.maxCapacity - n_assigned, required, members,
+            )
+            .select_from(Project)
+            .join(Course, Course.id == Project.course_id),
+            course_id, semester_id,
+        ).order_by(Course.id, Project.id)
+        return self._stream("project allocations", query, PROJECT_ALLOCATION_COLUMNS, report_format)
+
+    def _scoped(self, query, course_id: Optional[int], semester_id: Optional[int]):
+        if course_id is not None:
+            query = query.filter(Course.id == course_id)
+        if semester_id is not None:
+            query = query.filter(Course.semester_id == semester_id)
+        return query
+
+    def _stream(self, name: str, query, columns: List[str], report_format: str) -> Iterator[bytes]:
+        # Runs after the route has returned, so the session is closed here rather than by the request.
+        started = time.perf_counter()
+        n_bytes = 0
+        try:
+            for chunk in encode_rows(query.yield_per(REPORT_BATCH_SIZE), columns, report_format):
+                n_bytes += len(chunk)
+                yield chunk
+        finally:
+            self.db.close()
+            logger.info(f"Streamed {n_bytes} bytes of {name} as {report_format} in {(time.perf_counter() - started) * 1000:.1f} ms")
@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.model.semester import Semester, SemesterCreate, SemesterResponse
-from typing import List, Optional
+from src.core.streaming import stream_envelope
+from src.services.semester_snapshot_service import notify_change
+from typing import Iterator, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,7 @@ class SemesterService:
             self.db.commit()
             self.db.refresh(db_semester)
             logger.info(f"Created semester with ID: {db_semester.id}")
+            notify_change("semesters")
             return SemesterResponse.model_validate(db_semester)
         except IntegrityError as e:
             self.db.rollback()
@@ -82,6 +85,14 @@ class SemesterService:
         logger.info(f"Retrieved {len(semesters)} semesters with skip={skip}, limit={limit}")
         return [SemesterResponse.model_validate(semester) for semester in semesters]
     
+    def stream_semesters(self) -> Iterator[bytes]:
+        """Stream every semester in ID order as one JSON response body.
+        
+        Returns:
+            Iterator[bytes]: Encoded chunks of the response envelope.
+        """
+        return stream_envelope(self.db, self.db.query(Semester).order_by(Semester.id), SemesterResponse, "semesters")
+    
     def update_semester(self, semester_id: int, semester_data: SemesterCreate) -> Optional[SemesterResponse]:
         """Update an existing semester by ID.
         
@@ -105,6 +116,7 @@ class SemesterService:
             self.db.commit()
             self.db.refresh(db_semester)
             logger.info(f"Updated semester with ID: {db_semester.id}")
+            notify_change("semesters")
             return SemesterResponse.model_validate(db_semester)
         except IntegrityError as e:
             self.db.rollback()
@@ -130,6 +142,7 @@ class SemesterService:
             self.db.delete(db_semester)
             self.db.commit()
             logger.info(f"Deleted semester with ID {semester_id} and {len(courses)} courses")
+            notify_change("semesters")
             return True
         except Exception as e:
             self.db.rollback()
@@ -0,0 +1,190 @@
+from sqlalchemy.orm import Session
+from src.model.course import Course
+from src.model.project import Project
+from src.model.project_skill import ProjectSkill
+from src.model.project_user import ProjectUser
+from src.model.semester import Semester
+from src.model.user_course import UserCourse
+from src.matching.problem import index_of
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+import numpy as np
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Column names of each snapshot table; every table is an (k, 2) int32 array of id pairs.
+SNAPSHOT_TABLES: Dict[str, Tuple[str, str]] = {
+    "courses": ("course_id", "semester_id"),
+    "projects": ("project_id", "course_id"),
+    "user_courses": ("user_id", "course_id"),
+    "project_users": ("project_id", "user_id"),
+    "project_skills": ("project_id", "skill_id"),
+}
+
+# Changes that move rows in or out of the snapshot's scope, so other tables must reload too.
+_SCOPE_DEPENDENTS: Dict[str, Tuple[str, ...]] = {
+    "semesters": ("semesters",) + tuple(SNAPSHOT_TABLES),
+    "courses": tuple(SNAPSHOT_TABLES),
+    "projects": ("projects", "project_users", "project_skills"),
+}
+
+@dataclass
+class SemesterSnapshot:
+    """Columnar copy of the active semester's courses, projects and junction tables.
+
+    Only rows belonging to the semester are kept: its courses, their
+    projects, enrollments, team memberships and required skills.
+    ``course_ids`` and ``project_ids`` are sorted and serve as id -> index
+    maps through :func:`index_of`.
+    """
+    semester_id: Optional[int]
+    starts: Optional[datetime]
+    ends: Optional[datetime]
+    tables: Dict[str, np.ndarray]
+    built: datetime = field(default_factory=datetime.now)
+    course_ids: np.ndarray = field(init=False)
+    project_ids: np.ndarray = field(init=False)
+    _groups: Dict[Tuple[str, int], Tuple[np.ndarray, np.ndarray]] = field(init=False, default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self.course_ids = np.sort(self.tables["courses"][:, 0])
+        self.project_ids = np.sort(self.tables["projects"][:, 0])
+
+    def is_current(self, now: datetime) -> bool:
+        """Whether the snapshot's semester still spans ``now``; a snapshot without one lasts the day it was built."""
+        if self.starts is None or self.ends is None:
+            return now.date() == self.built.date()
+        return self.starts.replace(tzinfo=None) <= now <= self.ends.replace(tzinfo=None)
+
+    def has_course(self, course_id: int) -> bool:
+        return bool(index_of(self.course_ids, np.array([course_id]))[0] >= 0)
+
+    def has_project(self, project_id: int) -> bool:
+        return bool(index_of(self.project_ids, np.array([project_id]))[0] >= 0)
+
+    def group_counts(self, table: str, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Distinct values of one column of a table and their row counts, computed once per snapshot."""
+        position = SNAPSHOT_TABLES[table].index(column)
+        key = (table, position)
+        if key not in self._groups:
+            self._groups[key] = np.unique(self.tables[table][:, position], return_counts=True)
+        return self._groups[key]
+
+    def count(self, table: str, column: str, value: int) -> int:
+        """Rows of a table whose ``column`` equals ``value``."""
+        keys, counts = self.group_counts(table, column)
+        position = index_of(keys, np.array([value]))[0]
+        return int(counts[position]) if position >= 0 else 0
+
+    def members(self, table: str, column: str, value: int) -> np.ndarray:
+        """Sorted values of the other column on the rows whose ``column`` equals ``value``."""
+        position = SNAPSHOT_TABLES[table].index(column)
+        rows = self.tables[table]
+        return np.unique(rows[rows[:, position] == value, 1 - position])
+
+    def course_assignees(self, course_id: int) -> np.ndarray:
+        """Sorted IDs of the users on any project of a course."""
+        rows = self.tables["project_users"]
+        projects = self.members("projects", "course_id", course_id)
+        return np.unique(rows[np.isin(rows[:, 0], projects), 1])
+
+# The process-wide snapshot, and the tables marked stale since it was built.
+_snapshot: Optional[SemesterSnapshot] = None
+_stale: Dict[str, int] = {}
+_generation = 0
+# Generation of the latest change to each table, for caches of other per-table results.
+_versions: Dict[str, int] = {}
+_snapshot_lock = threading.Lock()
+
+def notify_change(*tables: str) -> None:
+    """Change hook for service write methods: mark tables stale after their rows change.
+
+    Stale tables are reloaded, one query each, on the next snapshot read;
+    changes to courses, projects or enrollments also reload the tables whose
+    scope they decide, and changes to semesters rebuild the snapshot.
+    """
+    global _generation
+    with _snapshot_lock:
+        _generation += 1
+        for table in tables:
+            for name in _SCOPE_DEPENDENTS.get(table, (table,)):
+                if name in SNAPSHOT_TABLES or name == "semesters":
+                    _stale[name] = _generation
+                _versions[name] = _generation
+
+def table_version(table: str) -> int:
+    """Generation of the latest change to a table; results cached at this version are current."""
+    with _snapshot_lock:
+        return _versions.get(table, 0)
+
+class SemesterSnapshotService:
+    """Service class for the in-memory columnar snapshot of the active semester."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_snapshot(self) -> SemesterSnapshot:
+        """Return the snapshot, reloading stale tables or rebuilding when the semester has changed.
+
+        Returns:
+            SemesterSnapshot: The active semester's snapshot; empty when no semester spans today.
+        """
+        with _snapshot_lock:
+            snapshot, stale, generation = _snapshot, set(_stale), _generation
+        if snapshot is None or "semesters" in stale or not snapshot.is_current(datetime.now()):
+            return self.rebuild()
+        # Without a semester every table is empty, whatever changed.
+        if not stale or snapshot.semester_id is None:
+            return snapshot
+        return self._install(snapshot.semester_id, snapshot.starts, snapshot.ends, stale, generation, snapshot.tables)
+
+    def rebuild(self) -> SemesterSnapshot:
+        """Load the current semester's rows from scratch, one query per table."""
+        with _snapshot_lock:
+            generation = _generation
+        semester = self.db.query(Semester.id, Semester.semesterStartDate, Semester.semesterEndDate).filter(
+            Semester.semesterStartDate <= datetime.now(),
+            Semester.semesterEndDate >= datetime.now()
+        ).order_by(Semester.id).first()
+        if semester is None:
+            return self._install(None, None, None, set(SNAPSHOT_TABLES), generation, {})
+        return self._install(semester.id, semester.semesterStartDate, semester.semesterEndDate, set(SNAPSHOT_TABLES), generation, {})
+
+    def _install(self, semester_id: Optional[int], starts: Optional[datetime], ends: Optional[datetime], tables: set, generation: int, previous: Dict[str, np.ndarray]) -> SemesterSnapshot:
+        global _snapshot
+        started = time.perf_counter()
+        arrays = dict(previous)
+        loaded = [table for table in SNAPSHOT_TABLES if table in tables]
+        for table in loaded:
+            arrays[table] = self._load_table(table, semester_id)
+        snapshot = SemesterSnapshot(semester_id, starts, ends, arrays)
+        with _snapshot_lock:
+            _snapshot = snapshot
+            # Marks made while loading stay, so those tables reload again on the next read.
+            for table in [name for name, marked in _stale.items() if marked <= generation]:
+                del _stale[table]
+        logger.info(
+            f"Loaded {len(loaded)} snapshot tables for semester {semester_id} in {(time.perf_counter() - started) * 1000:.1f} ms: "
+            + ", ".join(f"{name} {array.shape[0]}" for name, array in arrays.items())
+        )
+        return snapshot
+
+    def _load_table(self, table: str, semester_id: Optional[int]) -> np.ndarray:
+        if semester_id is None:
+            return np.empty((0, 2), dtype=np.int32)
+        in_semester = self.db.query(Course.id).filter(Course.semester_id == semester_id)
+        if table == "courses":
+            query = self.db.query(Course.id, Course.semester_id).filter(Course.semester_id == semester_id)
+        elif table == "projects":
+            query = self.db.query(Project.id, Project.course_id).filter(Project.course_id.in_(in_semester))
+        elif table == "user_courses":
+            query = self.db.query(UserCourse.user_id, UserCourse.course_id).filter(UserCourse.course_id.in_(in_semester))
+        elif table == "project_users":
+            query = self.db.query(ProjectUser.project_id, ProjectUser.user_id).join(Project, Project.id == ProjectUser.project_id).filter(Project.course_id.in_(in_semester))
+        else:
+            query = self.db.query(ProjectSkill.project_id, ProjectSkill.skill_id).join(Project, Project.id == ProjectSkill.project_id).filter(Project.course_id.in_(in_semester))
+        return np.array(query.all(), dtype=np.int32).reshape(-1, 2)
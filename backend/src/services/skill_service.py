@@ -1,7 +1,10 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.model.skill import Skill, SkillCreate, SkillResponse
-from typing import List, Optional
+from src.services.recommendation_service import invalidate_project_index, invalidate_skill_profiles, invalidate_student_index
+from src.core.streaming import stream_envelope
+from src.services.semester_snapshot_service import notify_change
+from typing import Iterator, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,7 @@ class SkillService:
             self.db.commit()
             self.db.refresh(db_skill)
             logger.info(f"Created skill with ID: {db_skill.id}")
+            notify_change("skills")
             return SkillResponse.model_validate(db_skill)
         except IntegrityError as e:
             self.db.rollback()
@@ -40,6 +44,9 @@ class SkillService:
         logger.info(f"Retrieved {len(skills)} skills with skip={skip}, limit={limit}")
         return [SkillResponse.model_validate(skill) for skill in skills]
     
+    def stream_skills(self) -> Iterator[bytes]:
+        return stream_envelope(self.db, self.db.query(Skill).order_by(Skill.id), SkillResponse, "skills")
+    
     def update_skill(self, skill_id: int, skill_data: SkillCreate) -> Optional[SkillResponse]:
         db_skill = self.db.query(Skill).filter(Skill.id == skill_id).first()
         if not db_skill:
@@ -50,6 +57,7 @@ class SkillService:
             self.db.commit()
             self.db.refresh(db_skill)
             logger.info(f"Updated skill with ID: {db_skill.id}")
+            notify_change("skills")
             return SkillResponse.model_validate(db_skill)
         except IntegrityError as e:
             self.db.rollback()
@@ -81,6 +89,10 @@ class SkillService:
             self.db.delete(db_skill)
             self.db.commit()
             logger.info(f"Deleted skill with ID {skill_id} and {len(user_skills)} user relationships and {len(project_skills)} project relationships")
+            notify_change("skills", "user_skills", "project_skills")
+            invalidate_project_index()
+            invalidate_student_index()
+            invalidate_skill_profiles()
             return True
         except Exception as e:
             self.db.rollback()
@@ -114,6 +126,7 @@ class SkillService:
                 self.db.refresh(skill)
             
             logger.info(f"Bulk created {len(created_skills)} skills")
+            notify_change("skills")
             return [SkillResponse.model_validate(skill) for skill in created_skills]
             
         except IntegrityError as e:
@@ -0,0 +1,70 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from src.model.teammate_preference import TeammatePreference, TeammatePreferenceCreate, TeammatePreferenceResponse
+from src.services.assignment_version_service import AssignmentVersionService
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+class TeammatePreferenceService:
+    """Service class for handling desired-teammate business logic."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def create_teammate_preference(self, preference_data: TeammatePreferenceCreate) -> TeammatePreferenceResponse:
+        if preference_data.user_id == preference_data.teammate_id:
+            raise ValueError("Teammate preference creation failed: a user cannot request themselves")
+        try:
+            db_preference = TeammatePreference(**preference_data.model_dump())
+            self.db.add(db_preference)
+            AssignmentVersionService(self.db).bump_for_users([db_preference.user_id], commit=False)
+            self.db.commit()
+            self.db.refresh(db_preference)
+            logger.info(f"Created teammate preference with ID: {db_preference.id}")
+            return TeammatePreferenceResponse.model_validate(db_preference)
+        except IntegrityError as e:
+            self.db.rollback()
+            logger.error(f"Failed to create teammate preference due to integrity error: {e}")
+            raise ValueError("Teammate preference creation failed: integrity constraint violation")
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to create teammate preference: {e}")
+            raise ValueError(f"Teammate preference creation failed: {str(e)}")
+    
+    def get_teammate_preference_by_id(self, preference_id: int) -> Optional[TeammatePreferenceResponse]:
+        preference = self.db.query(TeammatePreference).filter(TeammatePreference.id == preference_id).first()
+        if preference:
+            return TeammatePreferenceResponse.model_validate(preference)
+        return None
+    
+    def get_teammate_preferences_by_user(self, user_id: int) -> List[TeammatePreferenceResponse]:
+        preferences = self.db.query(TeammatePreference).filter(
+            TeammatePreference.user_id == user_id
+        ).all()
+        logger.info(f"Retrieved {len(preferences)} teammate preferences for user {user_id}")
+        return [TeammatePreferenceResponse.model_validate(p) for p in preferences]
+    
+    def list_teammate_preferences(self, skip: int = 0, limit: int = 10) -> List[TeammatePreferenceResponse]:
+        preferences = self.db.query(TeammatePreference).offset(skip).limit(limit).all()
+        logger.info(f"Retrieved {len(preferences)} teammate preferences with skip={skip}, limit={limit}")
+        return [TeammatePreferenceResponse.model_validate(p) for p in preferences]
+    
+    def delete_teammate_preference(self, preference_id: int) -> bool:
+        db_preference = self.db.query(TeammatePreference).filter(TeammatePreference.id == preference_id).first()
+        if not db_preference:
+            return False
+        try:
+            AssignmentVersionService(self.db).bump_for_users([db_preference.user_id], commit=False)
+            self.db.delete(db_preference)
+            self.db.commit()
+            logger.info(f"Deleted teammate preference with ID: {preference_id}")
+            return True
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to delete teammate preference {preference_id}: {e}")
+            raise ValueError(f"Deletion failed: {str(e)}")
+    
+    def get_teammate_preferences_count(self) -> int:
+        return self.db.query(TeammatePreference).count()
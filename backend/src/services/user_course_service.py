@@ -1,7 +1,11 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.model.user_course import UserCourse, UserCourseCreate, UserCourseResponse
-from typing import List, Optional
+from src.services.assignment_version_service import AssignmentVersionService
+from src.services.recommendation_service import invalidate_skill_profiles, invalidate_student_index
+from src.services.semester_snapshot_service import SemesterSnapshotService, notify_change
+from src.services.grouped_count_service import grouped_counts
+from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,9 +20,13 @@ class UserCourseService:
         try:
             db_user_course = UserCourse(**user_course_data.model_dump())
             self.db.add(db_user_course)
+            AssignmentVersionService(self.db).bump([db_user_course.course_id], commit=False)
             self.db.commit()
             self.db.refresh(db_user_course)
             logger.info(f"Created user-course relationship with ID: {db_user_course.id}")
+            notify_change("user_courses")
+            invalidate_student_index(db_user_course.course_id)
+            invalidate_skill_profiles(db_user_course.course_id)
             return UserCourseResponse.model_validate(db_user_course)
         except IntegrityError as e:
             self.db.rollback()
@@ -59,11 +67,18 @@ class UserCourseService:
         if not db_user_course:
             return None
         try:
+            previous_course_id = db_user_course.course_id
             for key, value in user_course_data.model_dump().items():
                 setattr(db_user_course, key, value)
+            AssignmentVersionService(self.db).bump([previous_course_id, db_user_course.course_id], commit=False)
             self.db.commit()
             self.db.refresh(db_user_course)
             logger.info(f"Updated user-course relationship with ID: {db_user_course.id}")
+            notify_change("user_courses")
+            invalidate_student_index(previous_course_id)
+            invalidate_skill_profiles(previous_course_id)
+            invalidate_student_index(db_user_course.course_id)
+            invalidate_skill_profiles(db_user_course.course_id)
             return UserCourseResponse.model_validate(db_user_course)
         except IntegrityError as e:
             self.db.rollback()
@@ -79,9 +94,14 @@ class UserCourseService:
         if not db_user_course:
             return False
         try:
+            course_id = db_user_course.course_id
+            AssignmentVersionService(self.db).bump([course_id], commit=False)
             self.db.delete(db_user_course)
             self.db.commit()
             logger.info(f"Deleted user-course relationship with ID: {user_course_id}")
+            notify_change("user_courses")
+            invalidate_student_index(course_id)
+            invalidate_skill_profiles(course_id)
             return True
         except Exception as e:
             self.db.rollback()
@@ -95,4 +115,10 @@ class UserCourseService:
         return self.db.query(UserCourse).filter(UserCourse.user_id == user_id).count()
     
     def get_user_courses_count_by_course(self, course_id: int) -> int:
-        return self.db.query(UserCourse).filter(UserCourse.course_id == course_id).count() 
\ No newline at end of file
+        snapshot = SemesterSnapshotService(self.db).get_snapshot()
+        if snapshot.has_course(course_id):
+            return snapshot.count("user_courses", "course_id", course_id)
+        return self.db.query(UserCourse).filter(UserCourse.course_id == course_id).count()
+    
+    def get_user_courses_count_by_courses(self, course_ids: Optional[List[int]] = None) -> Dict[int, int]:
+        return grouped_counts(self.db, "user_courses", UserCourse.course_id, course_ids) 
\ No newline at end of file
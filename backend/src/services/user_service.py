@@ -1,7 +1,12 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.model.user import User, UserCreate, UserResponse
-from typing import List, Optional
+from src.services.coverage_service import invalidate_coverage
+from src.services.assignment_version_service import AssignmentVersionService
+from src.services.recommendation_service import invalidate_skill_profiles, invalidate_student_index
+from src.core.streaming import stream_envelope
+from src.services.semester_snapshot_service import notify_change
+from typing import Iterator, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +35,7 @@ class UserService:
             self.db.commit()
             self.db.refresh(db_user)
             logger.info(f"Created user with ID: {db_user.id}")
+            notify_change("users")
             return UserResponse.model_validate(db_user)
         except IntegrityError as e:
             self.db.rollback()
@@ -96,6 +102,14 @@ class UserService:
         logger.info(f"Retrieved {len(users)} users with skip={skip}, limit={limit}")
         return [UserResponse.model_validate(user) for user in users]
     
+    def stream_users(self) -> Iterator[bytes]:
+        """Stream every user in ID order as one JSON response body.
+        
+        Returns:
+            Iterator[bytes]: Encoded chunks of the response envelope.
+        """
+        return stream_envelope(self.db, self.db.query(User).order_by(User.id), UserResponse, "users")
+    
     def update_user(self, user_id: int, user_data: UserCreate) -> Optional[UserResponse]:
         """Update an existing user by ID.
         
@@ -119,6 +133,7 @@ class UserService:
             self.db.commit()
             self.db.refresh(db_user)
             logger.info(f"Updated user with ID: {db_user.id}")
+            notify_change("users")
             return UserResponse.model_validate(db_user)
         except IntegrityError as e:
             self.db.rollback()
@@ -142,6 +157,7 @@ class UserService:
             
             # Delete related user_courses relationships
             from src.model.user_course import UserCourse
+            AssignmentVersionService(self.db).bump_for_users([user_id], commit=False)
             user_courses = self.db.query(UserCourse).filter(UserCourse.user_id == user_id).all()
             for user_course in user_courses:
                 self.db.delete(user_course)
@@ -156,6 +172,10 @@ class UserService:
             self.db.delete(db_user)
             self.db.commit()
             logger.info(f"Deleted user with ID {user_id} and {len(user_skills)} skill relationships, {len(user_courses)} course relationships, and {len(project_users)} project relationships")
+            notify_change("users", "user_courses", "project_users", "user_skills")
+            invalidate_coverage()
+            invalidate_student_index()
+            invalidate_skill_profiles()
             return True
         except Exception as e:
             self.db.rollback()
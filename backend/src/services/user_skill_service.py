@@ -1,7 +1,12 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.model.user_skill import UserSkill, UserSkillCreate, UserSkillResponse
-from typing import List, Optional
+from src.services.coverage_service import invalidate_coverage
+from src.services.assignment_version_service import AssignmentVersionService
+from src.services.recommendation_service import RecommendationService, invalidate_student_index
+from src.services.semester_snapshot_service import notify_change
+from src.services.grouped_count_service import grouped_counts
+from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,9 +21,14 @@ class UserSkillService:
         try:
             db_user_skill = UserSkill(**user_skill_data.model_dump())
             self.db.add(db_user_skill)
+            AssignmentVersionService(self.db).bump_for_users([db_user_skill.user_id], commit=False)
             self.db.commit()
             self.db.refresh(db_user_skill)
             logger.info(f"Created user-skill relationship with ID: {db_user_skill.id}")
+            notify_change("user_skills")
+            invalidate_coverage()
+            invalidate_student_index()
+            RecommendationService(self.db).refresh_skill_profile(db_user_skill.user_id)
             return UserSkillResponse.model_validate(db_user_skill)
         except IntegrityError as e:
             self.db.rollback()
@@ -59,11 +69,18 @@ class UserSkillService:
         if not db_user_skill:
             return None
         try:
+            previous_user_id = db_user_skill.user_id
             for key, value in user_skill_data.model_dump().items():
                 setattr(db_user_skill, key, value)
+            AssignmentVersionService(self.db).bump_for_users([previous_user_id, db_user_skill.user_id], commit=False)
             self.db.commit()
             self.db.refresh(db_user_skill)
             logger.info(f"Updated user-skill relationship with ID: {db_user_skill.id}")
+            notify_change("user_skills")
+            invalidate_coverage()
+            invalidate_student_index()
+            for user_id in {previous_user_id, db_user_skill.user_id}:
+                RecommendationService(self.db).refresh_skill_profile(user_id)
             return UserSkillResponse.model_validate(db_user_skill)
         except IntegrityError as e:
             self.db.rollback()
@@ -79,9 +96,15 @@ class UserSkillService:
         if not db_user_skill:
             return False
         try:
+            user_id = db_user_skill.user_id
+            AssignmentVersionService(self.db).bump_for_users([user_id], commit=False)
             self.db.delete(db_user_skill)
             self.db.commit()
             logger.info(f"Deleted user-skill relationship with ID: {user_skill_id}")
+            notify_change("user_skills")
+            invalidate_coverage()
+            invalidate_student_index()
+            RecommendationService(self.db).refresh_skill_profile(user_id)
             return True
         except Exception as e:
             self.db.rollback()
@@ -95,4 +118,7 @@ class UserSkillService:
         return self.db.query(UserSkill).filter(UserSkill.user_id == user_id).count()
     
     def get_user_skills_count_by_skill(self, skill_id: int) -> int:
-        return self.db.query(UserSkill).filter(UserSkill.skill_id == skill_id).count() 
\ No newline at end of file
+        return self.db.query(UserSkill).filter(UserSkill.skill_id == skill_id).count()
+    
+    def get_user_skills_count_by_skills(self, skill_ids: Optional[List[int]] = None) -> Dict[int, int]:
+        return grouped_counts(self.db, "user_skills", UserSkill.skill_id, skill_ids) 
\ No newline at end of file
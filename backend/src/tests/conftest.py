@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+import pytest
+import src.config.database as database
+
+# Route tests run against a private in-memory database; it must be bound before main creates the tables.
+engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+database.engine = engine
+database.SessionLocal.configure(bind=engine)
+
+import main  # noqa: E402
+from src.config.base import Base  # noqa: E402
+from src.core.settings import settings  # noqa: E402
+import src.services.admin_service as admin_service  # noqa: E402
+import src.services.coverage_service as coverage_service  # noqa: E402
+import src.services.grouped_count_service as grouped_count_service  # noqa: E402
+import src.services.matching_service as matching_service  # noqa: E402
+import src.services.recommendation_service as recommendation_service  # noqa: E402
+import src.services.semester_snapshot_service as semester_snapshot_service  # noqa: E402
+
+def reset_caches():
+    """Drop every process-wide cache, so no result outlives the test database it was read from."""
+    admin_service._summary_cache = None
+    semester_snapshot_service._snapshot = None
+    semester_snapshot_service._stale.clear()
+    for cache in (
+        coverage_service._coverage_cache,
+        grouped_count_service._count_cache,
+        matching_service._metrics_cache,
+        recommendation_service._project_index_cache,
+        recommendation_service._student_index_cache,
+        recommendation_service._profile_cache,
+    ):
+        cache.clear()
+
+@pytest.fixture
+def api():
+    """Client for the app on an empty database."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    reset_caches()
+    yield TestClient(main.app, headers={"X-API-Key": settings.API_KEY})
+    reset_caches()
+
+@pytest.fixture
+def post(api):
+    """POST a JSON body and return the created row's data, failing the test on an error response."""
+    def post(url, body):
+        response = api.post(url, json=body)
+        assert response.status_code in (200, 201), response.text
+        return response.json()["data"]
+    return post
+
+@pytest.fixture
+def course(post):
+    """A course of the current semester with two projects and two enrolled students."""
+    now = datetime.now()
+    semester = post("/api/semesters/", {
+        "displayName": "Current",
+        "semesterStartDate": (now - timedelta(days=30)).isoformat(),
+        "semesterEndDate": (now + timedelta(days=30)).isoformat(),
+    })
+    course = post("/api/courses/", {"semester_id": semester["id"], "crn": "10001", "displayName": "Capstone"})
+    projects = [
+        post("/api/projects/", {"course_id": course["id"], "title": f"Project {i}", "description": "d", "maxCapacity": 4})["id"]
+        for i in range(2)
+    ]
+    users = []
+    for i in range(2):
+        users.append(post("/api/users/", {
+            "username": f"student{i}",
+            "edupersonprimaryaffiliation": "student",
+            "uupid": f"uupid{i}",
+            "edupersonprincipalname": f"student{i}@vt.edu",
+        })["id"])
+        post("/api/user-courses/", {"user_id": users[-1], "course_id": course["id"]})
+    return {"semester_id": semester["id"], "course_id": course["id"], "project_ids": projects, "user_ids": users}
@@ -0,0 +1,42 @@
+from src.config.database import SessionLocal
+from src.services.admin_service import SUMMARY_COUNTS, SUMMARY_TTL_SECONDS, AdminService
+import pytest
+import src.services.admin_service as admin_service
+
+@pytest.fixture
+def db(api):
+    db = SessionLocal()
+    yield db
+    db.close()
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A monotonic clock the test moves by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(admin_service.time, "monotonic", lambda: now[0])
+    return now
+
+def test_summary_totals_match_per_table_counts(db, post, course):
+    post("/api/project-users/", {"project_id": course["project_ids"][0], "user_id": course["user_ids"][0]})
+    summary = AdminService(db).get_summary()
+    totals = {name: db.query(model).count() for name, model in SUMMARY_COUNTS.items()}
+    assert summary.model_dump(include=set(SUMMARY_COUNTS)) == totals
+    assert (totals["total_users"], totals["total_projects"], totals["total_project_users"]) == (2, 2, 1)
+
+def test_summary_route_returns_the_totals(api, course):
+    data = api.get("/api/admin/summary").json()["data"]
+    assert data["total_courses"] == 1
+    assert data["total_user_courses"] == 2
+    assert "generated_at" in data
+
+def test_summary_is_reused_within_the_ttl_and_recounted_after(db, post, course, clock):
+    first = AdminService(db).get_summary()
+    post("/api/skills/", {"name": "python"})
+
+    clock[0] += SUMMARY_TTL_SECONDS - 0.1
+    assert AdminService(db).get_summary() is first
+
+    clock[0] += 0.1
+    recounted = AdminService(db).get_summary()
+    assert recounted is not first
+    assert (first.total_skills, recounted.total_skills) == (0, 1)
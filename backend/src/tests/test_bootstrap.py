@@ -0,0 +1,48 @@
+from src.core.settings import settings
+import pytest
+
+@pytest.fixture
+def signed_in(api, course, monkeypatch):
+    """Sign in as the first student through the development login."""
+    monkeypatch.setattr(settings, "ENVIRONMENT", "development")
+    response = api.get("/api/login", params={"role": "student"})
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["user"]
+
+def test_signed_out_bootstrap(api, post, course):
+    post("/api/skills/", {"name": "python"})
+    response = api.get("/api/bootstrap")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["user"] is None
+    assert data["user_courses"] == [] and data["user_skills"] == []
+    assert data["current_semester"]["id"] == course["semester_id"]
+    assert [c["id"] for c in data["courses"]] == [course["course_id"]]
+    assert [s["name"] for s in data["skills"]] == ["python"]
+
+def test_signed_in_bootstrap_has_the_users_enrollments_and_skills(api, post, course, signed_in):
+    skill = post("/api/skills/", {"name": "python"})["id"]
+    post("/api/user-skills/", {"user_id": signed_in["id"], "skill_id": skill})
+
+    data = api.get("/api/bootstrap").json()["data"]
+    assert data["user"]["username"] == signed_in["username"]
+    assert [uc["course_id"] for uc in data["user_courses"]] == [course["course_id"]]
+    assert [us["skill_id"] for us in data["user_skills"]] == [skill]
+
+def test_bootstrap_is_revalidated_per_session(api, signed_in):
+    first = api.get("/api/bootstrap")
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert "Cookie" in first.headers["vary"]
+
+    cached = api.get("/api/bootstrap", headers={"If-None-Match": first.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == first.headers["etag"]
+    assert cached.headers["cache-control"] == "private, no-cache"
+    assert "Cookie" in cached.headers["vary"]
+
+    # Signed out, the same tag no longer matches.
+    api.cookies.clear()
+    signed_out = api.get("/api/bootstrap", headers={"If-None-Match": first.headers["etag"]})
+    assert signed_out.status_code == 200
+    assert signed_out.json()["data"]["user"] is None
@@ -0,0 +1,122 @@
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+from src.core.compression import CompressionMiddleware, brotli, choose_encoding
+import gzip
+import pytest
+
+BODY = b"team project skills " * 200
+
+def make_client():
+    app = FastAPI()
+
+    @app.get("/large")
+    def large():
+        return Response(BODY, media_type="application/json", headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/encoded")
+    def encoded():
+        return Response(gzip.compress(BODY), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/image")
+    def image():
+        return Response(BODY, media_type="image/png")
+
+    @app.get("/not-modified")
+    def not_modified():
+        return Response(status_code=304, headers={"ETag": '"abc"'})
+
+    @app.get("/no-content")
+    def no_content():
+        return Response(status_code=204)
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((BODY[i:i + 700] for i in range(0, len(BODY), 700)), media_type="text/csv")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    return TestClient(app)
+
+@pytest.fixture
+def client():
+    return make_client()
+
+def raw_get(client, url, encoding):
+    """GET without the client decoding the body, so the wire bytes can be checked."""
+    with client.stream("GET", url, headers={"Accept-Encoding": encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", "gzip"),
+    ("gzip;q=0", None),
+    ("identity", None),
+    ("", None),
+    ("deflate", None),
+    ("gzip;q=0.5, identity", "gzip"),
+])
+def test_choose_encoding(header, expected):
+    assert choose_encoding(header) == expected
+
+def test_choose_encoding_prefers_brotli():
+    expected_any = "br" if brotli is not None else "gzip"
+    assert choose_encoding("*") == expected_any
+    assert choose_encoding("gzip, br") == expected_any
+    assert choose_encoding("br;q=0, *") == "gzip"
+    assert choose_encoding("*;q=0") is None
+    assert choose_encoding("br;q=0.5, gzip;q=0.9") == "gzip"
+
+def test_large_response_is_compressed_with_a_weak_etag(client):
+    response, raw = raw_get(client, "/large", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "content-length" not in response.headers or int(response.headers["content-length"]) == len(raw)
+    assert gzip.decompress(raw) == BODY
+
+@pytest.mark.skipif(brotli is None, reason="brotli is not installed")
+def test_brotli_response_decompresses(client):
+    response, raw = raw_get(client, "/large", "br")
+    assert response.headers["content-encoding"] == "br"
+    assert brotli.decompress(raw) == BODY
+
+def test_response_without_accepted_encoding_is_unchanged(client):
+    response, raw = raw_get(client, "/large", "identity")
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert raw == BODY
+
+def test_small_response_passes_through(client):
+    response, raw = raw_get(client, "/small", "gzip")
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == "2"
+    assert raw == b"ok"
+
+def test_already_encoded_response_is_not_recompressed(client):
+    response, raw = raw_get(client, "/encoded", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(raw) == BODY
+
+def test_skipped_content_type_passes_through(client):
+    response, raw = raw_get(client, "/image", "gzip")
+    assert "content-encoding" not in response.headers
+    assert raw == BODY
+
+@pytest.mark.parametrize("url, status", [("/not-modified", 304), ("/no-content", 204)])
+def test_bodiless_responses_pass_through(client, url, status):
+    response, raw = raw_get(client, url, "gzip")
+    assert response.status_code == status
+    assert "content-encoding" not in response.headers
+    assert raw == b""
+    if status == 304:
+        assert response.headers["etag"] == '"abc"'
+
+def test_streamed_chunks_decompress_to_the_original_bytes(client):
+    response, raw = raw_get(client, "/stream", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw) == BODY
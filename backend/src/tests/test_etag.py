@@ -0,0 +1,57 @@
+import pytest
+
+def create_users(post, n, start=0):
+    for i in range(start, start + n):
+        post("/api/users/", {
+            "username": f"user{i}",
+            "edupersonprimaryaffiliation": "student",
+            "uupid": f"uupid{i}",
+            "edupersonprincipalname": f"user{i}@vt.edu",
+        })
+
+def test_list_is_tagged_then_not_modified_then_retagged_after_a_write(api, post):
+    create_users(post, 3)
+    first = api.get("/api/users/", headers={"Accept-Encoding": "identity"})
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    cached = api.get("/api/users/", headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    create_users(post, 1, start=3)
+    changed = api.get("/api/users/", headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()["data"]) == 4
+
+def test_update_in_place_changes_the_tag(api, post):
+    create_users(post, 1)
+    user = api.get("/api/users/").json()["data"][0]
+    etag = api.get(f"/api/users/{user['id']}").headers["etag"]
+    api.put(f"/api/users/{user['id']}", json={**user, "username": "renamed"})
+    response = api.get(f"/api/users/{user['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["data"]["username"] == "renamed"
+
+@pytest.mark.parametrize("encoding", ["gzip", "identity"])
+def test_not_modified_sends_the_validator_of_the_200(api, post, encoding):
+    # Enough rows that the 200 is compressed when an encoding is accepted.
+    create_users(post, 30)
+    first = api.get("/api/users/?limit=100", headers={"Accept-Encoding": encoding})
+    assert (first.headers.get("content-encoding") == "gzip") == (encoding == "gzip")
+    cached = api.get("/api/users/?limit=100", headers={"Accept-Encoding": encoding, "If-None-Match": first.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == first.headers["etag"]
+    assert cached.headers["etag"].startswith("W/") == (encoding == "gzip")
+    assert "Accept-Encoding" in cached.headers["vary"]
+    assert "Accept-Encoding" in first.headers["vary"]
+
+def test_weak_and_strong_forms_of_a_tag_match(api, post):
+    create_users(post, 1)
+    etag = api.get("/api/users/", headers={"Accept-Encoding": "identity"}).headers["etag"]
+    response = api.get("/api/users/", headers={"Accept-Encoding": "gzip", "If-None-Match": f"W/{etag}"})
+    assert response.status_code == 304
+    assert response.headers["etag"] == f"W/{etag}"
@@ -0,0 +1,88 @@
+from src.config.database import SessionLocal
+from src.model.project import Project
+from src.services.grouped_count_service import MAX_GROUPED_IDS, grouped_counts, parse_ids
+from src.services.semester_snapshot_service import notify_change, table_version
+import pytest
+import src.services.grouped_count_service as grouped_count_service
+
+@pytest.mark.parametrize("ids, expected", [
+    (None, None),
+    ("", []),
+    ("3", [3]),
+    ("1, 2,,3,", [1, 2, 3]),
+])
+def test_parse_ids(ids, expected):
+    assert parse_ids(ids) == expected
+
+@pytest.mark.parametrize("ids, error", [
+    ("1,a", "Invalid ID list"),
+    ("1.5", "Invalid ID list"),
+    (",".join(str(i) for i in range(MAX_GROUPED_IDS + 1)), f"At most {MAX_GROUPED_IDS} IDs"),
+])
+def test_parse_ids_rejects_bad_lists(ids, error):
+    with pytest.raises(ValueError, match=error):
+        parse_ids(ids)
+
+def test_grouped_counts_report_missing_keys_as_zero(api, course):
+    db = SessionLocal()
+    try:
+        counts = grouped_counts(db, "projects", Project.course_id, [course["course_id"], 999])
+        assert counts == {course["course_id"]: 2, 999: 0}
+        assert grouped_counts(db, "projects", Project.course_id) == {course["course_id"]: 2}
+    finally:
+        db.close()
+
+def test_grouped_counts_are_cached_until_the_table_changes(api, course):
+    db = SessionLocal()
+    try:
+        grouped_counts(db, "projects", Project.course_id)
+        cached = grouped_count_service._count_cache[("projects", "course_id")]
+        assert cached == (table_version("projects"), {course["course_id"]: 2})
+
+        # Changed behind the hook's back: the cached counts are still served.
+        db.add(Project(course_id=course["course_id"], title="Hidden", description="d", maxCapacity=4))
+        db.commit()
+        assert grouped_counts(db, "projects", Project.course_id) == {course["course_id"]: 2}
+
+        notify_change("projects")
+        assert grouped_counts(db, "projects", Project.course_id) == {course["course_id"]: 3}
+    finally:
+        db.close()
+
+def test_count_by_course_routes(api, post, course):
+    other = post("/api/courses/", {"semester_id": course["semester_id"], "crn": "10002", "displayName": "Databases"})
+    course_id = course["course_id"]
+
+    response = api.get("/api/projects/count/by-course", params={"ids": f"{course_id},{other['id']}"})
+    assert response.status_code == 200
+    assert response.json()["data"] == {"total_projects": {str(course_id): 2, str(other["id"]): 0}}
+    assert api.get("/api/projects/count/by-course").json()["data"] == {"total_projects": {str(course_id): 2}}
+    assert api.get("/api/user-courses/count/by-course").json()["data"] == {"total_user_courses": {str(course_id): 2}}
+    assert api.get("/api/courses/count/by-semester").json()["data"] == {"total_courses": {str(course["semester_id"]): 2}}
+
+    post("/api/projects/", {"course_id": other["id"], "title": "Other", "description": "d", "maxCapacity": 4})
+    response = api.get("/api/projects/count/by-course", params={"ids": f"{course_id},{other['id']}"})
+    assert response.json()["data"] == {"total_projects": {str(course_id): 2, str(other["id"]): 1}}
+
+def test_count_by_skill_routes(api, post, course):
+    skill = post("/api/skills/", {"name": "python"})["id"]
+    post("/api/user-skills/", {"user_id": course["user_ids"][0], "skill_id": skill})
+    post("/api/project-skills/", {"project_id": course["project_ids"][0], "skill_id": skill})
+
+    params = {"ids": f"{skill},999"}
+    assert api.get("/api/user-skills/count/by-skill", params=params).json()["data"] == {"total_user_skills": {str(skill): 1, "999": 0}}
+    response = api.get("/api/project-skills/count/by-skill", params=params)
+    assert list(response.json()["data"].values()) == [{str(skill): 1, "999": 0}]
+
+@pytest.mark.parametrize("url", [
+    "/api/projects/count/by-course",
+    "/api/courses/count/by-semester",
+    "/api/user-courses/count/by-course",
+    "/api/project-skills/count/by-skill",
+    "/api/user-skills/count/by-skill",
+])
+@pytest.mark.parametrize("ids", ["1,x", ",".join(str(i) for i in range(MAX_GROUPED_IDS + 1))])
+def test_count_routes_reject_bad_id_lists(api, url, ids):
+    response = api.get(url, params={"ids": ids})
+    assert response.status_code == 400
+    assert response.json()["success"] is False
@@ -0,0 +1,240 @@
+import dataclasses
+import numpy as np
+import pytest
+from src.matching.anytime import run_anytime
+from src.matching.archive import load_problem, save_problem
+from src.matching.balance import balance_assignment, balance_objective
+from src.matching.bitsets import build_bitsets, missing_team_skills, to_indices
+from src.matching.cache import input_hash, pack_assignment, unpack_assignment
+from src.matching.conflicts import violated_conflicts
+from src.matching.deferred_acceptance import blocking_pairs
+from src.matching.explain import explain_assignment, pack_explanation, unpack_explanation
+from src.matching.grouping import group_mutual_requests, mutual_pairs, aggregate_by_group, singleton_groups
+from src.matching.metrics import assignment_quality, gini
+from src.matching.parallel import solve_courses
+from src.matching.profiles import SkillProfileIndex
+from src.matching.roles import designate_managers, manager_scores
+from src.matching.scoring import total_utility, utility_matrix
+from src.matching.similarity import build_skill_index, top_k
+from src.matching.solver import run_matching, solve_utility
+from src.matching.snapshots import diff_assignments
+from src.matching.sweep import sweep_weights
+from src.matching.synthetic import generate_cohort
+from src.matching.units import UnitProblem
+from src.model.matching import BalancePenalties, MatchingWeights
+
+@pytest.fixture
+def cohort():
+    return generate_cohort(200, seed=7)
+
+def test_mutual_pairs_ignores_one_way_requests():
+    pairs = np.array([[0, 1], [1, 0], [2, 3], [4, 5], [5, 4]], dtype=np.int32)
+    assert mutual_pairs(pairs, 6).tolist() == [[0, 1], [4, 5]]
+
+def test_groups_respect_smallest_capacity(cohort):
+    groups = group_mutual_requests(cohort)
+    assert groups.sizes.sum() == cohort.n_students
+    assert groups.sizes.max() <= cohort.capacities.min()
+    assert groups.n_groups < cohort.n_students
+
+def test_aggregate_by_group_sums_member_rows(cohort):
+    groups = group_mutual_requests(cohort)
+    matrix = np.random.default_rng(0).random((cohort.n_students, 5))
+    expected = np.zeros((groups.n_groups, 5))
+    np.add.at(expected, groups.labels, matrix)
+    assert np.allclose(aggregate_by_group(groups, matrix), expected)
+
+def test_solver_never_exceeds_capacity():
+    utility = np.random.default_rng(1).random((30, 4)).astype(np.float32)
+    sizes = np.array([1, 2, 3] * 10, dtype=np.int32)
+    capacities = np.array([10, 10, 10, 10], dtype=np.int32)
+    assignment = solve_utility(utility, sizes, capacities)
+    load = np.bincount(assignment[assignment >= 0], weights=sizes[assignment >= 0], minlength=4)
+    assert (load <= capacities).all()
+
+def test_grouping_keeps_mutual_pairs_together(cohort):
+    result = run_matching(cohort, MatchingWeights(), group_teammates=True)
+    groups = group_mutual_requests(cohort)
+    for group in range(groups.n_groups):
+        members = np.flatnonzero(groups.labels == group)
+        assert len(set(result.assignment[members].tolist())) == 1
+    assert result.n_units == groups.n_groups
+
+def test_parallel_sweep_matches_serial(cohort):
+    grid = [MatchingWeights(skill=skill, preference=2.0 - skill) for skill in (0.0, 0.5, 1.0, 2.0)]
+    serial = sweep_weights(cohort, grid, max_workers=1)
+    parallel = sweep_weights(cohort, grid, max_workers=2)
+    assert [row.utility for row in parallel] == pytest.approx([row.utility for row in serial])
+    assert [row.first_choice_rate for row in parallel] == [row.first_choice_rate for row in serial]
+
+def test_parallel_courses_match_serial_in_input_order():
+    problems = [generate_cohort(n, seed=n) for n in (60, 200, 120)]
+    serial = solve_courses(problems, MatchingWeights(), max_workers=1)
+    parallel = solve_courses(problems, MatchingWeights(), max_workers=2, min_cells=0)
+    for a, b in zip(serial, parallel):
+        assert np.array_equal(a.result.assignment, b.result.assignment)
+
+def test_cached_assignment_round_trips_and_hash_tracks_inputs(cohort):
+    weights = MatchingWeights()
+    result = run_matching(cohort, weights)
+    assert (unpack_assignment(cohort, pack_assignment(cohort, result.assignment)) == result.assignment).all()
+
+    key = input_hash(cohort, weights, "utility", True)
+    assert key == input_hash(cohort, weights, "utility", True)
+    assert key != input_hash(cohort, MatchingWeights(skill=2.0), "utility", True)
+    cohort.user_skills[0, 0] = not cohort.user_skills[0, 0]
+    assert key != input_hash(cohort, weights, "utility", True)
+
+def test_diff_assignments_reports_moves_and_project_deltas():
+    diff = diff_assignments(
+        np.array([1, 2, 3, 4, 6]), np.array([10, 10, 20, 20, 0]),
+        np.array([1, 2, 3, 5]), np.array([10, 20, 20, 10]),
+    )
+    assert diff.user_ids[diff.moved].tolist() == [2, 4, 5]
+    assert diff.project_ids.tolist() == [10, 20]
+    assert diff.count_before.tolist() == [2, 2]
+    assert diff.count_after.tolist() == [2, 2]
+    assert diff.joined.tolist() == [1, 1]
+    assert diff.left.tolist() == [1, 1]
+
+def test_diff_assignments_of_aligned_snapshots_with_sparse_project_ids():
+    user_ids = np.array([1, 2, 3, 4])
+    diff = diff_assignments(user_ids, np.array([10, 10**9, 0, 10]), user_ids, np.array([10, 10, 10**9, 10]))
+    assert diff.user_ids[diff.moved].tolist() == [2, 3]
+    assert diff.project_ids.tolist() == [10, 10**9]
+    assert diff.count_before.tolist() == [2, 1]
+    assert diff.count_after.tolist() == [3, 1]
+    assert diff.joined.tolist() == [1, 1]
+    assert diff.left.tolist() == [0, 1]
+
+def test_explanation_components_add_up_to_run_utility(cohort):
+    weights = MatchingWeights(skill=1.5, preference=0.5, teammate=2.0)
+    result = run_matching(cohort, weights)
+    explanation = unpack_explanation(pack_explanation(explain_assignment(cohort, weights, result.assignment)))
+    total = explanation["utility"].sum() + weights.teammate * explanation["teammates_satisfied"].sum()
+    assert total == pytest.approx(result.utility, rel=1e-4)
+
+def test_missing_team_skills_uses_or_and_not_across_words():
+    required = build_bitsets(np.array([0, 0, 1, 1]), np.array([3, 70, 5, 130]), 2, 131)
+    members = build_bitsets(np.array([0, 1, 2]), np.array([3, 5, 130]), 3, 131)
+    missing = missing_team_skills(required, members, np.array([0, 1, 1]))
+    assert [bits.tolist() for bits in to_indices(missing)] == [[70], []]
+
+def test_assignment_quality_buckets_every_student(cohort):
+    weights = MatchingWeights()
+    result = run_matching(cohort, weights)
+    quality = assignment_quality(cohort, weights, result.assignment)
+    assert quality.rank_counts.sum() == cohort.n_students
+    assert quality.rank_counts[4] == result.n_unmatched
+    assert quality.filled.sum() == result.n_assigned
+    assert (quality.filled <= cohort.capacities).all()
+    assert gini(np.ones(10)) == pytest.approx(0.0)
+    assert gini(np.array([0.0, 0.0, 0.0, 1.0])) == pytest.approx(0.75)
+
+def test_balancer_incremental_objective_matches_full_recompute(cohort):
+    weights = MatchingWeights()
+    start = run_matching(cohort, weights).assignment
+    result = balance_assignment(cohort, weights, start, time_budget=0.5, patience=5000)
+    assert result.objective_after >= result.objective_before
+    assert result.objective_after == pytest.approx(balance_objective(cohort, weights, BalancePenalties(), result.assignment), rel=1e-5)
+    filled = np.bincount(result.assignment[result.assignment >= 0], minlength=cohort.n_projects)
+    assert (filled <= cohort.capacities).all()
+    assert [point[1] for point in result.trace] == sorted(point[1] for point in result.trace)
+
+def test_one_manager_per_staffed_team_with_the_best_score(cohort):
+    assignment = run_matching(cohort, MatchingWeights()).assignment
+    managers = designate_managers(cohort, assignment)
+    staffed = np.bincount(assignment[assignment >= 0], minlength=cohort.n_projects) > 0
+    assert ((managers >= 0) == staffed).all()
+    assert (assignment[managers[staffed]] == np.flatnonzero(staffed)).all()
+    scores = manager_scores(cohort, assignment)
+    for project in np.flatnonzero(staffed)[:20]:
+        assert scores[managers[project]] == scores[assignment == project].max()
+
+def test_problem_archive_round_trip(cohort, tmp_path):
+    path = str(tmp_path / "course.npz")
+    save_problem(path, cohort)
+    loaded = load_problem(path)
+    for name in ("user_ids", "project_ids", "skill_ids", "user_skills", "project_skills", "capacities", "preference_ranks", "teammate_pairs", "conflict_pairs"):
+        assert np.array_equal(getattr(loaded, name), getattr(cohort, name)), name
+    weights = MatchingWeights()
+    assert input_hash(loaded, weights, "utility", True) == input_hash(cohort, weights, "utility", True)
+
+def test_deferred_acceptance_is_stable_and_respects_capacity(cohort):
+    weights = MatchingWeights()
+    result = run_matching(cohort, weights, group_teammates=False, engine="deferred_acceptance")
+    filled = np.bincount(result.assignment[result.assignment >= 0], minlength=cohort.n_projects)
+    assert (filled <= cohort.capacities).all()
+    assert result.n_unmatched == 0
+    units = UnitProblem(cohort, singleton_groups(cohort.n_students), weights, utility_matrix(cohort, weights))
+    assert blocking_pairs(units, result.assignment) == 0
+
+def test_anytime_never_does_worse_than_greedy(cohort):
+    weights = MatchingWeights()
+    greedy = run_matching(cohort, weights)
+    result, curve = run_anytime(cohort, weights, time_budget=0.3)
+    assert curve[0][1] == pytest.approx(greedy.utility)
+    assert [utility for _, utility in curve] == sorted(utility for _, utility in curve)
+    assert result.utility == pytest.approx(total_utility(cohort, weights, result.assignment), rel=1e-5)
+    filled = np.bincount(result.assignment[result.assignment >= 0], minlength=cohort.n_projects)
+    assert (filled <= cohort.capacities).all()
+
+def test_do_not_pairs_are_never_placed_together(cohort):
+    weights = MatchingWeights()
+    # Constrain pairs the unconstrained matcher puts on one team, mutual teammates included.
+    placed = run_matching(cohort, weights).assignment
+    order = np.argsort(placed, kind="stable")
+    together = (placed[order[:-1]] == placed[order[1:]]) & (placed[order[:-1]] >= 0)
+    pairs = np.sort(np.stack([order[:-1], order[1:]], axis=1)[together][::3], axis=1).astype(np.int32)
+    problem = dataclasses.replace(cohort, conflict_pairs=pairs)
+    assert violated_conflicts(problem, placed) == pairs.shape[0]
+
+    labels = group_mutual_requests(problem).labels
+    assert (labels[pairs[:, 0]] != labels[pairs[:, 1]]).all()
+    for engine in ("utility", "deferred_acceptance"):
+        assert violated_conflicts(problem, run_matching(problem, weights, engine=engine).assignment) == 0
+    result, _ = run_anytime(problem, weights, time_budget=0.2)
+    assert violated_conflicts(problem, result.assignment) == 0
+    assert input_hash(problem, weights, "utility", True) != input_hash(cohort, weights, "utility", True)
+
+def test_skill_index_ranks_by_tfidf_cosine():
+    pairs = np.array([(10, 1), (10, 2), (20, 2), (30, 3), (20, 1), (40, 2)])
+    index = build_skill_index(np.array([40, 10, 30, 20, 50]), pairs)
+    assert index.ids.tolist() == [10, 20, 30, 40, 50]
+    assert np.allclose(np.linalg.norm(index.vectors[:4], axis=1), 1.0)
+    assert not index.vectors[4].any()
+    scores = index.scores(np.array([1, 99]))
+    # Skill 1 is rarer than skill 2, so the projects holding it rank first.
+    assert top_k(scores, 2).tolist() == [0, 1]
+    assert scores[2] == scores[4] == 0.0
+    rng = np.random.default_rng(0)
+    values = rng.random(1000).astype(np.float32)
+    assert top_k(values, 7).tolist() == np.argsort(-values)[:7].tolist()
+    assert top_k(values, 5000).shape[0] == 1000
+
+def test_skill_profiles_match_set_jaccard_after_incremental_updates():
+    rng = np.random.default_rng(3)
+    user_ids = np.arange(100, 160)
+    skills = {u: set(rng.choice(70, size=int(rng.integers(0, 6)), replace=False).tolist()) for u in user_ids.tolist()}
+    pairs = np.array([(u, s) for u, held in skills.items() for s in held]).reshape(-1, 2)
+    profiles = SkillProfileIndex(user_ids, pairs)
+    words = profiles.bits.shape[1]
+    # 70 skills nobody had yet force the bitsets to widen in place.
+    skills[101] = set(range(1000, 1070)) | {3}
+    for u in (101, 130, 159):
+        skills[u] = skills[101] if u == 101 else {3, 1000, 1069}
+        assert profiles.set_skills(u, sorted(skills[u]))
+    assert not profiles.set_skills(999, [1])
+    assert profiles.bits.shape[1] > words
+
+    def jaccard(a, b):
+        return len(a & b) / len(a | b) if a | b else 0.0
+
+    for u in (101, 120):
+        best, scores = profiles.rank(u, 5)
+        expected = sorted((jaccard(skills[u], skills[v]) for v in user_ids.tolist() if v != u), reverse=True)[:5]
+        assert np.allclose(scores, expected)
+        assert np.allclose(scores, [jaccard(skills[u], skills[v]) for v in profiles.user_ids[best].tolist()])
+        best, scores = profiles.rank(u, 3, complementary=True)
+        union = [len(skills[u] | skills[v]) or 1 for v in profiles.user_ids[best].tolist()]
+        assert np.allclose(scores, [len(skills[v] - skills[u]) / n for v, n in zip(profiles.user_ids[best].tolist(), union)])
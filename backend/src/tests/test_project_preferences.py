@@ -0,0 +1,33 @@
+def test_student_in_two_courses_ranks_a_first_choice_in_each(api, post, course):
+    other = post("/api/courses/", {"semester_id": course["semester_id"], "crn": "10002", "displayName": "Databases"})
+    other_project = post("/api/projects/", {"course_id": other["id"], "title": "Other", "description": "d", "maxCapacity": 4})["id"]
+    user_id = course["user_ids"][0]
+    post("/api/user-courses/", {"user_id": user_id, "course_id": other["id"]})
+
+    post("/api/project-preferences/", {"user_id": user_id, "project_id": course["project_ids"][0], "rank": 1})
+    post("/api/project-preferences/", {"user_id": user_id, "project_id": other_project, "rank": 1})
+
+    ranks = api.get(f"/api/project-preferences/by-user/{user_id}").json()["data"]
+    assert sorted((p["project_id"], p["rank"]) for p in ranks) == [(course["project_ids"][0], 1), (other_project, 1)]
+
+def test_rank_is_unique_within_a_course(api, post, course):
+    user_id = course["user_ids"][0]
+    first, second = course["project_ids"]
+    post("/api/project-preferences/", {"user_id": user_id, "project_id": first, "rank": 1})
+
+    response = api.post("/api/project-preferences/", json={"user_id": user_id, "project_id": second, "rank": 1})
+    assert response.status_code == 409
+    assert "rank 1" in response.json()["error"]
+
+def test_project_is_ranked_once(api, post, course):
+    user_id = course["user_ids"][0]
+    project_id = course["project_ids"][0]
+    post("/api/project-preferences/", {"user_id": user_id, "project_id": project_id, "rank": 1})
+
+    response = api.post("/api/project-preferences/", json={"user_id": user_id, "project_id": project_id, "rank": 2})
+    assert response.status_code == 409
+
+def test_preference_for_missing_project_is_rejected(api, course):
+    response = api.post("/api/project-preferences/", json={"user_id": course["user_ids"][0], "project_id": 999, "rank": 1})
+    assert response.status_code == 409
+    assert "does not exist" in response.json()["error"]
@@ -0,0 +1,87 @@
+from src.config.database import SessionLocal
+from src.dependencies.dependencies import get_report_service
+from src.services.report_service import TEAM_ASSIGNMENT_COLUMNS, ReportService
+import csv
+import io
+import json
+import main
+
+def assign_team(post, course):
+    """Put both students on the first project, with skills for the first student."""
+    skills = [post("/api/skills/", {"name": name})["id"] for name in ("python", "sql")]
+    first, second = course["user_ids"]
+    for skill_id in skills:
+        post("/api/user-skills/", {"user_id": first, "skill_id": skill_id})
+    post("/api/project-users/", {"project_id": course["project_ids"][0], "user_id": first, "is_project_manager": True})
+    post("/api/project-users/", {"project_id": course["project_ids"][0], "user_id": second})
+
+def test_team_assignments_csv(api, post, course):
+    assign_team(post, course)
+    response = api.get("/api/reports/team-assignments")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="team-assignments.csv"'
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == TEAM_ASSIGNMENT_COLUMNS
+    assert [(row[7], row[8]) for row in rows[1:]] == [("student0", "True"), ("student1", "False")]
+    assert sorted(rows[1][9].split(";")) == ["python", "sql"]
+    assert rows[2][9] == ""
+
+def test_project_allocations_jsonl(api, post, course):
+    assign_team(post, course)
+    response = api.get("/api/reports/project-allocations", params={"format": "jsonl"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [(row["project_id"], row["n_assigned"], row["open_seats"]) for row in rows] == [
+        (course["project_ids"][0], 2, 2),
+        (course["project_ids"][1], 0, 4),
+    ]
+    assert sorted(rows[0]["members"].split(";")) == ["student0", "student1"]
+
+def test_reports_are_scoped(api, post, course):
+    assign_team(post, course)
+    other = post("/api/courses/", {"semester_id": course["semester_id"], "crn": "10002", "displayName": "Databases"})
+    post("/api/projects/", {"course_id": other["id"], "title": "Other", "description": "d", "maxCapacity": 4})
+
+    by_course = api.get("/api/reports/project-allocations", params={"format": "jsonl", "course_id": course["course_id"]})
+    assert by_course.headers["content-disposition"].endswith(f'-course-{course["course_id"]}.jsonl"')
+    assert {json.loads(line)["course_id"] for line in by_course.text.splitlines()} == {course["course_id"]}
+
+    by_semester = api.get("/api/reports/project-allocations", params={"format": "jsonl", "semester_id": course["semester_id"]})
+    assert by_semester.headers["content-disposition"].endswith(f'-semester-{course["semester_id"]}.jsonl"')
+    assert {json.loads(line)["course_id"] for line in by_semester.text.splitlines()} == {course["course_id"], other["id"]}
+
+    empty = api.get("/api/reports/team-assignments", params={"course_id": other["id"]})
+    assert list(csv.reader(io.StringIO(empty.text))) == [TEAM_ASSIGNMENT_COLUMNS]
+
+def test_unknown_format_is_rejected(api):
+    response = api.get("/api/reports/team-assignments", params={"format": "xlsx"})
+    assert response.status_code == 400
+    assert "Unknown report format" in response.json()["error"]
+
+def test_missing_scope_is_not_found(api):
+    assert api.get("/api/reports/team-assignments", params={"course_id": 999}).json()["error"] == "Course not found"
+    response = api.get("/api/reports/project-allocations", params={"semester_id": 999})
+    assert response.status_code == 404
+    assert response.json()["error"] == "Semester not found"
+
+def test_stream_closes_its_session(api, course):
+    db = SessionLocal()
+    closed = []
+    close = db.close
+
+    def tracked_close():
+        closed.append(True)
+        close()
+
+    db.close = tracked_close
+    # Not get_db, so the request itself never closes the session.
+    main.app.dependency_overrides[get_report_service] = lambda: ReportService(db)
+    try:
+        response = api.get("/api/reports/project-allocations")
+    finally:
+        main.app.dependency_overrides.clear()
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 3
+    assert closed
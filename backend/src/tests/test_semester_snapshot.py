@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+from src.config.database import SessionLocal
+from src.services.semester_snapshot_service import SemesterSnapshotService, notify_change
+import src.services.semester_snapshot_service as semester_snapshot_service
+
+def count_projects(api, course_id):
+    return api.get(f"/api/projects/count/by-course/{course_id}").json()["data"]["total_projects"]
+
+def track_loads(monkeypatch):
+    """Record the tables each snapshot load reads."""
+    loaded = []
+    load_table = SemesterSnapshotService._load_table
+
+    def tracked(self, table, semester_id):
+        loaded.append(table)
+        return load_table(self, table, semester_id)
+
+    monkeypatch.setattr(SemesterSnapshotService, "_load_table", tracked)
+    return loaded
+
+def test_write_marks_tables_stale_and_the_next_read_reloads_only_them(api, post, course, monkeypatch):
+    assert count_projects(api, course["course_id"]) == 2
+    assert semester_snapshot_service._snapshot.has_course(course["course_id"])
+    assert not semester_snapshot_service._stale
+
+    post("/api/projects/", {"course_id": course["course_id"], "title": "Third", "description": "d", "maxCapacity": 4})
+    assert set(semester_snapshot_service._stale) == {"projects", "project_users", "project_skills"}
+
+    loaded = track_loads(monkeypatch)
+    assert count_projects(api, course["course_id"]) == 3
+    assert loaded == ["projects", "project_users", "project_skills"]
+    assert not semester_snapshot_service._stale
+
+def test_change_made_while_loading_is_reloaded_on_the_next_read(api, course, monkeypatch):
+    db = SessionLocal()
+    try:
+        SemesterSnapshotService(db).get_snapshot()
+        notify_change("project_skills")
+        load_table = SemesterSnapshotService._load_table
+
+        def racing(self, table, semester_id):
+            # Another request writes a table that this load has already read.
+            if table == "project_skills":
+                notify_change("project_users")
+            return load_table(self, table, semester_id)
+
+        monkeypatch.setattr(SemesterSnapshotService, "_load_table", racing)
+        SemesterSnapshotService(db).get_snapshot()
+        assert set(semester_snapshot_service._stale) == {"project_users"}
+
+        loaded = track_loads(monkeypatch)
+        SemesterSnapshotService(db).get_snapshot()
+        assert loaded == ["project_users"]
+        assert not semester_snapshot_service._stale
+    finally:
+        db.close()
+
+def test_moving_a_course_out_of_the_semester_leaves_the_snapshot(api, post, course):
+    now = datetime.now()
+    past = post("/api/semesters/", {
+        "displayName": "Past",
+        "semesterStartDate": (now - timedelta(days=400)).isoformat(),
+        "semesterEndDate": (now - timedelta(days=300)).isoformat(),
+    })
+    assert count_projects(api, course["course_id"]) == 2
+    assert api.get(f"/api/user-courses/count/by-course/{course['course_id']}").json()["data"]["total_user_courses"] == 2
+
+    response = api.put(f"/api/courses/{course['course_id']}", json={"semester_id": past["id"], "crn": "10001", "displayName": "Capstone"})
+    assert response.status_code == 200
+
+    # Counted by SQL now that the course is out of scope.
+    assert count_projects(api, course["course_id"]) == 2
+    snapshot = semester_snapshot_service._snapshot
+    assert not snapshot.has_course(course["course_id"])
+    assert snapshot.semester_id == course["semester_id"]
+    assert {name: len(rows) for name, rows in snapshot.tables.items()} == {
+        "courses": 0, "projects": 0, "user_courses": 0, "project_users": 0, "project_skills": 0,
+    }
+    assert api.get(f"/api/courses/by-semester/{course['semester_id']}/count").json()["data"]["total_courses"] == 0
@@ -0,0 +1,23 @@
+import json
+import pytest
+import src.core.streaming as streaming
+
+def test_streamed_empty_table_is_an_empty_envelope(api):
+    response = api.get("/api/skills/", params={"all": "true"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"success": True, "data": [], "error": None}
+    assert response.json() == api.get("/api/skills/").json()
+
+@pytest.mark.parametrize("n_rows", [3, 7])
+def test_streamed_list_matches_the_paged_list(api, monkeypatch, n_rows):
+    # A small batch size, so one full batch and then several with a partial last one are streamed.
+    monkeypatch.setattr(streaming, "STREAM_BATCH_SIZE", 3)
+    response = api.post("/api/skills/bulk", json=[{"name": f"skill{i}"} for i in range(n_rows)])
+    assert response.status_code == 201
+
+    streamed = api.get("/api/skills/", params={"all": "true"})
+    paged = api.get("/api/skills/", params={"limit": 100})
+    assert json.loads(streamed.content) == paged.json()
+    assert streamed.content == paged.content
+    assert [skill["name"] for skill in streamed.json()["data"]] == [f"skill{i}" for i in range(n_rows)]
@@ -37,7 +37,7 @@ export default function CoursesSettings() {
       setLoading(true);
       setError(null);
       
-      const response = await courseService.getCourses(0, 100);
+      const response = await courseService.getAllCourses();
       
       if (response.success) {
         const coursesData = response.data || [];
@@ -70,7 +70,7 @@ export default function CoursesSettings() {
 
   const fetchUsers = async () => {
     try {
-      const response = await userService.listUsers({ skip: 0, limit: 100 });
+      const response = await userService.listAllUsers();
       if (response.success) {
         setUsers(response.data || []);
       }
@@ -41,7 +41,7 @@ export default function ProjectsSettings() {
       setError(null);
       
 
-      const response = await projectService.getProjects(0, 100);
+      const response = await projectService.getAllProjects();
       
       if (response.success) {
         const projectsData = response.data.items || response.data || [];
@@ -84,7 +84,7 @@ export default function ProjectsSettings() {
 
   const fetchUsers = async () => {
     try {
-      const response = await userService.listUsers({ skip: 0, limit: 100 });
+      const response = await userService.listAllUsers();
       if (response.success) {
         setAllUsers(response.data || []);
       }
@@ -95,7 +95,7 @@ export default function ProjectsSettings() {
 
   const fetchCourses = async () => {
     try {
-      const response = await courseService.getCourses(0, 100);
+      const response = await courseService.getAllCourses();
       if (response.success) {
         setAllCourses(response.data || []);
       }
@@ -106,7 +106,7 @@ export default function ProjectsSettings() {
 
   const fetchSkills = async () => {
     try {
-      const response = await skillService.getSkills(0, 100);
+      const response = await skillService.getAllSkills();
       if (response.success) {
         setAllSkills(response.data || []);
       }
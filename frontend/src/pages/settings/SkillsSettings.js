@@ -32,7 +32,7 @@ export default function SkillsSettings() {
       setLoading(true);
       setError(null);
       
-      const response = await skillService.getSkills(0, 100);
+      const response = await skillService.getAllSkills();
       
       if (response.success) {
         const skillsData = response.data || [];
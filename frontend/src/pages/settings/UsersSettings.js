@@ -34,12 +34,7 @@ export default function UsersSettings() {
       setLoading(true);
       setError(null);
       
-      const params = {
-        page: 1, // Get all users
-        page_size: 1000, // Large number to get all users
-      };
-
-      const response = await userService.listUsers(params);
+      const response = await userService.listAllUsers();
       
       if (response.success) {
         const usersData = response.data.items || response.data || [];
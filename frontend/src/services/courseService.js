@@ -36,6 +36,19 @@ class CourseService {
     }
   }
 
+  // Get every course in one streamed response
+  async getAllCourses() {
+    try {
+      const response = await apiClient.get(API_COURSES, {
+        params: { all: true }
+      });
+      return response.data;
+    } catch (error) {
+      console.error('Error fetching all courses:', error);
+      throw error;
+    }
+  }
+
   // Get course by ID
   async getCourseById(courseId) {
     try {
@@ -38,6 +38,19 @@ class ProjectService {
     }
   }
 
+  // Get every project in one streamed response
+  async getAllProjects() {
+    try {
+      const response = await apiClient.get(API_PROJECTS, {
+        params: { all: true }
+      });
+      return response.data;
+    } catch (error) {
+      console.error('Error fetching all projects:', error);
+      throw error;
+    }
+  }
+
   // Get project by ID
   async getProjectById(projectId) {
     try {
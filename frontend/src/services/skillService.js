@@ -48,6 +48,19 @@ class SkillService {
     }
   }
 
+  // Get every skill in one streamed response
+  async getAllSkills() {
+    try {
+      const response = await apiClient.get(API_SKILLS, {
+        params: { all: true }
+      });
+      return response.data;
+    } catch (error) {
+      console.error('Error fetching all skills:', error);
+      throw error;
+    }
+  }
+
   // Get skill by ID
   async getSkillById(skillId) {
     try {
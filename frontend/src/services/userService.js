@@ -16,6 +16,8 @@ const userService = {
     apiClient.post(API_USERS + "/", userData).then(res => res.data),
   listUsers: (params) =>
     apiClient.get(API_USERS + "/", { params }).then(res => res.data),
+  listAllUsers: () =>
+    apiClient.get(API_USERS + "/", { params: { all: true } }).then(res => res.data),
   getUsersCount: () =>
     apiClient.get(API_USERS_COUNT).then(res => res.data),
   searchUsers: (q, params = {}) =>